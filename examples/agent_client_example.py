@@ -7,6 +7,8 @@ This script demonstrates how to connect an agent to a centralized network using
 
 import asyncio
 import logging
+import signal
+import sys
 from openagents.core.client import AgentClient
 from openagents.models.messages import DirectMessage, BroadcastMessage
 
@@ -76,13 +78,24 @@ async def main():
         await client.send_broadcast_message(broadcast_msg)
         print("Broadcast message sent!")
         
-        # Wait for messages (keeps the agent running)
+        # Wait for messages (keeps the agent running) until Ctrl+C or SIGTERM;
+        # the loop stays idle instead of waking up to poll
         print("Agent is running. Press Ctrl+C to stop...")
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        handled_signals = []
+        if sys.platform != 'win32':
+            for sig in [signal.SIGTERM, signal.SIGINT]:
+                loop.add_signal_handler(sig, stop_event.set)
+                handled_signals.append(sig)
         try:
-            while True:
-                await asyncio.sleep(1)
+            await stop_event.wait()
         except KeyboardInterrupt:
-            print("\nShutting down agent...")
+            pass
+        finally:
+            for sig in handled_signals:
+                loop.remove_signal_handler(sig)
+        print("\nShutting down agent...")
         
     except Exception as e:
         logger.error(f"Error: {e}")
@@ -118,4 +131,12 @@ async def handle_broadcast_message(message_data):
 
 
 if __name__ == "__main__":
+    # Use uvloop when available for lower socket overhead
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
     asyncio.run(main()) 
\ No newline at end of file
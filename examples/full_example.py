@@ -356,21 +356,25 @@ async def cleanup():
     
     print("\n🧹 [Cleanup] Shutting down all components...")
     
-    # Stop echo agent
-    if echo_agent and echo_agent._running:
-        try:
-            await echo_agent.async_stop()
-            print("✅ [Cleanup] Echo agent stopped")
-        except Exception as e:
-            print(f"⚠️ [Cleanup] Error stopping echo agent: {e}")
+    async def stop_echo_agent():
+        if echo_agent and echo_agent._running:
+            try:
+                await echo_agent.async_stop()
+                print("✅ [Cleanup] Echo agent stopped")
+            except Exception as e:
+                print(f"⚠️ [Cleanup] Error stopping echo agent: {e}")
     
-    # Disconnect client
-    if client:
-        try:
-            await client.disconnect()
-            print("✅ [Cleanup] Client disconnected")
-        except Exception as e:
-            print(f"⚠️ [Cleanup] Error disconnecting client: {e}")
+    async def disconnect_client():
+        if client:
+            try:
+                await client.disconnect()
+                print("✅ [Cleanup] Client disconnected")
+            except Exception as e:
+                print(f"⚠️ [Cleanup] Error disconnecting client: {e}")
+    
+    # Stop the echo agent (which sends its goodbye broadcast) and disconnect
+    # the client concurrently; both are independent of each other
+    await asyncio.gather(stop_echo_agent(), disconnect_client())
     
     # Shutdown network
     if network and network.is_running:
@@ -7,6 +7,9 @@ from openagents.models.messages import DirectMessage
 # Global variable to store received messages
 received_messages = []
 
+# Set once the first response arrives (created inside the running loop)
+response_received = None
+
 async def handle_direct_message(message_data):
     """Handle incoming direct messages"""
     if hasattr(message_data, 'sender_id'):
@@ -20,8 +23,12 @@ async def handle_direct_message(message_data):
     
     print(f"📨 Received response from {sender_id}: {text}")
     received_messages.append({"from": sender_id, "text": text})
+    response_received.set()
 
 async def main():
+    global response_received
+    response_received = asyncio.Event()
+    
     # Start network
     network = AgentNetwork.load("examples/centralized_network_config.yaml")
     await network.initialize()
@@ -45,7 +52,10 @@ async def main():
     print("📤 Sent: Hello!")
     
     # Wait for response
-    await asyncio.sleep(2)
+    try:
+        await asyncio.wait_for(response_received.wait(), timeout=5)
+    except asyncio.TimeoutError:
+        print("⚠️ No response within 5 seconds")
     
     # Display results
     print(f"\n📊 Received {len(received_messages)} responses:")
@@ -16,15 +16,32 @@ from openagents.core.network import AgentNetwork, create_network
 from openagents.models.network_config import NetworkConfig, NetworkMode
 from openagents.mods.communication.shared_document import SharedDocumentNetworkMod
 
+# Seconds to wait for the network mod to acknowledge a step before failing the demo
+EVENT_TIMEOUT = 10.0
+
 
 class SharedDocumentDemo:
     """Demo orchestrator for shared document collaboration."""
     
     def __init__(self):
         self.network_manager = None
+        self.network_mod = None
         self.agents = {}
         self.demo_document_id = None
         
+    async def _wait_for_event(self, event: asyncio.Event, description: str):
+        """Wait for a network mod event, failing the demo if it never arrives."""
+        try:
+            await asyncio.wait_for(event.wait(), EVENT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Timed out after {EVENT_TIMEOUT}s waiting for {description}")
+    
+    async def _wait_for_operation(self, result: Dict[str, Any], description: str):
+        """Wait for the network mod to respond to an operation an agent sent."""
+        if result.get("status") != "success":
+            raise RuntimeError(f"Failed to send {description}: {result.get('message')}")
+        await self._wait_for_event(self.network_mod.operation_completed(result["operation_id"]), description)
+    
     async def setup_network(self):
         """Set up the network and agents."""
         print("🚀 Setting up shared document collaboration network...")
@@ -35,34 +52,23 @@ class SharedDocumentDemo:
         
         # Start the network
         await self.network_manager.start()
+        self.network_mod = self.network_manager.mods["shared_document"]
         print("✅ Network started successfully")
-        
-        # Allow time for network to initialize
-        await asyncio.sleep(2)
     
     async def create_agents(self):
         """Create and register demo agents."""
         print("👥 Creating demonstration agents...")
         
-        # Create editor agent
-        editor_config = Path(__file__).parent / "editor_agent.yaml"
-        self.agents["editor"] = SimpleAgent(str(editor_config))
-        await self.agents["editor"].start()
+        config_dir = Path(__file__).parent
+        self.agents["editor"] = SimpleAgent(str(config_dir / "editor_agent.yaml"))
+        self.agents["reviewer"] = SimpleAgent(str(config_dir / "reviewer_agent.yaml"))
+        self.agents["collaborator"] = SimpleAgent(str(config_dir / "collaborator_agent.yaml"))
         
-        # Create reviewer agent  
-        reviewer_config = Path(__file__).parent / "reviewer_agent.yaml"
-        self.agents["reviewer"] = SimpleAgent(str(reviewer_config))
-        await self.agents["reviewer"].start()
-        
-        # Create collaborator agent
-        collaborator_config = Path(__file__).parent / "collaborator_agent.yaml"
-        self.agents["collaborator"] = SimpleAgent(str(collaborator_config))
-        await self.agents["collaborator"].start()
+        # Start all agents concurrently; start() returns once the network has
+        # acknowledged registration, so no extra wait is needed afterwards
+        await asyncio.gather(*(agent.start() for agent in self.agents.values()))
         
         print("✅ All agents created and started")
-        
-        # Allow time for agents to register
-        await asyncio.sleep(3)
     
     async def demo_document_creation(self):
         """Demonstrate document creation."""
@@ -98,11 +104,15 @@ TBD - needs resource planning"""
         
         print(f"Document creation result: {result}")
         
-        # Note: In a real implementation, we'd get the document ID from the response
-        # For this demo, we'll simulate it
-        self.demo_document_id = "demo-doc-123"
-        
-        await asyncio.sleep(2)
+        # Wait until the network mod has stored the document, then take its generated ID
+        await self._wait_for_event(self.network_mod.document_created("Project Requirements"), "document creation")
+        self.demo_document_id = next((
+            document_id for document_id, document in self.network_mod.documents.items()
+            if document.name == "Project Requirements"
+        ), None)
+        if self.demo_document_id is None:
+            raise RuntimeError("Network mod has no 'Project Requirements' document")
+        print(f"Created document {self.demo_document_id}")
     
     async def demo_collaborative_editing(self):
         """Demonstrate collaborative editing."""
@@ -114,47 +124,65 @@ TBD - needs resource planning"""
         
         # Open document for editing
         print("Agents opening document...")
-        await editor.open_document(self.demo_document_id)
-        await collaborator.open_document(self.demo_document_id)
-        
-        # Editor updates the scope section
-        print("Editor updating scope section...")
-        await editor.replace_lines(
-            document_id=self.demo_document_id,
-            start_line=5,
-            end_line=5,
-            content=["Define the core features and functionality needed for the MVP"]
+        await asyncio.gather(
+            editor.open_document(self.demo_document_id),
+            collaborator.open_document(self.demo_document_id)
+        )
+        await asyncio.gather(
+            self._wait_for_event(
+                self.network_mod.document_opened(self.demo_document_id, "editor_agent"),
+                "the editor to open the document"
+            ),
+            self._wait_for_event(
+                self.network_mod.document_opened(self.demo_document_id, "collaborator_agent"),
+                "the collaborator to open the document"
+            )
         )
         
-        # Collaborator adds timeline details
-        print("Collaborator adding timeline details...")
-        await collaborator.replace_lines(
+        # Editor fills in the scope and resource sections in one batch.
+        # Edits are listed bottom-up so earlier line numbers are not shifted.
+        print("Editor updating scope and resource sections...")
+        result = await editor.replace_lines_bulk(
             document_id=self.demo_document_id,
-            start_line=8,
-            end_line=8,
-            content=[
-                "Phase 1: Requirements gathering (2 weeks)",
-                "Phase 2: Design and planning (3 weeks)", 
-                "Phase 3: Development (8 weeks)",
-                "Phase 4: Testing and deployment (2 weeks)"
+            edits=[
+                {
+                    "start_line": 13,
+                    "end_line": 13,
+                    "content": [
+                        "Development team: 3 engineers",
+                        "Design team: 1 designer",
+                        "Product team: 1 product manager",
+                        "QA team: 1 QA engineer"
+                    ]
+                },
+                {
+                    "start_line": 7,
+                    "end_line": 7,
+                    "content": ["Define the core features and functionality needed for the MVP"]
+                }
             ]
         )
+        await self._wait_for_operation(result, "the editor's section updates")
         
-        # Editor adds resource information
-        print("Editor adding resource information...")
-        await editor.replace_lines(
+        # Collaborator adds timeline details once the editor's lines are in
+        # place, as a single-edit batch so its response can be awaited
+        print("Collaborator adding timeline details...")
+        result = await collaborator.replace_lines_bulk(
             document_id=self.demo_document_id,
-            start_line=11,
-            end_line=11,
-            content=[
-                "Development team: 3 engineers",
-                "Design team: 1 designer",
-                "Product team: 1 product manager",
-                "QA team: 1 QA engineer"
+            edits=[
+                {
+                    "start_line": 10,
+                    "end_line": 10,
+                    "content": [
+                        "Phase 1: Requirements gathering (2 weeks)",
+                        "Phase 2: Design and planning (3 weeks)",
+                        "Phase 3: Development (8 weeks)",
+                        "Phase 4: Testing and deployment (2 weeks)"
+                    ]
+                }
             ]
         )
-        
-        await asyncio.sleep(2)
+        await self._wait_for_operation(result, "the collaborator's timeline update")
     
     async def demo_commenting_and_review(self):
         """Demonstrate commenting and review functionality."""
@@ -166,35 +194,23 @@ TBD - needs resource planning"""
         # Reviewer opens document
         print("Reviewer opening document for review...")
         await reviewer.open_document(self.demo_document_id)
-        
-        # Add review comments
-        print("Reviewer adding feedback comments...")
-        
-        await reviewer.add_comment(
-            document_id=self.demo_document_id,
-            line_number=3,
-            comment_text="Consider adding a more detailed project description here"
+        await self._wait_for_event(
+            self.network_mod.document_opened(self.demo_document_id, "reviewer_agent"),
+            "the reviewer to open the document"
         )
         
-        await reviewer.add_comment(
-            document_id=self.demo_document_id,
-            line_number=6,
-            comment_text="Good scope definition. Should we also define what's out of scope?"
-        )
-        
-        await reviewer.add_comment(
-            document_id=self.demo_document_id,
-            line_number=10,
-            comment_text="Timeline looks reasonable. Consider adding buffer time for each phase."
-        )
-        
-        await reviewer.add_comment(
+        # Add review comments in a single request
+        print("Reviewer adding feedback comments...")
+        result = await reviewer.add_comments(
             document_id=self.demo_document_id,
-            line_number=15,
-            comment_text="Resource allocation looks good. Do we have these team members confirmed?"
+            comments=[
+                {"line_number": 3, "comment_text": "Consider adding a more detailed project description here"},
+                {"line_number": 6, "comment_text": "Good scope definition. Should we also define what's out of scope?"},
+                {"line_number": 10, "comment_text": "Timeline looks reasonable. Consider adding buffer time for each phase."},
+                {"line_number": 15, "comment_text": "Resource allocation looks good. Do we have these team members confirmed?"}
+            ]
         )
-        
-        await asyncio.sleep(2)
+        await self._wait_for_operation(result, "the review comments")
     
     async def demo_presence_tracking(self):
         """Demonstrate agent presence tracking."""
@@ -223,8 +239,6 @@ TBD - needs resource planning"""
         print("Checking agent presence...")
         presence_result = await editor.get_agent_presence(self.demo_document_id)
         print(f"Agent presence: {presence_result}")
-        
-        await asyncio.sleep(2)
     
     async def demo_document_management(self):
         """Demonstrate document management features."""
@@ -233,14 +247,13 @@ TBD - needs resource planning"""
         
         editor = self.agents["editor"]
         
-        # Get document content
+        # Stream document content page by page
         print("Getting current document content...")
-        content_result = await editor.get_document_content(
-            document_id=self.demo_document_id,
-            include_comments=True,
-            include_presence=True
-        )
-        print(f"Document content result: {content_result}")
+        async for page in editor.iter_document_content(self.demo_document_id, chunk_lines=8):
+            print(f"Lines {page['offset'] + 1}-{page['offset'] + len(page['lines'])} of {page['total_lines']}: "
+                  f"{len(page['comments'])} comments")
+            for line in page["lines"]:
+                print(f"  {line}")
         
         # Get document history
         print("Getting document operation history...")
@@ -254,8 +267,6 @@ TBD - needs resource planning"""
         print("Listing all available documents...")
         list_result = await editor.list_documents(include_closed=False)
         print(f"Document list result: {list_result}")
-        
-        await asyncio.sleep(2)
     
     async def run_demo(self):
         """Run the complete demo."""
@@ -287,20 +298,18 @@ TBD - needs resource planning"""
         """Clean up resources."""
         print("\n🧹 Cleaning up...")
         
-        # Close documents
+        # Close documents (errors are ignored, as for the other cleanup steps)
         if self.demo_document_id and self.agents:
-            for agent in self.agents.values():
-                try:
-                    await agent.close_document(self.demo_document_id)
-                except:
-                    pass
+            await asyncio.gather(
+                *(agent.close_document(self.demo_document_id) for agent in self.agents.values()),
+                return_exceptions=True
+            )
         
         # Stop agents
-        for agent in self.agents.values():
-            try:
-                await agent.stop()
-            except:
-                pass
+        await asyncio.gather(
+            *(agent.stop() for agent in self.agents.values()),
+            return_exceptions=True
+        )
         
         # Stop network
         if self.network_manager:
@@ -322,5 +331,12 @@ if __name__ == "__main__":
     # Set up event loop for Windows compatibility
     if hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        # Use uvloop when available for lower socket overhead
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
     
     asyncio.run(main())
@@ -7,9 +7,10 @@ with a simplified setup that doesn't require full network infrastructure.
 """
 
 import asyncio
+import sys
 import uuid
 from datetime import datetime
-from unittest.mock import Mock, AsyncMock
+from types import SimpleNamespace
 
 from openagents.mods.communication.shared_document import (
     SharedDocumentNetworkMod,
@@ -23,6 +24,11 @@ from openagents.mods.communication.shared_document import (
 )
 
 
+async def _noop(*args, **kwargs):
+    """Stand-in for network sends; the demo has no real network."""
+    return None
+
+
 class SimpleSharedDocumentDemo:
     """Simplified demo for shared document functionality."""
     
@@ -37,11 +43,9 @@ class SimpleSharedDocumentDemo:
         # Create network mod
         self.network_mod = SharedDocumentNetworkMod()
         
-        # Mock network
-        mock_network = Mock()
-        mock_network.node_id = "demo_network"
-        mock_network.send_message = AsyncMock()
-        self.network_mod.bind_network(mock_network)
+        # Stub network
+        stub_network = SimpleNamespace(network_id="demo_network", node_id="demo_network", send_message=_noop)
+        self.network_mod.bind_network(stub_network)
         
         # Initialize
         self.network_mod.initialize()
@@ -50,8 +54,7 @@ class SimpleSharedDocumentDemo:
         for agent_id in ["editor", "reviewer", "collaborator"]:
             adapter = SharedDocumentAgentAdapter()
             adapter.bind_agent(agent_id)
-            adapter.network_interface = Mock()
-            adapter.network_interface.send_mod_message = AsyncMock()
+            adapter.network_interface = SimpleNamespace(send_mod_message=_noop)
             self.adapters[agent_id] = adapter
         
         print("✅ Demo setup complete!")
@@ -73,10 +76,7 @@ class SimpleSharedDocumentDemo:
         )
         
         print("📄 Editor creating document: 'Project Requirements'")
-        await self.network_mod._handle_create_document(create_msg, "editor")
-        
-        # Get the created document
-        doc_id = list(self.network_mod.documents.keys())[0]
+        doc_id = await self.network_mod._handle_create_document(create_msg, "editor")
         document = self.network_mod.documents[doc_id]
         
         print(f"✅ Document created with ID: {doc_id[:8]}...")
@@ -160,7 +160,7 @@ class SimpleSharedDocumentDemo:
             await self.network_mod._handle_add_comment(comment_msg, agent)
             print(f"💭 {agent} commented on line {line_num}: \"{comment_text}\"")
         
-        print(f"\n📝 Total comments: {sum(len(comments) for comments in document.comments.values())}")
+        print(f"\n📝 Total comments: {len(document.comment_line)}")
         
     async def demo_presence_tracking(self, doc_id):
         """Demo agent presence tracking."""
@@ -199,20 +199,19 @@ class SimpleSharedDocumentDemo:
         print(f"📄 Document: {document.name}")
         print(f"🔢 Version: {document.version}")
         print(f"👥 Active agents: {len(document.active_agents)}")
-        print(f"💬 Total comments: {sum(len(comments) for comments in document.comments.values())}")
+        print(f"💬 Total comments: {len(document.comment_line)}")
         print(f"📏 Lines of content: {len(document.content)}")
         
         print(f"\n📖 Final content:")
         for i, line in enumerate(document.content, 1):
-            comments_on_line = document.comments.get(i, [])
+            comments_on_line = document.comments_on_line(i)
             comment_indicator = f" 💬({len(comments_on_line)})" if comments_on_line else ""
             print(f"   {i:2}: {line}{comment_indicator}")
         
-        if document.comments:
+        if document.comment_count:
             print(f"\n💬 Comments summary:")
-            for line_num, comments in document.comments.items():
-                for comment in comments:
-                    print(f"   Line {line_num}: {comment.agent_id} - \"{comment.comment_text}\"")
+            for line_num, agent_id, comment_text in zip(document.comment_line, document.comment_agent, document.comment_text):
+                print(f"   Line {line_num}: {agent_id} - \"{comment_text}\"")
     
     async def run_demo(self):
         """Run the complete demo."""
@@ -250,4 +249,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop when available for lower socket overhead
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
     asyncio.run(main())
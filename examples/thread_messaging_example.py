@@ -2,24 +2,36 @@
 """
 Example demonstrating the Thread Messaging mod for OpenAgents.
 
-This example shows how to use Discord/Slack-like threading features including:
+This example shows how to use Reddit-like threading features including:
 - Replying to messages to create threads
 - Quoting messages for context
 - Adding reactions to messages
-- Sending files in threaded conversations
+- Sharing uploaded files in threaded conversations
+
+The network must load the thread messaging mod, for example:
+  openagents launch-network examples/thread_messaging_network/network_config.yaml
 """
 
 import asyncio
 import logging
+from collections import deque
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from openagents.core.client import AgentClient
-from openagents.mods.communication.thread_messaging import ThreadMessagingAgentAdapter
+from openagents.mods.communication.thread_messaging import REACTION_TYPES, ThreadMessagingAgentAdapter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Reaction type listing for the reactions demo, built once
+_REACTION_LIST = "\n".join(f"  - {reaction}" for reaction in REACTION_TYPES)
+
+# Handler actions that carry retrieved messages, and their error counterparts
+_RETRIEVAL_ACTIONS = frozenset({"channel_messages_retrieved", "direct_messages_retrieved"})
+_RETRIEVAL_ERROR_ACTIONS = frozenset({"channel_messages_retrieval_error", "direct_messages_retrieval_error"})
+
 
 class ThreadMessagingExampleAgent:
     """Example agent demonstrating thread messaging capabilities."""
@@ -35,57 +47,72 @@ class ThreadMessagingExampleAgent:
         # Register handlers
         self._setup_handlers()
         
-        # Track messages for demo purposes
-        self.received_messages = []
-        self.received_reactions = []
+        # Track recent messages for demo purposes (bounded so long runs don't grow without limit)
+        self.received_messages = deque(maxlen=1024)
+        self.received_reactions = deque(maxlen=1024)
+        self.retrieved_messages: List[Dict[str, Any]] = []
+        self.uploaded_file_ids: List[str] = []
+        
+        # Set by the handlers so the demo can wait for responses instead of sleeping
+        self._events = {kind: asyncio.Event() for kind in ("retrieval", "reaction", "channels", "upload")}
     
     def _setup_handlers(self):
-        """Set up message and reaction handlers."""
+        """Set up message and file handlers."""
         
         def message_handler(content, sender_id):
-            """Handle incoming messages."""
-            message_info = {
-                'sender': sender_id,
-                'text': content.get('text', ''),
-                'reply_to': content.get('reply_to_id'),
-                'quoted': content.get('quoted_text'),
-                'files': content.get('files', [])
-            }
-            self.received_messages.append(message_info)
+            """Handle incoming messages and network responses."""
+            action = content.get('action')
             
-            logger.info(f"[{self.agent_id}] Received message from {sender_id}: {content.get('text', '')}")
+            if action in _RETRIEVAL_ACTIONS:
+                self.retrieved_messages = content.get('messages') or []
+                self._events["retrieval"].set()
             
-            if content.get('reply_to_id'):
-                logger.info(f"[{self.agent_id}] This is a reply to: {content['reply_to_id']}")
+            elif action in _RETRIEVAL_ERROR_ACTIONS:
+                logger.error("[%s] Message retrieval failed: %s", self.agent_id, content.get('error'))
+                self.retrieved_messages = []
+                self._events["retrieval"].set()
             
-            if content.get('quoted_text'):
-                logger.info(f"[{self.agent_id}] Quoted: '{content['quoted_text']}'")
+            elif action == "reaction_notification":
+                reaction_info = {
+                    'message_id': content.get('target_message_id'),
+                    'from_agent': content.get('reacting_agent'),
+                    'reaction': content.get('reaction_type'),
+                    'action': content.get('action_taken')
+                }
+                self.received_reactions.append(reaction_info)
+                self._events["reaction"].set()
+                
+                logger.info("[%s] %s reacted with %s to message %s", self.agent_id,
+                            reaction_info['from_agent'], reaction_info['reaction'], reaction_info['message_id'])
             
-            if content.get('files'):
-                logger.info(f"[{self.agent_id}] Has {len(content['files'])} file(s)")
-        
-        def reaction_handler(message_id, agent_id, reaction_type, action):
-            """Handle incoming reactions."""
-            reaction_info = {
-                'message_id': message_id,
-                'from_agent': agent_id,
-                'reaction': reaction_type,
-                'action': action
-            }
-            self.received_reactions.append(reaction_info)
+            elif action in ("channels_listed", "channels_list_error"):
+                if logger.isEnabledFor(logging.INFO):
+                    names = [channel.get('name') for channel in content.get('channels', [])]
+                    logger.info("[%s] Channels: %s", self.agent_id, names)
+                self._events["channels"].set()
             
-            logger.info(f"[{self.agent_id}] {agent_id} reacted with {reaction_type} to message {message_id}")
+            elif content.get('text'):
+                self.received_messages.append({'sender': sender_id, 'text': content['text']})
+                
+                # Arguments are formatted only if the record is emitted
+                logger.info("[%s] Received message from %s: %s", self.agent_id, sender_id, content['text'])
         
-        def file_handler(file_id, file_content, metadata, sender_id):
-            """Handle incoming files."""
-            logger.info(f"[{self.agent_id}] Received file {file_id} from {sender_id} ({len(file_content)} bytes)")
+        def file_handler(file_id, filename, file_info):
+            """Handle file operation results."""
+            if file_info.get('action') != "upload":
+                return
+            if file_info.get('success'):
+                self.uploaded_file_ids.append(file_id)
+                logger.info("[%s] Uploaded %s as %s", self.agent_id, filename, file_id)
+            else:
+                logger.error("[%s] Upload failed: %s", self.agent_id, file_info.get('error'))
+            self._events["upload"].set()
         
         # Register handlers
         self.thread_adapter.register_message_handler("main", message_handler)
-        self.thread_adapter.register_reaction_handler("main", reaction_handler)
         self.thread_adapter.register_file_handler("main", file_handler)
     
-    async def connect(self, host="localhost", port=8000):
+    async def connect(self, host="localhost", port=8571):
         """Connect to the network."""
         success = await self.client.connect_to_server(host=host, port=port)
         if success:
@@ -96,6 +123,59 @@ class ThreadMessagingExampleAgent:
         """Disconnect from the network."""
         await self.client.disconnect()
         logger.info(f"[{self.agent_id}] Disconnected from network")
+    
+    async def wait_for(self, kind: str, timeout: float = 2.0) -> bool:
+        """Wait until a response of the given kind arrives, or the timeout passes."""
+        event = self._events[kind]
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.info(f"[{self.agent_id}] No {kind} response within {timeout}s")
+            return False
+        finally:
+            event.clear()
+    
+    async def find_message(self, sender_id: str, text: str, channel: Optional[str] = None,
+                           attempts: int = 3) -> Optional[Dict[str, Any]]:
+        """Retrieve a message by its sender and text, from a channel or our direct conversation.
+        
+        The network stores messages as they arrive, so the lookup is retried a
+        few times in case the message has not been processed yet.
+        
+        Args:
+            sender_id: ID of the agent that sent the message
+            text: Text of the message
+            channel: Channel to search; searches direct messages if not given
+            attempts: Number of retrievals before giving up
+        
+        Returns:
+            Optional[Dict[str, Any]]: The message data, or None if it was not found
+        """
+        for _ in range(attempts):
+            if channel:
+                await self.thread_adapter.retrieve_channel_messages(channel=channel)
+            else:
+                await self.thread_adapter.retrieve_direct_messages(target_agent_id=sender_id)
+            await self.wait_for("retrieval")
+            
+            message = next((
+                msg for msg in self.retrieved_messages
+                if msg.get('sender_id') == sender_id and (msg.get('content') or {}).get('text') == text
+            ), None)
+            if message:
+                return message
+        
+        logger.info(f"[{self.agent_id}] Message from {sender_id} not found: {text}")
+        return None
+
+
+def _remove_file(path: Path) -> None:
+    """Delete a file if it exists."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
 
 
 async def demonstrate_threading():
@@ -106,163 +186,132 @@ async def demonstrate_threading():
     bob = ThreadMessagingExampleAgent("Bob")
     
     try:
-        # Connect both agents (assuming network is running)
+        # Connect both agents concurrently (assuming network is running);
+        # the finally block disconnects whichever of them connected
         logger.info("Connecting agents to network...")
-        await alice.connect()
-        await bob.connect()
-        
-        # Give time for connections to establish
-        await asyncio.sleep(1)
+        if not all(await asyncio.gather(alice.connect(), bob.connect())):
+            raise RuntimeError("Could not connect both agents")
         
         # Scenario 1: Basic threading
         logger.info("\n=== Scenario 1: Basic Threading ===")
         
         # Alice sends an initial message
-        await alice.thread_adapter.send_thread_message(
-            target_agent_id="Bob",
-            content={"text": "Hey Bob, what do you think about implementing a new feature?"}
-        )
-        await asyncio.sleep(0.5)
+        text = "Hey Bob, what do you think about implementing a new feature?"
+        await alice.thread_adapter.send_direct_message(target_agent_id="Bob", text=text)
+        original = await bob.find_message("Alice", text)
+        if original is None:
+            raise RuntimeError("Bob did not find Alice's message")
         
         # Bob replies, creating a thread
-        if alice.received_messages:
-            original_message_id = alice.received_messages[-1].get('message_id', 'msg_1')
-            await bob.thread_adapter.reply_to_message(
-                target_agent_id="Alice",
-                text="Great idea! What kind of feature are you thinking?",
-                reply_to_id=original_message_id
-            )
-        await asyncio.sleep(0.5)
+        text = "Great idea! What kind of feature are you thinking?"
+        await bob.thread_adapter.reply_direct_message(
+            target_agent_id="Alice",
+            reply_to_id=original['message_id'],
+            text=text
+        )
+        bob_reply = await alice.find_message("Bob", text)
+        if bob_reply is None:
+            raise RuntimeError("Alice did not find Bob's reply")
         
         # Alice replies back in the thread
-        if bob.received_messages:
-            await alice.thread_adapter.reply_to_message(
-                target_agent_id="Bob", 
-                text="I was thinking about a chat threading system, like Slack!",
-                reply_to_id=original_message_id
-            )
-        await asyncio.sleep(0.5)
+        await alice.thread_adapter.reply_direct_message(
+            target_agent_id="Bob",
+            reply_to_id=bob_reply['message_id'],
+            text="I was thinking about a chat threading system, like Reddit!"
+        )
         
         # Scenario 2: Reactions
         logger.info("\n=== Scenario 2: Message Reactions ===")
         
-        # Bob reacts to Alice's idea
-        if alice.received_messages:
-            message_to_react = alice.received_messages[0].get('message_id', 'msg_1')
-            await bob.thread_adapter.react_to_message(
-                message_id=message_to_react,
-                reaction_type="like",
-                target_agent_id="Alice"
-            )
-        await asyncio.sleep(0.5)
-        
-        # Alice adds a +1 reaction
-        if bob.received_messages:
-            message_to_react = bob.received_messages[0].get('message_id', 'msg_2')
-            await alice.thread_adapter.react_to_message(
-                message_id=message_to_react,
-                reaction_type="+1",
-                target_agent_id="Bob"
-            )
-        await asyncio.sleep(0.5)
+        # The two reactions are independent, so they are sent together and
+        # then both notifications are awaited: Bob likes Alice's idea and
+        # Alice gives Bob's reply a +1
+        await asyncio.gather(
+            bob.thread_adapter.react_to_message(target_message_id=original['message_id'], reaction_type="like"),
+            alice.thread_adapter.react_to_message(target_message_id=bob_reply['message_id'], reaction_type="+1")
+        )
+        await asyncio.gather(alice.wait_for("reaction"), bob.wait_for("reaction"))
         
-        # Scenario 3: Broadcast with threading
-        logger.info("\n=== Scenario 3: Broadcast Threading ===")
+        # Scenario 3: Channel threading
+        logger.info("\n=== Scenario 3: Channel Threading ===")
         
-        # Alice broadcasts a question
-        await alice.thread_adapter.send_broadcast_thread_message(
-            content={"text": "Who wants to help with the documentation?"}
-        )
-        await asyncio.sleep(0.5)
+        # Alice asks the general channel a question, mentioning Bob
+        text = "Who wants to help with the documentation?"
+        await alice.thread_adapter.send_channel_message(channel="general", text=text, target_agent="Bob")
+        question = await bob.find_message("Alice", text, channel="general")
         
-        # Bob replies to the broadcast
-        if alice.received_messages:
-            broadcast_id = alice.received_messages[-1].get('message_id', 'broadcast_1')
-            await bob.thread_adapter.reply_to_broadcast_message(
-                text="I can help with the API documentation!",
-                reply_to_id=broadcast_id
+        # Bob replies in a thread under the question
+        if question:
+            await bob.thread_adapter.reply_channel_message(
+                channel="general",
+                reply_to_id=question['message_id'],
+                text="I can help with the API documentation!"
             )
-        await asyncio.sleep(0.5)
         
         # Scenario 4: Message quoting
         logger.info("\n=== Scenario 4: Message Quoting ===")
         
-        # Alice quotes Bob's earlier message in a new conversation
-        if bob.received_messages:
-            message_to_quote = bob.received_messages[0] 
-            await alice.thread_adapter.quote_message(
-                target_agent_id="Bob",
-                text="I was thinking more about your suggestion...",
-                quoted_message_id=message_to_quote.get('message_id', 'msg_2'),
-                quoted_text="Great idea! What kind of feature are you thinking?"
-            )
-        await asyncio.sleep(0.5)
+        # Alice quotes Bob's earlier reply in a new message; the network fills in the quoted text
+        text = "I was thinking more about your suggestion..."
+        await alice.thread_adapter.send_direct_message(target_agent_id="Bob", text=text, quote=bob_reply['message_id'])
+        quoting = await bob.find_message("Alice", text)
+        if quoting:
+            logger.info("[Bob] Alice quoted: %s", quoting.get('quoted_text'))
         
         # Scenario 5: Channel operations
         logger.info("\n=== Scenario 5: Channel Operations ===")
         
-        # List available channels
-        await alice.thread_adapter.list_channels()
-        await asyncio.sleep(0.5)
-        
-        # Send messages in different channels (assuming a "dev" channel exists)
-        await alice.thread_adapter.send_broadcast_thread_message(
-            content={"text": "Development team discussion in dev channel"},
-            channel="dev"
-        )
-        await asyncio.sleep(0.5)
-        
-        # Reply in the dev channel
-        if alice.received_messages:
-            dev_message_id = alice.received_messages[-1].get('message_id', 'dev_msg_1')
-            await bob.thread_adapter.reply_to_broadcast_message(
-                text="Working on the new feature branch",
-                reply_to_id=dev_message_id,
-                channel="dev"
+        # List available channels while Bob posts in the development channel;
+        # the two requests are independent
+        await asyncio.gather(
+            alice.thread_adapter.list_channels(),
+            bob.thread_adapter.send_channel_message(
+                channel="development",
+                text="Working on the new feature branch"
             )
-        await asyncio.sleep(0.5)
+        )
+        await alice.wait_for("channels")
         
-        # Scenario 6: File sharing in threads (if files exist)
+        # Scenario 6: File sharing in threads
         logger.info("\n=== Scenario 6: File Sharing in Threads ===")
         
-        # Create a temporary file for demo
+        # Create a temporary file for demo (file I/O runs in the default
+        # executor so the agents keep processing messages meanwhile)
+        loop = asyncio.get_running_loop()
         demo_file = Path("demo_file.txt")
-        demo_file.write_text("This is a demo file for thread messaging!")
+        await loop.run_in_executor(None, demo_file.write_text, "This is a demo file for thread messaging!")
         
         try:
-            # Alice sends a file as part of a thread in the general channel
-            if alice.received_messages:
-                await alice.thread_adapter.send_thread_file(
+            # Alice uploads the file, then shares its ID in the thread
+            await alice.thread_adapter.upload_file(demo_file)
+            if await alice.wait_for("upload") and alice.uploaded_file_ids:
+                text = f"Here's the spec document we discussed: file {alice.uploaded_file_ids[-1]}"
+                await alice.thread_adapter.reply_direct_message(
                     target_agent_id="Bob",
-                    file_path=str(demo_file),
-                    message_text="Here's the spec document we discussed",
-                    reply_to_id=alice.received_messages[0].get('message_id', 'msg_1')
+                    reply_to_id=original['message_id'],
+                    text=text
                 )
-        except Exception as e:
-            logger.info(f"File demo skipped: {e}")
+                await bob.find_message("Alice", text)
         finally:
             # Clean up demo file
-            if demo_file.exists():
-                demo_file.unlink()
-        
-        await asyncio.sleep(1)
+            await loop.run_in_executor(None, _remove_file, demo_file)
         
         # Print summary
         logger.info("\n=== Demo Summary ===")
-        logger.info(f"Alice received {len(alice.received_messages)} messages and {len(alice.received_reactions)} reactions")
-        logger.info(f"Bob received {len(bob.received_messages)} messages and {len(bob.received_reactions)} reactions")
-        
-        # Show message details
-        for i, msg in enumerate(alice.received_messages):
-            logger.info(f"Alice Message {i+1}: {msg}")
+        logger.info(f"Alice received {len(alice.received_reactions)} reactions and uploaded {len(alice.uploaded_file_ids)} files")
+        logger.info(f"Bob received {len(bob.received_reactions)} reactions")
         
-        for i, msg in enumerate(bob.received_messages):
-            logger.info(f"Bob Message {i+1}: {msg}")
+        # Show Bob's last retrieval of his conversation with Alice, oldest first, in one log record
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(
+                f"Message {i}: {msg.get('sender_id')}: {(msg.get('content') or {}).get('text')}"
+                for i, msg in enumerate(reversed(bob.retrieved_messages), 1)
+            ))
     
     except Exception as e:
         logger.error(f"Demo failed: {e}")
-        logger.info("Make sure the OpenAgents network server is running!")
-        logger.info("You can start a network with: python -m openagents.launchers.network_launcher")
+        logger.info("Make sure the OpenAgents network server is running with the thread messaging mod!")
+        logger.info("You can start one with: openagents launch-network examples/thread_messaging_network/network_config.yaml")
     
     finally:
         # Disconnect agents
@@ -273,17 +322,12 @@ async def demonstrate_threading():
 async def demonstrate_reactions_only():
     """Demonstrate just the reaction features without network."""
     logger.info("\n=== Reaction Types Demo ===")
-    
-    from openagents.mods.communication.thread_messaging import REACTION_TYPES
-    
-    logger.info("Available reaction types:")
-    for reaction in REACTION_TYPES:
-        logger.info(f"  - {reaction}")
+    logger.info("Available reaction types:\n%s", _REACTION_LIST)
     
     logger.info("\nExample usage:")
-    logger.info("await adapter.react_to_message(message_id='abc123', reaction_type='like')")
-    logger.info("await adapter.react_to_message(message_id='def456', reaction_type='+1')")
-    logger.info("await adapter.react_to_message(message_id='ghi789', reaction_type='done')")
+    logger.info("await adapter.react_to_message(target_message_id='abc123', reaction_type='like')")
+    logger.info("await adapter.react_to_message(target_message_id='def456', reaction_type='+1')")
+    logger.info("await adapter.react_to_message(target_message_id='ghi789', reaction_type='done', action='remove')")
 
 
 if __name__ == "__main__":
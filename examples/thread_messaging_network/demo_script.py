@@ -15,12 +15,19 @@ Run this script to see a complete workflow of team collaboration
 using the Thread Messaging mod.
 """
 
+import argparse
 import asyncio
 import logging
+import os
+import random
+import sys
 import time
 import json
-from pathlib import Path
-from typing import Dict, List, Any
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional, Set
+
+from openagents.core.client import AgentClient
+from openagents.mods.communication.thread_messaging import ThreadMessagingAgentAdapter
 
 # Configure logging
 logging.basicConfig(
@@ -29,12 +36,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Import OpenAgents modules
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
+# Network responses the demo waits for, keyed by the handler action that carries them
+_RESPONSE_KINDS = {
+    "channel_messages_retrieved": "channel_messages",
+    "channel_messages_retrieval_error": "channel_messages",
+    "direct_messages_retrieved": "direct_messages",
+    "direct_messages_retrieval_error": "direct_messages",
+    "upload": "upload"
+}
+
+# Handler actions carrying retrieved messages, and their error counterparts
+_RETRIEVAL_ACTIONS = frozenset({"channel_messages_retrieved", "direct_messages_retrieved"})
+_RETRIEVAL_ERROR_ACTIONS = frozenset({"channel_messages_retrieval_error", "direct_messages_retrieval_error"})
+
+# Deep thread discussion in the development channel, in posting order
+_DEEP_THREAD = (
+    ("pm", "Let's discuss the performance implications of deep threading..."),
+    ("dev", "Memory usage grows linearly with thread depth. Each level adds ~200 bytes overhead."),
+    ("qa", "What about query performance? Are we indexing thread relationships properly?"),
+    ("dev", "Good point! We use adjacency list with materialized path. Query time is O(log n)."),
+    ("pm", "Excellent! That should scale well. What's the practical limit for thread depth?"),
+    ("dev", "5 levels is our current limit. Beyond that, UX research shows diminishing returns for readability.")
+)
+
+_BANNER = """🎭 Thread Messaging Network Demo
+==================================================
+This demo showcases all features of the Thread Messaging mod:
+• Direct messaging between agents
+• Channel messaging with mentions
+• File upload and sharing
+• Reddit-like threading (5 levels)
+• Message quoting
+• Message retrieval with pagination
+• Channel management
+
+Make sure the network is running first:
+  openagents launch-network examples/thread_messaging_network/network_config.yaml
+"""
 
-from src.openagents.core.client import AgentClient
-from src.openagents.mods.communication.thread_messaging import ThreadMessagingAgentAdapter
+# Documents uploaded in the file sharing scenario
+DESIGN_DOC_MD = "# Threading System Design\n\n## Overview\nThis document outlines the architecture for the new Reddit-like threading system...\n\n## Tree Structure\n- Root messages\n- Child replies (up to 5 levels)\n- Thread metadata\n\n## Performance Considerations\n- Memory optimization\n- Query efficiency\n- Scalability"
+
+# Test plan uploaded by QA, serialized once
+TEST_PLAN_JSON = json.dumps({
+    "test_suite": "Threading System",
+    "test_cases": [
+        {"id": 1, "name": "Create thread", "priority": "high"},
+        {"id": 2, "name": "Reply to message", "priority": "high"},
+        {"id": 3, "name": "Deep nesting", "priority": "medium"},
+        {"id": 4, "name": "Quote message", "priority": "medium"}
+    ],
+    "coverage": "85%"
+}, separators=(",", ":"))
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter between connection attempts."""
+    return min(0.5 * 2 ** attempt, 5.0) + random.uniform(0, 0.25)
 
 
 class DemoAgent:
@@ -46,12 +104,24 @@ class DemoAgent:
         self.role = role
         self.client = None
         self.adapter = None
-        self.message_log: List[Dict[str, Any]] = []
+        # Recent messages only, so long runs don't grow without limit
+        self.message_log: Deque[Dict[str, Any]] = deque(maxlen=1024)
         self.received_files: List[str] = []
+        self.next_cursors: Dict[str, Optional[str]] = {}
+        
+        # Set by the handlers when a response arrives, so the demo can wait
+        # for it instead of sleeping
+        self._responses = {kind: asyncio.Event() for kind in set(_RESPONSE_KINDS.values())}
+        
+        # Latest retrieved messages by kind, and the kinds currently being
+        # retrieved only to confirm delivery (serialized so responses don't mix)
+        self.retrieved: Dict[str, List[Dict[str, Any]]] = {}
+        self._confirming: Set[str] = set()
+        self._confirm_locks = {kind: asyncio.Lock() for kind in ("channel_messages", "direct_messages")}
         
     async def initialize(self, host: str = "localhost", port: int = 8571):
         """Initialize the agent and connect to the network."""
-        logger.info(f"Initializing {self.name} ({self.agent_id})")
+        logger.info("Initializing %s (%s)", self.name, self.agent_id)
         
         # Create client
         self.client = AgentClient(agent_id=self.agent_id)
@@ -66,84 +136,263 @@ class DemoAgent:
         
         # Connect to network with retry logic
         max_retries = 3
+        error = "connection refused"
         for attempt in range(max_retries):
             try:
-                success = await self.client.connect_to_server(host=host, port=port)
-                if success:
-                    logger.info(f"{self.name} connected to network")
-                    break
-                else:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Connection attempt {attempt + 1} failed for {self.name}, retrying...")
-                        await asyncio.sleep(2)
-                    else:
-                        raise Exception(f"Failed to connect {self.name} to network at {host}:{port} after {max_retries} attempts")
+                if await self.client.connect_to_server(host=host, port=port):
+                    logger.info("%s connected to network", self.name)
+                    return
             except Exception as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"Connection attempt {attempt + 1} failed for {self.name}: {e}, retrying...")
-                    await asyncio.sleep(2)
-                else:
-                    raise Exception(f"Failed to connect {self.name} to network at {host}:{port} after {max_retries} attempts: {e}")
+                error = e
+            if attempt < max_retries - 1:
+                logger.warning("Connection attempt %d failed for %s: %s, retrying...", attempt + 1, self.name, error)
+                await asyncio.sleep(_retry_delay(attempt))
+        raise Exception(f"Failed to connect {self.name} to network at {host}:{port} after {max_retries} attempts: {error}")
         
     async def disconnect(self):
         """Disconnect from the network."""
         if self.client:
             await self.client.disconnect()
-            logger.info(f"{self.name} disconnected")
+            logger.info("%s disconnected", self.name)
+    
+    async def wait_for_response(self, kind: str, timeout: float = 5.0) -> bool:
+        """Wait until a response of the given kind arrives, or the timeout passes."""
+        event = self._responses[kind]
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning("%s got no %s response within %ss", self.name, kind, timeout)
+            return False
+        finally:
+            event.clear()
+    
+    async def post_channel_message(self, channel: str, text: str, target_agent: Optional[str] = None) -> bool:
+        """Send a channel message and wait until the network has stored it."""
+        await self.adapter.send_channel_message(channel=channel, text=text, target_agent=target_agent)
+        return await self.confirm_delivery(text, channel=channel)
+    
+    async def post_direct_message(self, target_agent_id: str, text: str) -> bool:
+        """Send a direct message and wait until the network has stored it."""
+        await self.adapter.send_direct_message(target_agent_id=target_agent_id, text=text)
+        return await self.confirm_delivery(text, target_agent_id=target_agent_id)
+    
+    async def confirm_delivery(self, text: str, channel: Optional[str] = None,
+                               target_agent_id: Optional[str] = None, attempts: int = 3) -> bool:
+        """Wait until a message we sent shows up in the network's history.
+        
+        The network doesn't acknowledge channel or direct messages, so the
+        recent history is retrieved until the message appears. Awaiting this
+        before another agent replies keeps the reply from being stored before
+        the message it answers.
+        
+        Args:
+            text: Text of the sent message
+            channel: Channel the message was sent to
+            target_agent_id: Recipient, for a direct message
+            attempts: Number of retrievals before giving up
+            
+        Returns:
+            bool: True if the message was found
+        """
+        kind = "channel_messages" if channel else "direct_messages"
+        async with self._confirm_locks[kind]:
+            self._confirming.add(kind)
+            try:
+                for _ in range(attempts):
+                    if channel:
+                        await self.adapter.retrieve_channel_messages(channel=channel, limit=10)
+                    else:
+                        await self.adapter.retrieve_direct_messages(target_agent_id=target_agent_id, limit=10)
+                    if not await self.wait_for_response(kind):
+                        continue
+                    if any(msg.get("sender_id") == self.agent_id and (msg.get("content") or {}).get("text") == text
+                           for msg in self.retrieved.get(kind, ())):
+                        return True
+            finally:
+                self._confirming.discard(kind)
+        logger.warning("%s could not confirm delivery of: %.50s", self.name, text)
+        return False
+    
+    def _notify_response(self, action: str):
+        """Wake up a demo step waiting for this kind of response."""
+        kind = _RESPONSE_KINDS.get(action)
+        if kind:
+            self._responses[kind].set()
     
     def _handle_message(self, content: Dict[str, Any], sender_id: str):
         """Handle incoming messages."""
         action = content.get("action", "unknown")
         
-        if action in ["channel_messages_retrieved", "direct_messages_retrieved"]:
+        if action in _RETRIEVAL_ACTIONS:
             # Handle message retrieval responses
-            messages = content.get("messages", [])
-            total_count = content.get("total_count", 0)
-            logger.info(f"{self.name} retrieved {len(messages)} messages (total: {total_count})")
+            messages = content.get("messages") or []
+            kind = _RESPONSE_KINDS[action]
+            self.retrieved[kind] = messages
+            self._notify_response(action)
+            if kind in self._confirming:
+                return
+            logger.info("%s retrieved %d messages (total: %s)",
+                        self.name, len(messages), content.get("total_count", 0))
+            if action == "channel_messages_retrieved":
+                self.next_cursors[content.get("channel")] = content.get("next_cursor")
             
             # Log message details
-            for msg in messages[:3]:  # Show first 3 messages
-                msg_text = msg.get("content", {}).get("text", "No text")
-                msg_sender = msg.get("sender_id", "Unknown")
-                logger.info(f"  Message from {msg_sender}: {msg_text[:50]}...")
+            if logger.isEnabledFor(logging.INFO):
+                for msg in messages[:3]:  # Show first 3 messages
+                    msg_content = msg.get("content")
+                    msg_text = msg_content.get("text", "No text") if msg_content else "No text"
+                    logger.info("  Message from %s: %.50s...", msg.get("sender_id", "Unknown"), msg_text)
                 
-        elif action in ["channel_messages_retrieval_error", "direct_messages_retrieval_error"]:
-            error = content.get("error", "Unknown error")
-            logger.error(f"{self.name} retrieval error: {error}")
+        elif action in _RETRIEVAL_ERROR_ACTIONS:
+            self.retrieved[_RESPONSE_KINDS[action]] = []
+            self._notify_response(action)
+            logger.error("%s retrieval error: %s", self.name, content.get("error", "Unknown error"))
             
         else:
             # Regular message
-            text = content.get("text", "")
+            text = content.get("text")
             if text:
                 self.message_log.append({
                     "sender": sender_id,
                     "text": text,
-                    "timestamp": time.time(),
+                    "timestamp": time.monotonic_ns(),  # Monotonic, for ordering and latency math
                     "action": action
                 })
-                logger.info(f"{self.name} received from {sender_id}: {text}")
+                logger.info("%s received from %s: %s", self.name, sender_id, text)
     
     def _handle_file(self, file_id: str, filename: str, file_info: Dict[str, Any]):
         """Handle file operations."""
         action = file_info.get("action", "unknown")
         success = file_info.get("success", False)
+        self._notify_response(action)
         
         if action == "upload" and success:
-            logger.info(f"{self.name} uploaded file: {filename} -> {file_id}")
+            logger.info("%s uploaded file: %s -> %s", self.name, filename, file_id)
             self.received_files.append(file_id)
         elif action == "download" and success:
-            local_path = file_info.get("path", "unknown")
-            logger.info(f"{self.name} downloaded file: {filename} -> {local_path}")
+            logger.info("%s downloaded file: %s -> %s", self.name, filename, file_info.get("path", "unknown"))
         else:
-            error = file_info.get("error", "Unknown error")
-            logger.error(f"{self.name} file operation failed: {error}")
+            logger.error("%s file operation failed: %s", self.name, file_info.get("error", "Unknown error"))
+
+
+async def scenario_team_announcement(agents: Dict[str, DemoAgent]):
+    """Scenario 2: the PM announces the project kickoff."""
+    logger.info("\n📢 SCENARIO 2: Team Announcement")
+
+    # PM announces project kickoff and the meeting schedule in one batch
+    await agents["pm"].adapter.send_channel_messages(
+        channel="announcements",
+        texts=[
+            "🎉 Kicking off the new OpenAgents v2.0 project! This will be our main communication channel for coordination.",
+            "📅 Team syncs are Mondays and Thursdays at 10:00. Design reviews happen in #development."
+        ]
+    )
+
+
+async def scenario_development_discussion(agents: Dict[str, DemoAgent]):
+    """Scenario 3: the team discusses the threading architecture."""
+    logger.info("\n💻 SCENARIO 3: Development Discussion")
+
+    # Each message is stored before the next agent answers it
+    # Developer starts architecture discussion
+    await agents["dev"].post_channel_message(
+        channel="development",
+        text="I'm working on the new threading system. Should we use a tree structure or linked list for message relationships?"
+    )
+
+    # PM responds with requirements (as new message)
+    await agents["pm"].post_channel_message(
+        channel="development",
+        text="Great question! We need to support 5 levels of nesting like Reddit. Tree structure would be more efficient for deep threads."
+    )
+
+    # QA provides testing perspective (as new message)
+    await agents["qa"].post_channel_message(
+        channel="development",
+        text="From a testing perspective, tree structure will be easier to validate. We can test each branch independently."
+    )
+
+
+async def scenario_direct_coordination(agents: Dict[str, DemoAgent]):
+    """Scenario 4: the PM and developer coordinate over direct messages."""
+    logger.info("\n💬 SCENARIO 4: Direct Message Coordination")
+
+    # PM sends private message to developer
+    await agents["pm"].post_direct_message(
+        target_agent_id="developer_alice",
+        text="Alice, can you prepare a technical design document for the threading system? I'd like to review it before the team meeting."
+    )
 
+    # Developer responds
+    await agents["dev"].post_direct_message(
+        target_agent_id="project_manager",
+        text="Absolutely! I'll have a draft ready by end of day. Should I include performance benchmarks?"
+    )
 
-async def create_demo_file(filename: str, content: str) -> Path:
-    """Create a demo file for upload testing."""
-    file_path = Path(filename)
-    file_path.write_text(content)
-    return file_path
+    # PM follows up with specific requirements
+    await agents["pm"].post_direct_message(
+        target_agent_id="developer_alice",
+        text="Yes, benchmarks would be great. Focus on memory usage and query performance for deep threads."
+    )
+
+
+async def scenario_file_sharing(agents: Dict[str, DemoAgent]):
+    """Scenario 5: the developer and QA upload and share documents."""
+    logger.info("\n📎 SCENARIO 5: File Sharing")
+
+    # Developer uploads the design document while QA uploads the test plan
+    await asyncio.gather(
+        agents["dev"].adapter.upload_bytes("threading_design.md", DESIGN_DOC_MD.encode()),
+        agents["qa"].adapter.upload_bytes("test_plan.json", TEST_PLAN_JSON.encode())
+    )
+    await asyncio.gather(
+        agents["dev"].wait_for_response("upload"),
+        agents["qa"].wait_for_response("upload")
+    )
+
+    # Share file in channel (in real scenario, would use actual file UUID)
+    await agents["dev"].post_channel_message(
+        channel="development",
+        text="I've uploaded the threading system design document. Please review and provide feedback!"
+    )
+
+
+async def scenario_support_ticket(agents: Dict[str, DemoAgent]):
+    """Scenario 6: support, dev and QA work through a support ticket."""
+    logger.info("\n🎫 SCENARIO 6: Support Ticket Threading")
+
+    # Each message is stored before the next agent answers it
+    # Support creates ticket
+    await agents["support"].post_channel_message(
+        channel="support",
+        text="🎫 TICKET #1234: User reports threading not working properly in mobile app. Need dev team assistance.",
+        target_agent="developer_alice"  # Mention developer
+    )
+
+    # Developer asks for details
+    await agents["dev"].post_channel_message(
+        channel="support",
+        text="I can help! Can you provide more details about the specific issue? Which mobile platform?"
+    )
+
+    # Support provides details
+    await agents["support"].post_channel_message(
+        channel="support",
+        text="iOS app v1.2.3. Users can't see replies beyond 3 levels deep. Android works fine."
+    )
+
+    # Developer identifies the issue
+    await agents["dev"].post_channel_message(
+        channel="support",
+        text="Found it! iOS has a different CSS handling for nested elements. I'll push a fix today."
+    )
+
+    # QA offers to test
+    await agents["qa"].post_channel_message(
+        channel="support",
+        text="I can test the fix on iOS simulator and real devices once it's ready."
+    )
 
 
 async def run_demo():
@@ -159,14 +408,15 @@ async def run_demo():
     }
     
     try:
-        # Initialize all agents
+        # Initialize all agents concurrently
         logger.info("Initializing agents...")
-        for agent in agents.values():
-            await agent.initialize()
-            await asyncio.sleep(1)  # Stagger connections
-        
-        # Wait for all agents to be ready
-        await asyncio.sleep(2)
+        results = await asyncio.gather(
+            *(agent.initialize() for agent in agents.values()),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
         
         # ========================================
         # SCENARIO 1: Channel Discovery and Setup
@@ -175,158 +425,24 @@ async def run_demo():
         
         # Project manager lists available channels
         await agents["pm"].adapter.list_channels()
-        await asyncio.sleep(1)
         
         # ========================================
-        # SCENARIO 2: Team Announcement
+        # SCENARIOS 2-6: Team activity
         # ========================================
-        logger.info("\n📢 SCENARIO 2: Team Announcement")
-        
-        # PM announces project kickoff
-        await agents["pm"].adapter.send_channel_message(
-            channel="announcements",
-            text="🎉 Kicking off the new OpenAgents v2.0 project! This will be our main communication channel for coordination."
+        # The announcement, the PM/dev DMs and the support ticket each use
+        # their own channel or DM pair, so they run concurrently. Their agents
+        # overlap (dev is in the DMs and the ticket), which is fine because
+        # an agent's channel and DM confirmations don't share state.
+        await asyncio.gather(
+            scenario_team_announcement(agents),
+            scenario_direct_coordination(agents),
+            scenario_support_ticket(agents)
         )
-        await asyncio.sleep(1)
         
-        # ========================================
-        # SCENARIO 3: Development Discussion
-        # ========================================
-        logger.info("\n💻 SCENARIO 3: Development Discussion")
-        
-        # Developer starts architecture discussion
-        dev_msg_id = None
-        await agents["dev"].adapter.send_channel_message(
-            channel="development",
-            text="I'm working on the new threading system. Should we use a tree structure or linked list for message relationships?"
-        )
-        await asyncio.sleep(1)
-        
-        # PM responds with requirements (as new message)
-        await agents["pm"].adapter.send_channel_message(
-            channel="development",
-            text="Great question! We need to support 5 levels of nesting like Reddit. Tree structure would be more efficient for deep threads."
-        )
-        await asyncio.sleep(1)
-        
-        # QA provides testing perspective (as new message)
-        await agents["qa"].adapter.send_channel_message(
-            channel="development",
-            text="From a testing perspective, tree structure will be easier to validate. We can test each branch independently."
-        )
-        await asyncio.sleep(1)
-        
-        # ========================================
-        # SCENARIO 4: Direct Message Coordination
-        # ========================================
-        logger.info("\n💬 SCENARIO 4: Direct Message Coordination")
-        
-        # PM sends private message to developer
-        await agents["pm"].adapter.send_direct_message(
-            target_agent_id="developer_alice",
-            text="Alice, can you prepare a technical design document for the threading system? I'd like to review it before the team meeting."
-        )
-        await asyncio.sleep(1)
-        
-        # Developer responds
-        await agents["dev"].adapter.send_direct_message(
-            target_agent_id="project_manager",
-            text="Absolutely! I'll have a draft ready by end of day. Should I include performance benchmarks?"
-        )
-        await asyncio.sleep(1)
-        
-        # PM follows up with specific requirements
-        await agents["pm"].adapter.send_direct_message(
-            target_agent_id="developer_alice",
-            text="Yes, benchmarks would be great. Focus on memory usage and query performance for deep threads."
-        )
-        await asyncio.sleep(1)
-        
-        # ========================================
-        # SCENARIO 5: File Sharing
-        # ========================================
-        logger.info("\n📎 SCENARIO 5: File Sharing")
-        
-        # Create demo files
-        design_doc = await create_demo_file(
-            "threading_design.md",
-            "# Threading System Design\n\n## Overview\nThis document outlines the architecture for the new Reddit-like threading system...\n\n## Tree Structure\n- Root messages\n- Child replies (up to 5 levels)\n- Thread metadata\n\n## Performance Considerations\n- Memory optimization\n- Query efficiency\n- Scalability"
-        )
-        
-        test_plan = await create_demo_file(
-            "test_plan.json",
-            json.dumps({
-                "test_suite": "Threading System",
-                "test_cases": [
-                    {"id": 1, "name": "Create thread", "priority": "high"},
-                    {"id": 2, "name": "Reply to message", "priority": "high"},
-                    {"id": 3, "name": "Deep nesting", "priority": "medium"},
-                    {"id": 4, "name": "Quote message", "priority": "medium"}
-                ],
-                "coverage": "85%"
-            }, indent=2)
-        )
-        
-        # Developer uploads design document
-        await agents["dev"].adapter.upload_file(str(design_doc))
-        await asyncio.sleep(1)
-        
-        # QA uploads test plan
-        await agents["qa"].adapter.upload_file(str(test_plan))
-        await asyncio.sleep(1)
-        
-        # Share file in channel (in real scenario, would use actual file UUID)
-        await agents["dev"].adapter.send_channel_message(
-            channel="development",
-            text="I've uploaded the threading system design document. Please review and provide feedback!"
-        )
-        await asyncio.sleep(1)
-        
-        # ========================================
-        # SCENARIO 6: Support Ticket Threading
-        # ========================================
-        logger.info("\n🎫 SCENARIO 6: Support Ticket Threading")
-        
-        # Support creates ticket
-        await agents["support"].adapter.send_channel_message(
-            channel="support",
-            text="🎫 TICKET #1234: User reports threading not working properly in mobile app. Need dev team assistance.",
-            target_agent="developer_alice"  # Mention developer
-        )
-        await asyncio.sleep(1)
-        
-        # Developer asks for details
-        await agents["dev"].adapter.send_channel_message(
-            channel="support",
-
-            text="I can help! Can you provide more details about the specific issue? Which mobile platform?"
-        )
-        await asyncio.sleep(1)
-        
-        # Support provides details
-        await agents["support"].adapter.send_channel_message(
-            channel="support",
-
-            text="iOS app v1.2.3. Users can't see replies beyond 3 levels deep. Android works fine.",
-
-        )
-        await asyncio.sleep(1)
-        
-        # Developer identifies the issue
-        await agents["dev"].adapter.send_channel_message(
-            channel="support",
-
-            text="Found it! iOS has a different CSS handling for nested elements. I'll push a fix today."
-        )
-        await asyncio.sleep(1)
-        
-        # QA offers to test
-        await agents["qa"].adapter.send_channel_message(
-            channel="support",
-
-            text="I can test the fix on iOS simulator and real devices once it's ready."
-        )
-        await asyncio.sleep(1)
+        # The development discussion and the file share both post to
+        # #development, so they run in order to keep the channel readable
+        await scenario_development_discussion(agents)
+        await scenario_file_sharing(agents)
         
         # ========================================
         # SCENARIO 7: Message History Retrieval
@@ -339,7 +455,7 @@ async def run_demo():
             limit=10,
             include_threads=True
         )
-        await asyncio.sleep(2)
+        await agents["pm"].wait_for_response("channel_messages")
         
         # Support retrieves conversation with developer
         await agents["support"].adapter.retrieve_direct_messages(
@@ -347,58 +463,17 @@ async def run_demo():
             limit=5,
             include_threads=True
         )
-        await asyncio.sleep(2)
+        await agents["support"].wait_for_response("direct_messages")
         
         # ========================================
         # SCENARIO 8: Advanced Threading
         # ========================================
         logger.info("\n🧵 SCENARIO 8: Advanced Threading (5 levels)")
         
-        # Create a deep thread discussion
-        await agents["pm"].adapter.send_channel_message(
-            channel="development",
-            text="Let's discuss the performance implications of deep threading..."
-        )
-        await asyncio.sleep(1)
-        
-        # Level 1 reply
-        await agents["dev"].adapter.send_channel_message(
-            channel="development",
-
-            text="Memory usage grows linearly with thread depth. Each level adds ~200 bytes overhead."
-        )
-        await asyncio.sleep(1)
-        
-        # Level 2 reply
-        await agents["qa"].adapter.send_channel_message(
-            channel="development", 
-
-            text="What about query performance? Are we indexing thread relationships properly?"
-        )
-        await asyncio.sleep(1)
-        
-        # Level 3 reply
-        await agents["dev"].adapter.send_channel_message(
-            channel="development",
- 
-            text="Good point! We use adjacency list with materialized path. Query time is O(log n)."
-        )
-        await asyncio.sleep(1)
-        
-        # Level 4 reply
-        await agents["pm"].adapter.send_channel_message(
-            channel="development",
-            text="Excellent! That should scale well. What's the practical limit for thread depth?"
-        )
-        await asyncio.sleep(1)
-        
-        # Level 5 reply (maximum depth)
-        await agents["dev"].adapter.send_channel_message(
-            channel="development",
-
-            text="5 levels is our current limit. Beyond that, UX research shows diminishing returns for readability."
-        )
-        await asyncio.sleep(2)
+        # Each send only writes a frame, so the chain goes out back to back
+        # without waiting on the server between levels
+        for agent_key, text in _DEEP_THREAD:
+            await agents[agent_key].adapter.send_channel_message(channel="development", text=text)
         
         # ========================================
         # DEMO SUMMARY
@@ -406,70 +481,78 @@ async def run_demo():
         logger.info("\n📊 DEMO SUMMARY")
         
         # Show message statistics for each agent
-        for agent_id, agent in agents.items():
-            msg_count = len(agent.message_log)
-            file_count = len(agent.received_files)
-            logger.info(f"{agent.name}: {msg_count} messages processed, {file_count} files handled")
+        for agent in agents.values():
+            logger.info("%s: %d messages processed, %d files handled",
+                        agent.name, len(agent.message_log), len(agent.received_files))
         
         # Final message retrieval to show complete history
         logger.info("\n📖 Retrieving complete channel history...")
-        await agents["pm"].adapter.retrieve_channel_messages(
-            channel="development",
-            limit=50,
-            offset=0,
-            include_threads=True
-        )
-        await asyncio.sleep(2)
+        cursor = None
+        while True:
+            await agents["pm"].adapter.retrieve_channel_messages(
+                channel="development",
+                limit=50,
+                include_threads=True,
+                cursor=cursor
+            )
+            if not await agents["pm"].wait_for_response("channel_messages"):
+                break
+            cursor = agents["pm"].next_cursors.pop("development", None)
+            if not cursor:
+                break
         
         logger.info("✅ Thread Messaging Demo completed successfully!")
         
     except Exception as e:
-        logger.error(f"❌ Demo failed: {e}")
+        logger.error("❌ Demo failed: %s", e)
         raise
         
     finally:
         # Cleanup
         logger.info("🧹 Cleaning up...")
-        for agent in agents.values():
-            await agent.disconnect()
-        
-        # Clean up demo files
-        for filename in ["threading_design.md", "test_plan.json"]:
-            file_path = Path(filename)
-            if file_path.exists():
-                file_path.unlink()
-
-
-async def main():
-    """Main entry point for the demo."""
-    print("🎭 Thread Messaging Network Demo")
-    print("=" * 50)
-    print("This demo showcases all features of the Thread Messaging mod:")
-    print("• Direct messaging between agents")
-    print("• Channel messaging with mentions") 
-    print("• File upload and sharing")
-    print("• Reddit-like threading (5 levels)")
-    print("• Message quoting")
-    print("• Message retrieval with pagination")
-    print("• Channel management")
-    print()
-    print("Make sure the network is running first:")
-    print("  openagents launch-network examples/thread_messaging_network/network_config.yaml")
-    print()
+        await asyncio.gather(
+            *(agent.disconnect() for agent in agents.values()),
+            return_exceptions=True
+        )
+
+
+async def main(autorun: bool = False):
+    """Main entry point for the demo.
+    
+    Args:
+        autorun: Start right away instead of waiting for Enter
+    """
+    # Banner and prompt are only for people watching a terminal
+    if sys.stdout.isatty():
+        print(_BANNER)
     
-    input("Press Enter to start the demo...")
+    if not autorun and sys.stdin.isatty():
+        input("Press Enter to start the demo...")
     
     try:
         await run_demo()
     except KeyboardInterrupt:
         logger.info("Demo interrupted by user")
     except Exception as e:
-        logger.error(f"Demo failed: {e}")
+        logger.error("Demo failed: %s", e)
         return 1
     
     return 0
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # Use uvloop when available for lower socket overhead
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
+    parser = argparse.ArgumentParser(description="Thread Messaging Network Demo")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="start without waiting for Enter (also enabled by DEMO_AUTORUN=1)")
+    args = parser.parse_args()
+    
+    exit_code = asyncio.run(main(autorun=args.yes or bool(os.environ.get("DEMO_AUTORUN"))))
     exit(exit_code)
@@ -7,11 +7,13 @@ the thread messaging capabilities in a more interactive way.
 """
 
 import asyncio
+import io
 import logging
 import signal
 import sys
+import threading
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +22,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Responses the demo waits for, keyed by the handler action that carries them
+_RESPONSE_KINDS = {
+    "channels_listed": "channels",
+    "channels_list_error": "channels",
+    "channel_messages_retrieved": "channel_messages",
+    "channel_messages_retrieval_error": "channel_messages",
+    "direct_messages_retrieved": "direct_messages",
+    "direct_messages_retrieval_error": "direct_messages",
+    "upload": "upload"
+}
+
 # Import OpenAgents modules
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
@@ -38,15 +51,17 @@ class InteractiveAgent:
         self.adapter = None
         self.running = True
         
+        # Futures for responses the demo is waiting on, by response kind
+        self._pending: Dict[str, asyncio.Future] = {}
+        
+        # Latest retrieved messages by response kind
+        self.retrieved: Dict[str, List[Dict[str, Any]]] = {}
+        
     async def initialize(self, host: str = "localhost", port: int = 8571):
         """Initialize and connect the agent."""
         logger.info(f"🤖 Initializing {self.name} ({self.agent_id})")
         
-        self.client = AgentClient(
-            agent_id=self.agent_id,
-            host=host,
-            port=port
-        )
+        self.client = AgentClient(agent_id=self.agent_id)
         
         self.adapter = ThreadMessagingAgentAdapter()
         self.client.register_mod_adapter(self.adapter)
@@ -55,7 +70,8 @@ class InteractiveAgent:
         self.adapter.register_message_handler("main", self._handle_message)
         self.adapter.register_file_handler("main", self._handle_file)
         
-        await self.client.connect_to_server()
+        if not await self.client.connect_to_server(host=host, port=port):
+            raise ConnectionError(f"{self.name} could not connect to {host}:{port}")
         logger.info(f"✅ {self.name} connected")
         
     async def disconnect(self):
@@ -65,9 +81,77 @@ class InteractiveAgent:
             await self.client.disconnect()
             logger.info(f"👋 {self.name} disconnected")
     
+    def expect(self, kind: str) -> asyncio.Future:
+        """Get a future that resolves when the next response of a kind arrives.
+        
+        Call this before sending the request, so a fast response isn't missed.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending[kind] = future
+        return future
+    
+    async def wait_for(self, kind: str, future: asyncio.Future, timeout: float = 5.0) -> bool:
+        """Wait for a future from expect(), giving up after the timeout."""
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ {self.name} got no {kind} response within {timeout}s")
+            return False
+        finally:
+            if self._pending.get(kind) is future:
+                del self._pending[kind]
+    
+    async def find_sent(self, text: str, channel: Optional[str] = None,
+                        target_agent_id: Optional[str] = None, attempts: int = 3) -> Optional[Dict[str, Any]]:
+        """Wait until a message we sent is stored by the network, and return it.
+        
+        The network doesn't acknowledge channel or direct messages, so the
+        recent history is retrieved until the message appears. Awaiting this
+        before another agent replies keeps the reply from arriving first, and
+        gives the reply the stored message's real ID.
+        
+        Args:
+            text: Text of the sent message
+            channel: Channel the message was sent to
+            target_agent_id: Recipient, for a direct message
+            attempts: Number of retrievals before giving up
+            
+        Returns:
+            Optional[Dict[str, Any]]: The stored message, or None if it was not found
+        """
+        kind = "channel_messages" if channel else "direct_messages"
+        for _ in range(attempts):
+            retrieved = self.expect(kind)
+            if channel:
+                await self.adapter.retrieve_channel_messages(channel=channel, limit=10)
+            else:
+                await self.adapter.retrieve_direct_messages(target_agent_id=target_agent_id, limit=10)
+            if not await self.wait_for(kind, retrieved):
+                continue
+            message = next((
+                msg for msg in self.retrieved.get(kind, ())
+                if msg.get("sender_id") == self.agent_id and (msg.get("content") or {}).get("text") == text
+            ), None)
+            if message:
+                return message
+        
+        logger.warning(f"⚠️ {self.name} could not find its message: {text[:50]}")
+        return None
+    
+    def _resolve(self, action: str):
+        """Resolve the future waiting on this action's response kind, if any."""
+        future = self._pending.pop(_RESPONSE_KINDS.get(action), None)
+        if future and not future.done():
+            future.set_result(action)
+    
     def _handle_message(self, content: Dict, sender_id: str):
         """Handle incoming messages."""
         action = content.get("action", "message")
+        kind = _RESPONSE_KINDS.get(action)
+        if kind in ("channel_messages", "direct_messages"):
+            self.retrieved[kind] = content.get("messages") or []
+        self._resolve(action)
         
         if action == "channel_messages_retrieved":
             messages = content.get("messages", [])
@@ -88,6 +172,7 @@ class InteractiveAgent:
         """Handle file operations."""
         action = file_info.get("action")
         success = file_info.get("success", False)
+        self._resolve(action)
         
         if action == "upload" and success:
             logger.info(f"📎 {self.name} uploaded: {filename} → {file_id}")
@@ -106,8 +191,9 @@ async def demonstrate_basic_features(agents: Dict[str, InteractiveAgent]):
     
     # 1. List channels
     logger.info("1️⃣ Listing available channels...")
+    listed = pm.expect("channels")
     await pm.adapter.list_channels()
-    await asyncio.sleep(2)
+    await pm.wait_for("channels", listed)
     
     # 2. Channel messaging
     logger.info("2️⃣ Sending channel messages...")
@@ -115,29 +201,29 @@ async def demonstrate_basic_features(agents: Dict[str, InteractiveAgent]):
         channel="general",
         text="🚀 Welcome to the Thread Messaging demo! Let's explore the features."
     )
-    await asyncio.sleep(1)
     
     await dev.adapter.send_channel_message(
         channel="development",
         text="Working on the new threading system. Looking forward to testing it!",
         target_agent="qa_tester"  # Mention QA
     )
-    await asyncio.sleep(1)
     
     # 3. Direct messaging
     logger.info("3️⃣ Sending direct messages...")
+    # Each reply waits for the message it answers to be stored, and uses its ID
+    status_request = "Can you provide a status update on the threading implementation?"
     await pm.adapter.send_direct_message(
         target_agent_id="developer_alice",
-        text="Can you provide a status update on the threading implementation?"
+        text=status_request
     )
-    await asyncio.sleep(1)
+    request = await pm.find_sent(status_request, target_agent_id="developer_alice")
     
-    await dev.adapter.reply_direct_message(
-        target_agent_id="project_manager",
-        reply_to_id="msg_1",
-        text="Making great progress! The core threading logic is complete."
-    )
-    await asyncio.sleep(1)
+    if request:
+        await dev.adapter.reply_direct_message(
+            target_agent_id="project_manager",
+            reply_to_id=request["message_id"],
+            text="Making great progress! The core threading logic is complete."
+        )
     
     # 4. File operations (create a sample file)
     logger.info("4️⃣ Uploading files...")
@@ -158,47 +244,57 @@ async def demonstrate_basic_features(agents: Dict[str, InteractiveAgent]):
         "- Documentation updates\n"
     )
     
+    uploaded = dev.expect("upload")
     await dev.adapter.upload_file(str(sample_file))
-    await asyncio.sleep(2)
+    await dev.wait_for("upload", uploaded)
     
     # 5. Thread creation and replies
     logger.info("5️⃣ Creating threaded conversations...")
+    question_text = "Should we test the threading system with edge cases like very long messages?"
     await qa.adapter.send_channel_message(
         channel="development",
-        text="Should we test the threading system with edge cases like very long messages?"
+        text=question_text
     )
-    await asyncio.sleep(1)
+    question = await qa.find_sent(question_text, channel="development")
     
-    await dev.adapter.reply_channel_message(
-        channel="development",
-        reply_to_id="msg_2",
-        text="Absolutely! We should test with various message lengths and special characters."
-    )
-    await asyncio.sleep(1)
+    answer = None
+    if question:
+        answer_text = "Absolutely! We should test with various message lengths and special characters."
+        await dev.adapter.reply_channel_message(
+            channel="development",
+            reply_to_id=question["message_id"],
+            text=answer_text
+        )
+        answer = await dev.find_sent(answer_text, channel="development")
     
-    await support.adapter.reply_channel_message(
-        channel="development",
-        reply_to_id="msg_3",
-        text="I can help with edge case testing from a user perspective.",
-        quote="msg_2"  # Quote the original question
-    )
-    await asyncio.sleep(1)
+    if answer:
+        offer_text = "I can help with edge case testing from a user perspective."
+        await support.adapter.reply_channel_message(
+            channel="development",
+            reply_to_id=answer["message_id"],
+            text=offer_text,
+            quote=question["message_id"]  # Quote the original question
+        )
+        # Stored before the history below is retrieved
+        await support.find_sent(offer_text, channel="development")
     
     # 6. Message retrieval
     logger.info("6️⃣ Retrieving message history...")
+    retrieved = pm.expect("channel_messages")
     await pm.adapter.retrieve_channel_messages(
         channel="development",
         limit=10,
         include_threads=True
     )
-    await asyncio.sleep(2)
+    await pm.wait_for("channel_messages", retrieved)
     
+    retrieved = pm.expect("direct_messages")
     await pm.adapter.retrieve_direct_messages(
         target_agent_id="developer_alice",
         limit=5,
         include_threads=True
     )
-    await asyncio.sleep(2)
+    await pm.wait_for("direct_messages", retrieved)
     
     # Cleanup
     if sample_file.exists():
@@ -207,7 +303,40 @@ async def demonstrate_basic_features(agents: Dict[str, InteractiveAgent]):
     logger.info("✅ Basic feature demonstration complete!")
 
 
-async def interactive_mode(agents: Dict[str, InteractiveAgent]):
+def _read_input(input_queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> None:
+    """Read stdin lines on a daemon thread and pass them to the event loop.
+    
+    Puts None on the queue when stdin is closed. The thread doesn't keep the
+    process alive at shutdown, unlike a blocked input() in the default executor.
+    Lines are read through an unbuffered view of the stdin descriptor, because a
+    read blocked on sys.stdin holds its buffer lock and aborts interpreter shutdown.
+    """
+    stream = io.TextIOWrapper(io.FileIO(sys.stdin.fileno(), closefd=False), encoding=sys.stdin.encoding)
+    while True:
+        try:
+            line = stream.readline()
+        except (OSError, ValueError):
+            line = ""
+        # readline() returns "" only at end of input
+        line = line.rstrip("\r\n") if line else None
+        
+        try:
+            loop.call_soon_threadsafe(input_queue.put_nowait, line)
+        except RuntimeError:
+            # Event loop already closed
+            return
+        
+        if line is None:
+            return
+
+
+async def prompt(input_queue: asyncio.Queue, text: str) -> Optional[str]:
+    """Show a prompt and wait for the next line, or None once stdin is closed."""
+    print(text, end="", flush=True)
+    return await input_queue.get()
+
+
+async def interactive_mode(agents: Dict[str, InteractiveAgent], input_queue: asyncio.Queue):
     """Run interactive mode where users can send messages."""
     logger.info("\n🎮 Interactive Mode")
     logger.info("Available agents: " + ", ".join(agents.keys()))
@@ -222,7 +351,10 @@ async def interactive_mode(agents: Dict[str, InteractiveAgent]):
     
     while True:
         try:
-            command = input("💭 Enter command: ").strip()
+            line = await prompt(input_queue, "💭 Enter command: ")
+            if line is None:
+                break
+            command = line.strip()
             
             if command == "quit":
                 break
@@ -253,23 +385,27 @@ async def interactive_mode(agents: Dict[str, InteractiveAgent]):
             elif cmd_type == "list" and len(parts) >= 2:
                 agent_id = parts[1]
                 if agent_id in agents:
-                    await agents[agent_id].adapter.list_channels()
+                    agent = agents[agent_id]
+                    listed = agent.expect("channels")
+                    await agent.adapter.list_channels()
                     print("✅ Channel list requested")
+                    await agent.wait_for("channels", listed, timeout=1.0)
                 else:
                     print(f"❌ Unknown agent: {agent_id}")
                     
             elif cmd_type == "retrieve" and len(parts) >= 3:
                 agent_id, channel = parts[1], parts[2]
                 if agent_id in agents:
-                    await agents[agent_id].adapter.retrieve_channel_messages(channel, limit=10)
-                    print(f"✅ Retrieved messages from #{channel}")
+                    agent = agents[agent_id]
+                    retrieved = agent.expect("channel_messages")
+                    await agent.adapter.retrieve_channel_messages(channel, limit=10)
+                    if await agent.wait_for("channel_messages", retrieved, timeout=1.0):
+                        print(f"✅ Retrieved messages from #{channel}")
                 else:
                     print(f"❌ Unknown agent: {agent_id}")
                     
             else:
                 print("❌ Invalid command format")
-                
-            await asyncio.sleep(0.5)
             
         except KeyboardInterrupt:
             break
@@ -290,32 +426,46 @@ async def main():
         "qa": InteractiveAgent("qa_tester", "QA Tester", "qa")
     }
     
+    # Read stdin on a daemon thread so the agents stay responsive meanwhile
+    loop = asyncio.get_running_loop()
+    input_queue: asyncio.Queue = asyncio.Queue()
+    threading.Thread(target=_read_input, args=(input_queue, loop), daemon=True).start()
+    
     # Setup signal handlers
-    def signal_handler(signum, frame):
-        logger.info("🛑 Received shutdown signal")
+    def shutdown():
         for agent in agents.values():
             asyncio.create_task(agent.disconnect())
+        # End any prompt as if stdin had been closed
+        input_queue.put_nowait(None)
+    
+    def signal_handler(signum, frame):
+        logger.info("🛑 Received shutdown signal")
+        # Schedule through the loop's wakeup pipe; a plain signal handler doesn't wake the loop
+        loop.call_soon_threadsafe(shutdown)
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
     try:
-        # Initialize agents
+        # Initialize all agents concurrently
         logger.info("🔧 Initializing agents...")
-        for agent in agents.values():
-            await agent.initialize()
-            await asyncio.sleep(0.5)
+        results = await asyncio.gather(
+            *(agent.initialize() for agent in agents.values()),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
         
         logger.info(f"✅ All {len(agents)} agents connected")
-        await asyncio.sleep(1)
         
         # Run feature demonstration
         await demonstrate_basic_features(agents)
         
         # Ask if user wants interactive mode
-        choice = input("\n🎮 Enter interactive mode? (y/N): ").strip().lower()
+        choice = (await prompt(input_queue, "\n🎮 Enter interactive mode? (y/N): ") or "").strip().lower()
         if choice in ['y', 'yes']:
-            await interactive_mode(agents)
+            await interactive_mode(agents, input_queue)
         
     except Exception as e:
         logger.error(f"❌ Error: {e}")
@@ -323,13 +473,25 @@ async def main():
         
     finally:
         logger.info("🧹 Cleaning up...")
-        for agent in agents.values():
-            await agent.disconnect()
+        await asyncio.gather(
+            *(agent.disconnect() for agent in agents.values()),
+            return_exceptions=True
+        )
         logger.info("👋 Goodbye!")
     
     return 0
 
 
 if __name__ == "__main__":
+    # Use uvloop when available for lower socket overhead
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
     exit_code = asyncio.run(main())
-    exit(exit_code)
+    # sys.exit rather than the exit() builtin, which closes stdin and would
+    # wait on the reader thread's pending read
+    sys.exit(exit_code)
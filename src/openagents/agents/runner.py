@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 import asyncio
+import heapq
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from openagents.core.base_mod_adapter import BaseModAdapter
 from openagents.models.message_thread import MessageThread
@@ -14,6 +16,9 @@ from openagents.utils.verbose import verbose_print
 
 logger = logging.getLogger(__name__)
 
+# Number of processed message IDs remembered before the oldest are forgotten
+MAX_PROCESSED_MESSAGE_IDS = 100_000
+
 class AgentRunner(ABC):
     """Base class for agent runners in OpenAgents.
     
@@ -22,7 +27,7 @@ class AgentRunner(ABC):
     agent should respond to messages and interact with protocols.
     """
 
-    def __init__(self, agent_id: Optional[str] = None, mod_names: Optional[List[str]] = None, mod_adapters: Optional[List[BaseModAdapter]] = None, client: Optional[AgentClient] = None, interval: Optional[int] = 1, ignored_sender_ids: Optional[List[str]] = None):
+    def __init__(self, agent_id: Optional[str] = None, mod_names: Optional[List[str]] = None, mod_adapters: Optional[List[BaseModAdapter]] = None, client: Optional[AgentClient] = None, interval: Optional[int] = 1, ignored_sender_ids: Optional[List[str]] = None, event_loop_policy: Optional[asyncio.AbstractEventLoopPolicy] = None, use_uvloop: bool = False):
         """Initialize the agent runner.
         
         Args:
@@ -32,6 +37,8 @@ class AgentRunner(ABC):
             client: Agent client to use for the agent. Optional, if provided, the runner will use the client to obtain required mod adapters.
             interval: Interval in seconds between checking for new messages.
             ignored_sender_ids: List of sender IDs to ignore.
+            event_loop_policy: Event loop policy installed by the synchronous start() wrapper. Optional, by default the current policy is left alone.
+            use_uvloop: Whether start() should install uvloop's event loop policy when no event_loop_policy is given.
             
         Note:
             Either mod_names or mod_adapters should be provided, not both.
@@ -42,9 +49,18 @@ class AgentRunner(ABC):
         self._tools = []
         self._supported_mods = None
         self._running = False
-        self._processed_message_ids = set()
+        self._processed_message_ids: Set[str] = set()
+        self._processed_order: Deque[str] = deque()  # Processed IDs in the order they were processed
+        # Unprocessed messages as (timestamp, message_id, thread_id, message), earliest first
+        self._pending_heap: List[Tuple[int, str, str, BaseMessage]] = []
+        self._pending_ids: Set[str] = set()
         self._interval = interval
         self._ignored_sender_ids = set(ignored_sender_ids) if ignored_sender_ids is not None else set()
+        self._event_loop_policy = event_loop_policy
+        self._use_uvloop = use_uvloop
+        # Created inside the running loop, since events bind to a loop on Python < 3.10
+        self._wake: Optional[asyncio.Event] = None
+        self._stopped_event: Optional[asyncio.Event] = None
         
         # Validate that mod_names and mod_adapters are not both provided
         if mod_names is not None and mod_adapters is not None:
@@ -65,6 +81,53 @@ class AgentRunner(ABC):
         # Update tools if we have mod information
         if self._supported_mods is not None:
             self.update_tools()
+        
+        # Wake the loop as soon as a mod adapter receives a message
+        self._network_client.register_thread_listener(self._on_thread_message)
+    
+    def notify_new_message(self):
+        """Wake the main loop to look for unprocessed messages."""
+        if self._wake is not None:
+            self._wake.set()
+    
+    def _on_thread_message(self, thread_id: str, message: BaseMessage):
+        """Thread listener registered with the client for newly added messages."""
+        self._enqueue_pending(thread_id, message)
+        self.notify_new_message()
+    
+    def _enqueue_pending(self, thread_id: str, message: BaseMessage):
+        """Queue a message for processing unless it is already queued or processed."""
+        message_id = str(message.message_id)
+        if message_id in self._pending_ids or message_id in self._processed_message_ids:
+            return
+        self._pending_ids.add(message_id)
+        heapq.heappush(self._pending_heap, (message.timestamp, message_id, thread_id, message))
+    
+    def _mark_processed(self, message_id: str):
+        """Remember a processed message, forgetting the earliest processed ID once the cap is reached.
+        
+        Messages reach the queue once, through the thread listener, so a forgotten
+        ID is only seen again by the start-up backfill of a restarted loop.
+        """
+        if message_id in self._processed_message_ids:
+            return
+        if len(self._processed_order) >= MAX_PROCESSED_MESSAGE_IDS:
+            self._processed_message_ids.discard(self._processed_order.popleft())
+        self._processed_message_ids.add(message_id)
+        self._processed_order.append(message_id)
+    
+    def _pop_pending(self) -> Optional[Tuple[str, BaseMessage]]:
+        """Pop the earliest queued message that hasn't been processed yet.
+        
+        Returns:
+            Optional[Tuple[str, BaseMessage]]: The thread ID and message, or None if nothing is queued
+        """
+        while self._pending_heap:
+            _, message_id, thread_id, message = heapq.heappop(self._pending_heap)
+            self._pending_ids.discard(message_id)
+            if message_id not in self._processed_message_ids:
+                return thread_id, message
+        return None
     
     def update_tools(self):
         """Update the tools available to the agent.
@@ -137,66 +200,50 @@ class AgentRunner(ABC):
         This is the internal async implementation that should not be called directly.
         """
         # print(f"🔄 Agent loop starting for {self._agent_id}...")
+        self._wake = asyncio.Event()
         try:    
+            # Queue messages that arrived before the loop started; later ones come via the thread listener
+            for thread_id, thread in self.client.get_messsage_threads().items():
+                for message in thread.messages:
+                    self._enqueue_pending(thread_id, message)
+            
             while self._running:
-                # Get all message threads from the client
-                message_threads = self.client.get_messsage_threads()
-                # print(f"🔍 Checking for messages... Found {len(message_threads)} threads")
+                # Clear before checking; a message added after this point sets it again
+                self._wake.clear()
                 
-                # Find the first unprocessed message across all threads
-                unprocessed_message = None
-                unprocessed_thread_id = None
-                earliest_timestamp = float('inf')
-                
-                total_messages = 0
-                unprocessed_count = 0
-                
-                for thread_id, thread in message_threads.items():
-                    # print(f"   Thread {thread_id}: {len(thread.messages)} messages")
-                    for message in thread.messages:
-                        total_messages += 1
-                        # Check if message hasn't been processed (regardless of requires_response)
-                        message_id = str(message.message_id)
-                        # print(f"     Message {message_id[:8]}... from {message.sender_id}, requires_response={message.requires_response}, processed={message_id in self._processed_message_ids}")
-                        if message_id not in self._processed_message_ids:
-                            unprocessed_count += 1
-                            # Find the earliest unprocessed message by timestamp
-                            if message.timestamp < earliest_timestamp:
-                                earliest_timestamp = message.timestamp
-                                unprocessed_message = message
-                                unprocessed_thread_id = thread_id
-                
-                # print(f"📊 Total messages: {total_messages}, Unprocessed: {unprocessed_count}")
+                # Take the earliest unprocessed message across all threads
+                pending = self._pop_pending()
                 
                 # If we found an unprocessed message, process it
-                if unprocessed_message and unprocessed_thread_id:
-                    # print(f"🎯 Processing message {unprocessed_message.message_id[:8]}... from {unprocessed_message.sender_id}")
+                if pending:
+                    unprocessed_thread_id, unprocessed_message = pending
                     # Mark the message as processed to avoid processing it again
-                    self._processed_message_ids.add(str(unprocessed_message.message_id))
+                    self._mark_processed(str(unprocessed_message.message_id))
 
                     # If the sender is in the ignored list, skip the message
                     if unprocessed_message.sender_id in self._ignored_sender_ids:
-                        # print(f"⏭️  Skipping message from ignored sender {unprocessed_message.sender_id}")
                         continue
                     
+                    message_threads = self.client.get_messsage_threads()
                     # Create a copy of conversation threads that doesn't include future messages
                     current_time = unprocessed_message.timestamp
                     filtered_threads = {}
                     
                     for thread_id, thread in message_threads.items():
-                        # Create a new thread with only messages up to the current message's timestamp
+                        # Create a new thread with only messages up to the current message's timestamp;
+                        # threads are ordered by timestamp, so this is a prefix of the messages
                         filtered_thread = MessageThread()
-                        filtered_thread.messages = [
-                            msg for msg in thread.messages 
-                            if msg.timestamp <= current_time
-                        ]
+                        filtered_thread.messages = thread.messages[:thread.count_until(current_time)]
                         filtered_threads[thread_id] = filtered_thread
                     
                     # Call react with the filtered threads and the unprocessed message
                     await self.react(filtered_threads, unprocessed_thread_id, unprocessed_message)
                 else:
-                    await asyncio.sleep(self._interval or 1)
-                    # print("😴 No unprocessed messages found, sleeping...")
+                    # Sleep until a new message arrives, with the interval as a safety tick
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=self._interval or 1)
+                    except asyncio.TimeoutError:
+                        pass
                 
         except Exception as e:
             verbose_print(f"💥 Agent loop interrupted by exception: {e}")
@@ -268,6 +315,8 @@ class AgentRunner(ABC):
                 verbose_print(f"🔄 Using existing protocols: {self._supported_mods}")
             
             self._running = True
+            if self._stopped_event is not None:
+                self._stopped_event.clear()
             # Start the loop in a background task
             self._loop_task = asyncio.create_task(self._async_loop())
             # Setup the agent
@@ -285,23 +334,11 @@ class AgentRunner(ABC):
         This is the internal async implementation that should not be called directly.
         """
         try:
-            # Create a future that will be completed when the agent is stopped
-            stop_future = asyncio.get_event_loop().create_future()
-            
-            # Define a task to check if the agent is still running
-            async def check_running():
-                while self._running:
-                    await asyncio.sleep(0.1)
-                stop_future.set_result(None)
-            
-            # Start the checking task
-            check_task = asyncio.create_task(check_running())
-            
-            # Wait for the future to complete (when the agent stops)
-            await stop_future
-            
-            # Clean up the task
-            check_task.cancel()
+            if self._stopped_event is None:
+                self._stopped_event = asyncio.Event()
+            # Wait until _async_stop sets the event
+            if self._running:
+                await self._stopped_event.wait()
         except KeyboardInterrupt:
             # Handle keyboard interrupt by stopping the agent
             await self._async_stop()
@@ -343,6 +380,8 @@ class AgentRunner(ABC):
             logger.error(f"Error tearing down agent: {e}")
         
         self._running = False
+        if self._stopped_event is not None:
+            self._stopped_event.set()
         if hasattr(self, '_loop_task') and self._loop_task:
             try:
                 self._loop_task.cancel()
@@ -358,6 +397,25 @@ class AgentRunner(ABC):
         """
         await self._async_stop()
     
+    def _install_event_loop_policy(self):
+        """Install the event loop policy the caller asked for, if any.
+        
+        Nothing global is changed unless event_loop_policy or use_uvloop was given to the
+        constructor. Only start() calls this, so wait_for_stop() and stop() keep using the
+        loop that start() ran on.
+        """
+        if self._event_loop_policy is None and self._use_uvloop:
+            try:
+                import uvloop
+            except ImportError:
+                logger.warning("use_uvloop was set but uvloop is not installed, keeping the current event loop policy")
+                return
+            self._event_loop_policy = uvloop.EventLoopPolicy()
+        
+        if self._event_loop_policy is None or asyncio.get_event_loop_policy() is self._event_loop_policy:
+            return
+        asyncio.set_event_loop_policy(self._event_loop_policy)
+    
     def start(self, host: Optional[str] = None, port: Optional[int] = None, network_id: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
         """Start the agent runner.
         
@@ -370,6 +428,7 @@ class AgentRunner(ABC):
             network_id: Network ID
             metadata: Additional metadata
         """
+        self._install_event_loop_policy()
         # Create a new event loop if one doesn't exist
         try:
             loop = asyncio.get_event_loop()
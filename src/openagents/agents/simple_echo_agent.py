@@ -36,23 +36,23 @@ class SimpleEchoAgentRunner(AgentRunner):
             incoming_thread_id: ID of the thread containing the incoming message
             incoming_message: The incoming message to react to
         """
-        logger.info(f"🎯 Echo agent received message from {incoming_message.sender_id}")
-        logger.info(f"   Message type: {type(incoming_message).__name__}")
-        logger.info(f"   Content: {incoming_message.content}")
+        logger.info("🎯 Echo agent received message from %s", incoming_message.sender_id)
+        logger.info("   Message type: %s", type(incoming_message).__name__)
+        logger.info("   Content: %s", incoming_message.content)
         
         self.message_count += 1
         sender_id = incoming_message.sender_id
         content = incoming_message.content
         
-        # Extract text from content
+        # Extract text from content (only stringify the whole content as a fallback)
         if isinstance(content, dict):
-            text = content.get("text", str(content))
+            text = content["text"] if "text" in content else str(content)
         else:
             text = str(content)
         
         # Handle different message types
         if isinstance(incoming_message, DirectMessage):
-            logger.info(f"Processing direct message from {sender_id}")
+            logger.info("Processing direct message from %s", sender_id)
             
             # Create echo response
             echo_text = f"{self.echo_prefix}: {text}"
@@ -68,10 +68,10 @@ class SimpleEchoAgentRunner(AgentRunner):
             
             # Send the echo message back
             await self.client.send_direct_message(echo_message)
-            logger.info(f"✅ Sent echo message back to {sender_id}: {echo_text}")
+            logger.info("✅ Sent echo message back to %s: %s", sender_id, echo_text)
             
         elif isinstance(incoming_message, BroadcastMessage):
-            logger.info(f"Processing broadcast message from {sender_id}")
+            logger.info("Processing broadcast message from %s", sender_id)
             
             # Respond to greetings in broadcast messages
             if "hello" in text.lower() and sender_id != self.client.agent_id:
@@ -86,9 +86,9 @@ class SimpleEchoAgentRunner(AgentRunner):
                     requires_response=False
                 )
                 await self.client.send_direct_message(greeting_message)
-                logger.info(f"✅ Sent greeting message to {sender_id}")
+                logger.info("✅ Sent greeting message to %s", sender_id)
         else:
-            logger.info(f"Received unknown message type: {type(incoming_message).__name__}")
+            logger.info("Received unknown message type: %s", type(incoming_message).__name__)
 
     async def setup(self):
         """Setup the agent after connection.
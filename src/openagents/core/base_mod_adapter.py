@@ -1,10 +1,13 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from abc import ABC, abstractmethod
+import logging
 from openagents.models.messages import BaseMessage, DirectMessage, BroadcastMessage, ModMessage
 from openagents.models.tool import AgentAdapterTool
 from openagents.core.connector import NetworkConnector
 from openagents.models.message_thread import MessageThread
 
+logger = logging.getLogger(__name__)
+
 class BaseModAdapter(ABC):
     """Base class for agent adapter level mods in OpenAgents.
     
@@ -22,6 +25,7 @@ class BaseModAdapter(ABC):
         self._agent_id = None
         self._connector = None
         self._message_threads: Dict[str, MessageThread] = {}
+        self._thread_listeners: List[Callable[[str, BaseMessage], None]] = []
 
     def bind_agent(self, agent_id: str) -> None:
         """Bind this mod adapter to an agent.
@@ -39,6 +43,15 @@ class BaseModAdapter(ABC):
         """
         self._connector = connector
     
+    def register_thread_listener(self, listener: Callable[[str, BaseMessage], None]) -> None:
+        """Register a listener called whenever a message is added to a thread.
+        
+        Args:
+            listener: Function called with the thread ID and the added message
+        """
+        if listener not in self._thread_listeners:
+            self._thread_listeners.append(listener)
+    
     @property
     def message_threads(self) -> Dict[str, MessageThread]:
         """Get the message threads for the mod adapter.
@@ -117,6 +130,12 @@ class BaseModAdapter(ABC):
             message.text_representation = text_representation
             
         self._message_threads[thread_id].add_message(message)
+        
+        for listener in self._thread_listeners:
+            try:
+                listener(thread_id, message)
+            except Exception as e:
+                logger.error(f"Error in thread listener: {e}")
     
     async def process_incoming_direct_message(self, message: DirectMessage) -> Optional[DirectMessage]:
         """Process an incoming message sent to this agent.
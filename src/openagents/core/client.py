@@ -31,9 +31,12 @@ class AgentClient:
         self.agent_id = agent_id or "Agent-" + str(uuid.uuid4())[:8]
         self.mod_adapters: Dict[str, BaseModAdapter] = {}
         self.connector: Optional[NetworkConnector] = None
+        self._network_id: Optional[str] = None  # Network ID the current connector was opened with
         self._agent_list_callbacks: List[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = []
         self._mod_list_callbacks: List[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = []
         self._mod_manifest_callbacks: List[Callable[[Dict[str, Any]], Awaitable[None]]] = []
+        self._message_handlers: Dict[str, List[Callable[[BaseMessage], Awaitable[None]]]] = {}
+        self._thread_listeners: List[Callable[[str, BaseMessage], None]] = []
 
         # Register mod adapters if provided
         if mod_adapters:
@@ -69,12 +72,24 @@ class AgentClient:
             port = network_profile.get("port", port)
             logger.info(f"Retrieved network details for network_id: {network_id}, host: {host}, port: {port}")
 
+        # Reuse the live connection if it was opened with the same parameters,
+        # avoiding a websocket reconnect and re-registration per call. Other
+        # metadata or a different network means registering again.
+        if (self.connector is not None and self.connector.is_connected
+                and self.connector.host == host and self.connector.port == port
+                and self._network_id == network_id
+                and self.connector.metadata == metadata
+                and self.connector.max_message_size == max_message_size):
+            logger.debug(f"Agent {self.agent_id} already connected to {host}:{port}, reusing connection")
+            return True
+
         if self.connector is not None:
             logger.info(f"Disconnecting from existing network connection for agent {self.agent_id}")
             await self.disconnect()
             self.connector = None
         
         self.connector = NetworkConnector(host, port, self.agent_id, metadata, max_message_size)
+        self._network_id = network_id
 
         # Connect using the connector
         success = await self.connector.connect_to_server()
@@ -90,6 +105,11 @@ class AgentClient:
             self.connector.register_message_handler("broadcast_message", self._handle_broadcast_message)
             self.connector.register_message_handler("mod_message", self._handle_mod_message)
             
+            # Register user message handlers added via on_message
+            for message_type, handlers in self._message_handlers.items():
+                for handler in handlers:
+                    self.connector.register_message_handler(message_type, handler)
+            
             # Register system command handlers
             self.connector.register_system_handler(LIST_AGENTS, self._handle_list_agents_response)
             self.connector.register_system_handler(LIST_MODS, self._handle_list_mods_response)
@@ -116,6 +136,8 @@ class AgentClient:
     
     async def disconnect(self) -> bool:
         """Disconnect from the network server."""
+        if self.connector is None:
+            return False
         for mod_adapter in self.mod_adapters.values():
             mod_adapter.on_disconnect()
         return await self.connector.disconnect()
@@ -137,6 +159,8 @@ class AgentClient:
         
         # Bind the agent to the mod
         mod_adapter.bind_agent(self.agent_id)
+        for listener in self._thread_listeners:
+            mod_adapter.register_thread_listener(listener)
         
         self.mod_adapters[mod_name] = mod_adapter
         mod_adapter.initialize()
@@ -146,6 +170,22 @@ class AgentClient:
         logger.info(f"Registered mod adapter {mod_name} with agent {self.agent_id}")
         return True
     
+    def on_message(self, message_type: str, handler: Callable[[BaseMessage], Awaitable[None]]) -> None:
+        """Register a handler for incoming messages of a specific type.
+        
+        Handlers can be registered before connecting; they are attached to the
+        connector when the connection is established and dispatched by message type.
+        
+        Args:
+            message_type: Type of message to handle (e.g. "direct_message")
+            handler: Async function to call when a message of this type is received
+        """
+        handlers = self._message_handlers.setdefault(message_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+        if self.connector is not None:
+            self.connector.register_message_handler(message_type, handler)
+    
     def unregister_mod_adapter(self, mod_name: str) -> bool:
         """Unregister a mod adapter from this agent.
         
@@ -485,6 +525,20 @@ class AgentClient:
         
         return threads
     
+    def register_thread_listener(self, listener: Callable[[str, BaseMessage], None]) -> None:
+        """Register a listener called whenever a mod adapter adds a message to a thread.
+        
+        The listener is attached to all current mod adapters and to any registered later.
+        
+        Args:
+            listener: Function called with the thread ID and the added message
+        """
+        if listener in self._thread_listeners:
+            return
+        self._thread_listeners.append(listener)
+        for mod_adapter in self.mod_adapters.values():
+            mod_adapter.register_thread_listener(listener)
+    
     def register_agent_list_callback(self, callback: Callable[[List[Dict[str, Any]]], Awaitable[None]]) -> None:
         """Register a callback for agent list responses.
         
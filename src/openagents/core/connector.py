@@ -1,11 +1,11 @@
 from typing import Dict, Any, Optional, Callable, Awaitable, List, Set
 import logging
-import json
 import asyncio
 import time
 import websockets
 from websockets.asyncio.client import connect
 from websockets.exceptions import ConnectionClosed
+from openagents.utils.json import json_dumps, json_loads
 from openagents.utils.message_util import parse_message_dict
 from openagents.models.messages import BaseMessage, BroadcastMessage, DirectMessage, ModMessage
 from .system_commands import send_system_request as send_system_request_impl
@@ -53,7 +53,10 @@ class NetworkConnector:
             bool: True if connection successful
         """
         try:
-            self.connection = await connect(f"ws://{self.host}:{self.port}", max_size=self.max_message_size)
+            # Agent frames are small JSON documents, so skip per-message deflate
+            self.connection = await connect(
+                f"ws://{self.host}:{self.port}", max_size=self.max_message_size, compression=None
+            )
             
             # Register with server using system_request
             await send_system_request_impl(
@@ -65,7 +68,7 @@ class NetworkConnector:
             
             # Wait for registration response
             response = await self.connection.recv()
-            data = json.loads(response)
+            data = json_loads(response)
             
             if data.get("type") == "system_response" and data.get("command") == REGISTER_AGENT and data.get("success"):
                 self.is_connected = True
@@ -160,11 +163,12 @@ class NetworkConnector:
         """Listen for messages from the server."""
         try:
             while self.is_connected:
-                message = await self.connection.recv()
-                data = json.loads(message)
+                message = await self.connection.recv(decode=False)
+                data = json_loads(message)
+                frame_type = data.get("type")
                 
                 # Handle different message types
-                if data.get("type") == "message":
+                if frame_type == "message":
                     message_data = data.get("data", {})
                     message_obj = parse_message_dict(message_data)
                     
@@ -174,7 +178,7 @@ class NetworkConnector:
                     await self.consume_message(message_obj)
                 
                 # Handle system responses
-                elif data.get("type") == "system_response":
+                elif frame_type == "system_response":
                     command = data.get("command")
                     if command in self.system_handlers:
                         await self.system_handlers[command](data)
@@ -182,7 +186,7 @@ class NetworkConnector:
                         logger.debug(f"Received system response for command {command}")
                 
                 # Handle system requests (like ping)
-                elif data.get("type") == "system_request":
+                elif frame_type == "system_request":
                     command = data.get("command")
                     if command == PING_AGENT:
                         # Respond to ping with pong
@@ -193,7 +197,7 @@ class NetworkConnector:
                             "timestamp": data.get("timestamp", time.time()),
                             "agent_id": self.agent_id  # Include agent_id for tracking
                         }
-                        await self.connection.send(json.dumps(pong_response))
+                        await self.connection.send(json_dumps(pong_response), text=True)
                         logger.debug(f"Agent {self.agent_id} responded to heartbeat ping from server")
                     else:
                         logger.debug(f"Received unhandled system request: {command}")
@@ -246,10 +250,10 @@ class NetworkConnector:
                 message.relevant_agent_id = self.agent_id
                 
             # Send the message
-            await self.connection.send(json.dumps({
+            await self.connection.send(json_dumps({
                 "type": "message",
                 "data": message.model_dump()
-            }))
+            }), text=True)
             
             logger.debug(f"Message sent: {message.message_id}")
             return True
@@ -6,7 +6,6 @@ abstractions for milestone 1.
 """
 
 import asyncio
-import json
 import logging
 import uuid
 import time
@@ -15,6 +14,7 @@ from typing import Dict, Any, List, Optional, Callable, Awaitable, Union
 from pathlib import Path
 
 from .transport import Transport, TransportManager, Message
+from openagents.utils.json import json_dumps
 from openagents.models.transport import TransportType
 from .topology import NetworkTopology, NetworkMode, AgentInfo, create_topology
 from ..models.messages import BaseMessage, DirectMessage, BroadcastMessage, ModMessage
@@ -62,6 +62,8 @@ class AgentNetwork:
         # Network state
         self.is_running = False
         self.start_time: Optional[float] = None
+        # Set by shutdown(); created in the running loop, as events bind to a loop on Python < 3.10
+        self._shutdown_event: Optional[asyncio.Event] = None
         
         # Connection management
         self.connections: Dict[str, AgentConnection] = {}
@@ -222,6 +224,8 @@ class AgentNetwork:
             
             self.is_running = True
             self.start_time = time.time()
+            if self._shutdown_event is not None:
+                self._shutdown_event.clear()
             
             # Start heartbeat monitoring
             self.heartbeat_task = asyncio.create_task(self._heartbeat_monitor())
@@ -240,6 +244,8 @@ class AgentNetwork:
         """
         try:
             self.is_running = False
+            if self._shutdown_event is not None:
+                self._shutdown_event.set()
             
             # Stop heartbeat monitoring
             if self.heartbeat_task:
@@ -262,6 +268,16 @@ class AgentNetwork:
             logger.error(f"Failed to shutdown agent network: {e}")
             return False
     
+    async def wait_for_shutdown(self) -> None:
+        """Wait until the network has been shut down.
+        
+        Returns immediately if the network is not running.
+        """
+        if self._shutdown_event is None:
+            self._shutdown_event = asyncio.Event()
+        if self.is_running:
+            await self._shutdown_event.wait()
+    
     async def register_agent(self, agent_id: str, metadata: Dict[str, Any]) -> bool:
         """Register an agent with the network.
         
@@ -466,12 +482,13 @@ class AgentNetwork:
             message: Transport message to handle
         """
         try:
-            logger.debug(f"_handle_transport_message called: id={message.message_id}, type={message.message_type}, available_handlers={list(self.message_handlers.keys())}")
+            logger.debug("_handle_transport_message called: id=%s, type=%s, available_handlers=%s",
+                         message.message_id, message.message_type, list(self.message_handlers))
             # Check if this message needs to be routed to a specific target
             target = message.target_id or getattr(message, 'target_agent_id', None)
             if target and target != message.sender_id:
                 # Route to target agent (direct messages)
-                logger.debug(f"Routing message {message.message_id} to target agent {target}")
+                logger.debug("Routing message %s to target agent %s", message.message_id, target)
                 success = await self.topology.route_message(message)
                 if not success:
                     logger.warning(f"Failed to route message {message.message_id} to {target}")
@@ -479,18 +496,18 @@ class AgentNetwork:
                 # Handle broadcast messages or local messages
                 if message.message_type == "broadcast_message":
                     # Route broadcast message to all connected agents
-                    logger.debug(f"Routing broadcast message {message.message_id} to all agents")
+                    logger.debug("Routing broadcast message %s to all agents", message.message_id)
                     success = await self.topology.route_message(message)
                     if not success:
                         logger.warning(f"Failed to route broadcast message {message.message_id}")
                 
                 # Also notify local message handlers (for broadcast messages or local handling)
                 if message.message_type in self.message_handlers:
-                    logger.debug(f"Found {len(self.message_handlers[message.message_type])} handlers for {message.message_type}")
+                    logger.debug("Found %d handlers for %s", len(self.message_handlers[message.message_type]), message.message_type)
                     for handler in self.message_handlers[message.message_type]:
                         await handler(message)
                 else:
-                    logger.debug(f"No handlers found for message type {message.message_type}")
+                    logger.debug("No handlers found for message type %s", message.message_type)
         except Exception as e:
             logger.error(f"Error handling transport message: {e}")
     
@@ -501,16 +518,15 @@ class AgentNetwork:
             message: Transport message to route to network mods
         """
         try:
-            logger.debug(f"_handle_mod_message called with message: {message.message_id}, type: {message.message_type}")
-            logger.debug(f"Message attributes: content={hasattr(message, 'content')}, payload={hasattr(message, 'payload')}")
+            logger.debug("_handle_mod_message called with message: %s, type: %s", message.message_id, message.message_type)
             
             # The TransportMessage is already a ModMessage - we just need to extract the target mod name
             target_mod_name = message.mod
-            logger.debug(f"Target mod name: {target_mod_name}")
+            logger.debug("Target mod name: %s", target_mod_name)
             
             if target_mod_name and target_mod_name in self.mods:
                 network_mod = self.mods[target_mod_name]
-                logger.debug(f"Routing mod message {message.message_id} to network mod {target_mod_name}")
+                logger.debug("Routing mod message %s to network mod %s", message.message_id, target_mod_name)
                 await network_mod.process_mod_message(message)
             else:
                 logger.warning(f"No network mod found for {target_mod_name}, available mods: {list(self.mods.keys())}")
@@ -582,13 +598,10 @@ class AgentNetwork:
         Returns:
             WebSocket connection or None if not found
         """
-        print(f"🔍 Resolving connection for agent_id: {agent_id}")
-        print(f"   Available connections: {list(self.connections.keys())}")
         if agent_id in self.connections:
-            connection = self.connections[agent_id].connection
-            print(f"   ✅ Found connection for {agent_id}: {type(connection).__name__}")
-            return connection
-        print(f"   ❌ No connection found for {agent_id}")
+            return self.connections[agent_id].connection
+        logger.debug("No connection found for agent %s, available connections: %s",
+                     agent_id, list(self.connections))
         return None
     
     async def _notify_agent_handlers(self, agent_info: AgentInfo) -> None:
@@ -610,7 +623,7 @@ class AgentNetwork:
         
         while self.is_running:
             try:
-                current_time = asyncio.get_event_loop().time()
+                current_time = asyncio.get_running_loop().time()
                 stale_agents = []
                 
                 # Check all connected agents for activity
@@ -666,7 +679,7 @@ class AgentNetwork:
                 "agent_id": agent_id  # Add agent_id for tracking
             }
             
-            await connection.connection.send(json.dumps(ping_message))
+            await connection.connection.send(json_dumps(ping_message), text=True)
             
             # Wait for pong response (with timeout)
             try:
@@ -6,12 +6,13 @@ System commands are used for network operations like registration, listing agent
 """
 
 import logging
-import json
 import time
 from typing import Dict, Any, List, Optional, Callable, Awaitable, Union
 import asyncio
 from websockets.asyncio.server import ServerConnection
 
+from openagents.utils.json import json_dumps
+
 logger = logging.getLogger(__name__)
 
 # Type definitions
@@ -75,12 +76,12 @@ async def handle_register_agent(command: str, data: Dict[str, Any], connection:
     
     if not agent_id:
         logger.error("Registration message missing agent_id")
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "register_agent",
             "success": False,
             "error": "Missing agent_id"
-        }))
+        }), text=True)
         return
     
     # Check if agent is already registered
@@ -113,12 +114,12 @@ async def handle_register_agent(command: str, data: Dict[str, Any], connection:
                 error_msg += ". Use force_reconnect=true or provide valid certificate to override."
             
             logger.warning(f"Agent {agent_id} registration rejected: {error_msg}")
-            await connection.send(json.dumps({
+            await connection.send(json_dumps({
                 "type": "system_response",
                 "command": "register_agent",
                 "success": False,
                 "error": error_msg
-            }))
+            }), text=True)
             return
     
     logger.info(f"Received registration from agent {agent_id}")
@@ -129,21 +130,21 @@ async def handle_register_agent(command: str, data: Dict[str, Any], connection:
         agent_id=agent_id,
         connection=connection,
         metadata=metadata,
-        last_activity=asyncio.get_event_loop().time()
+        last_activity=asyncio.get_running_loop().time()
     )
     
     # Register agent metadata
     await network_instance.register_agent(agent_id, metadata)
     
     # Send registration response
-    await connection.send(json.dumps({
+    await connection.send(json_dumps({
         "type": "system_response",
         "command": "register_agent",
         "success": True,
         "network_name": network_instance.network_name,
         "network_id": network_instance.network_id,
         "metadata": network_instance.metadata
-    }))
+    }), text=True)
 
 
 async def handle_list_agents(command: str, data: Dict[str, Any], connection: ServerConnection,
@@ -175,12 +176,12 @@ async def handle_list_agents(command: str, data: Dict[str, Any], connection: Ser
         
     # Send response
     try:
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "list_agents",
             "success": True,
             "agents": agent_list
-        }))
+        }), text=True)
         logger.debug(f"Sent agent list to {requesting_agent_id}")
     except Exception as e:
         logger.error(f"Failed to send agent list to {requesting_agent_id}: {e}")
@@ -260,7 +261,7 @@ async def handle_list_mods(command: str, data: Dict[str, Any], connection: Serve
         if "request_id" in data:
             response["request_id"] = data["request_id"]
             
-        await connection.send(json.dumps(response))
+        await connection.send(json_dumps(response), text=True)
         logger.debug(f"Sent mod list to {requesting_agent_id}")
     except Exception as e:
         logger.error(f"Failed to send mod list to {requesting_agent_id}: {e}")
@@ -284,12 +285,12 @@ async def handle_get_mod_manifest(command: str, data: Dict[str, Any], connection
         return
     
     if not mod_name:
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "get_mod_manifest",
             "success": False,
             "error": "Missing mod_name parameter"
-        }))
+        }), text=True)
         return
     
     # Check if we have a manifest for this mod
@@ -299,13 +300,13 @@ async def handle_get_mod_manifest(command: str, data: Dict[str, Any], connection
         # Convert manifest to dict for JSON serialization
         manifest_dict = manifest.model_dump()
         
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "get_mod_manifest",
             "success": True,
             "mod_name": mod_name,
             "manifest": manifest_dict
-        }))
+        }), text=True)
         logger.debug(f"Sent mod manifest for {mod_name} to {requesting_agent_id}")
     else:
         # Try to load the manifest if it's not already loaded
@@ -315,22 +316,22 @@ async def handle_get_mod_manifest(command: str, data: Dict[str, Any], connection
             # Convert manifest to dict for JSON serialization
             manifest_dict = manifest.model_dump()
             
-            await connection.send(json.dumps({
+            await connection.send(json_dumps({
                 "type": "system_response",
                 "command": "get_mod_manifest",
                 "success": True,
                 "mod_name": mod_name,
                 "manifest": manifest_dict
-            }))
+            }), text=True)
             logger.debug(f"Loaded and sent mod manifest for {mod_name} to {requesting_agent_id}")
         else:
-            await connection.send(json.dumps({
+            await connection.send(json_dumps({
                 "type": "system_response",
                 "command": "get_mod_manifest",
                 "success": False,
                 "mod_name": mod_name,
                 "error": f"No manifest found for mod {mod_name}"
-            }))
+            }), text=True)
             logger.warning(f"No manifest found for mod {mod_name}")
 
 
@@ -381,7 +382,7 @@ async def handle_get_network_info(command: str, data: Dict[str, Any], connection
         if "request_id" in data:
             response["request_id"] = data["request_id"]
             
-        await connection.send(json.dumps(response))
+        await connection.send(json_dumps(response), text=True)
         logger.debug(f"Sent network info to {requesting_agent_id}")
     except Exception as e:
         logger.error(f"Failed to send network info to {requesting_agent_id}: {e}")
@@ -399,12 +400,12 @@ async def handle_ping_agent(command: str, data: Dict[str, Any], connection: Serv
     """
     try:
         # Send pong response
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "ping_agent",
             "success": True,
             "timestamp": data.get("timestamp", time.time())
-        }))
+        }), text=True)
         logger.debug("Responded to ping")
     except Exception as e:
         logger.error(f"Error handling ping: {e}")
@@ -424,12 +425,12 @@ async def handle_claim_agent_id(command: str, data: Dict[str, Any], connection:
     force = data.get("force", False)
     
     if not agent_id:
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "claim_agent_id",
             "success": False,
             "error": "Missing agent_id"
-        }))
+        }), text=True)
         return
     
     try:
@@ -437,31 +438,31 @@ async def handle_claim_agent_id(command: str, data: Dict[str, Any], connection:
         certificate = network_instance.identity_manager.claim_agent_id(agent_id, force=force)
         
         if certificate:
-            await connection.send(json.dumps({
+            await connection.send(json_dumps({
                 "type": "system_response",
                 "command": "claim_agent_id",
                 "success": True,
                 "agent_id": agent_id,
                 "certificate": certificate.to_dict()
-            }))
+            }), text=True)
             logger.info(f"Issued certificate for agent ID {agent_id}")
         else:
-            await connection.send(json.dumps({
+            await connection.send(json_dumps({
                 "type": "system_response",
                 "command": "claim_agent_id",
                 "success": False,
                 "error": f"Agent ID {agent_id} is already claimed"
-            }))
+            }), text=True)
             logger.warning(f"Failed to claim agent ID {agent_id} - already claimed")
     
     except Exception as e:
         logger.error(f"Error claiming agent ID {agent_id}: {e}")
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "claim_agent_id",
             "success": False,
             "error": f"Internal error: {str(e)}"
-        }))
+        }), text=True)
 
 
 async def handle_validate_certificate(command: str, data: Dict[str, Any], connection: ServerConnection,
@@ -477,36 +478,36 @@ async def handle_validate_certificate(command: str, data: Dict[str, Any], connec
     certificate_data = data.get("certificate")
     
     if not certificate_data:
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "validate_certificate",
             "success": False,
             "error": "Missing certificate data"
-        }))
+        }), text=True)
         return
     
     try:
         # Validate the certificate
         is_valid = network_instance.identity_manager.validate_certificate(certificate_data)
         
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "validate_certificate",
             "success": True,
             "valid": is_valid,
             "agent_id": certificate_data.get("agent_id")
-        }))
+        }), text=True)
         
         logger.debug(f"Certificate validation result for {certificate_data.get('agent_id')}: {is_valid}")
     
     except Exception as e:
         logger.error(f"Error validating certificate: {e}")
-        await connection.send(json.dumps({
+        await connection.send(json_dumps({
             "type": "system_response",
             "command": "validate_certificate",
             "success": False,
             "error": f"Internal error: {str(e)}"
-        }))
+        }), text=True)
 
 
 # Client-side command handling
@@ -528,7 +529,7 @@ async def send_system_request(connection: ServerConnection, command: str, **kwar
             "command": command,
             **kwargs
         }
-        await connection.send(json.dumps(request_data))
+        await connection.send(json_dumps(request_data), text=True)
         logger.debug(f"Sent system request: {command}")
         return True
     except Exception as e:
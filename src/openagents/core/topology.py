@@ -466,7 +466,7 @@ class DecentralizedTopology(NetworkTopology):
                 "capabilities": agent_info.capabilities,
                 "address": agent_info.address
             },
-            timestamp=int(time.time() * 1000)
+            timestamp=time.time_ns() // 1_000_000
         )
         
         await transport.send(announcement)
@@ -482,7 +482,7 @@ class DecentralizedTopology(NetworkTopology):
             target_id=None,  # Broadcast
             message_type="agent_removal",
             payload={"agent_id": agent_id},
-            timestamp=int(time.time() * 1000)
+            timestamp=time.time_ns() // 1_000_000
         )
         
         await transport.send(announcement)
@@ -505,12 +505,13 @@ class DecentralizedTopology(NetworkTopology):
             try:
                 transport = self.transport_manager.get_active_transport()
                 if transport:
+                    now_ms = time.time_ns() // 1_000_000
                     heartbeat = Message(
                         sender_id=self.node_id,
                         target_id=None,  # Broadcast
                         message_type="heartbeat",
-                        payload={"timestamp": int(time.time() * 1000)},
-                        timestamp=int(time.time() * 1000)
+                        payload={"timestamp": now_ms},
+                        timestamp=now_ms
                     )
                     await transport.send(heartbeat)
                 
@@ -9,17 +9,20 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Callable, Awaitable, Union
 import asyncio
 import logging
-import json
 import uuid
 
 from openagents.models.transport import (
     TransportType, ConnectionState, PeerMetadata, 
     ConnectionInfo, TransportMessage, AgentInfo
 )
-from openagents.utils.verbose import verbose_print
+from openagents.utils.json import json_dumps, json_loads
+from openagents.utils.verbose import is_verbose, verbose_print
 
 logger = logging.getLogger(__name__)
 
+# Frame types forwarded to the system message handlers
+_SYSTEM_FRAME_TYPES = frozenset({"system_request", "system_response"})
+
 # Type alias for backward compatibility
 Message = TransportMessage
 
@@ -222,12 +225,20 @@ class WebSocketTransport(Transport):
             
             # Extract websocket configuration options
             max_size = self.config.get("max_message_size", 104857600)  # Default 100MB
+            # Let several server processes bind the same port so the kernel
+            # spreads incoming connections across them (SO_REUSEPORT)
+            reuse_port = self.config.get("reuse_port", False)
+            # Per-message deflate costs more CPU than it saves on the small
+            # JSON frames agents exchange, so it is off unless configured
+            compression = self.config.get("compression")
+            max_queue = self.config.get("max_queue", 16)
             
             self.server = await self.websockets.serve(
-                self._handle_connection, host, port, max_size=max_size
+                self._handle_connection, host, port, max_size=max_size, reuse_port=reuse_port,
+                compression=compression, max_queue=max_queue
             )
             self.is_running = True
-            logger.info(f"WebSocket transport listening on {address} with max_size={max_size}")
+            logger.info(f"WebSocket transport listening on {address} with max_size={max_size}, reuse_port={reuse_port}")
             return True
         except Exception as e:
             logger.error(f"Failed to start WebSocket server: {e}")
@@ -238,8 +249,11 @@ class WebSocketTransport(Transport):
         try:
             # Extract websocket configuration options
             max_size = self.config.get("max_message_size", 104857600)  # Default 100MB
+            compression = self.config.get("compression")
             
-            websocket = await self.websockets.connect(f"ws://{address}", max_size=max_size)
+            websocket = await self.websockets.connect(
+                f"ws://{address}", max_size=max_size, compression=compression
+            )
             self.client_connections[peer_id] = websocket
             
             # Update connection info
@@ -248,7 +262,7 @@ class WebSocketTransport(Transport):
                 peer_id=peer_id,
                 transport_type=self.transport_type,
                 state=ConnectionState.CONNECTED,
-                last_activity=asyncio.get_event_loop().time()
+                last_activity=asyncio.get_running_loop().time()
             )
             
             await self._notify_connection_handlers(peer_id, ConnectionState.CONNECTED)
@@ -282,15 +296,18 @@ class WebSocketTransport(Transport):
     async def send(self, message: Message) -> bool:
         """Send message via WebSocket."""
         try:
-            verbose_print(f"🚀 WebSocketTransport.send() called")
-            verbose_print(f"   Message type: {type(message).__name__}")
-            verbose_print(f"   Message target_id: {message.target_id}")
-            verbose_print(f"   Message sender_id: {message.sender_id}")
-            verbose_print(f"   Connected clients: {list(self.client_connections.keys())}")
+            # Only build the diagnostics when they will be printed; listing the
+            # connected clients is a full pass over them on every send
+            if is_verbose():
+                verbose_print(f"🚀 WebSocketTransport.send() called")
+                verbose_print(f"   Message type: {type(message).__name__}")
+                verbose_print(f"   Message target_id: {message.target_id}")
+                verbose_print(f"   Message sender_id: {message.sender_id}")
+                verbose_print(f"   Connected clients: {list(self.client_connections.keys())}")
             
             # Wrap message in the format expected by client connectors
             message_payload = {"type": "message", "data": message.model_dump()}
-            message_data = json.dumps(message_payload)
+            message_data = json_dumps(message_payload)
             
             # Check for target - could be target_id (generic) or target_agent_id (DirectMessage)
             target = message.target_id or getattr(message, 'target_agent_id', None)
@@ -313,7 +330,7 @@ class WebSocketTransport(Transport):
                 
                 if websocket_connection:
                     verbose_print(f"   ✅ Target connection found, sending...")
-                    await websocket_connection.send(message_data)
+                    await websocket_connection.send(message_data, text=True)
                     verbose_print(f"   ✅ Message sent successfully to {target}")
                     return True
                 else:
@@ -322,15 +339,22 @@ class WebSocketTransport(Transport):
                     logger.warning(f"Target {target} not connected")
                     return False
             else:
-                # Broadcast message
+                # Broadcast message - hand the frame to every peer at once so a
+                # slow socket doesn't hold up delivery to the others
+                recipients = [
+                    (peer_id, websocket)
+                    for peer_id, websocket in self.client_connections.items()
+                    if peer_id != message.sender_id  # Don't send to sender
+                ]
+                results = await asyncio.gather(
+                    *(websocket.send(message_data, text=True) for _, websocket in recipients),
+                    return_exceptions=True
+                )
                 success = True
-                for peer_id, websocket in self.client_connections.items():
-                    if peer_id != message.sender_id:  # Don't send to sender
-                        try:
-                            await websocket.send(message_data)
-                        except Exception as e:
-                            logger.error(f"Failed to send broadcast to {peer_id}: {e}")
-                            success = False
+                for (peer_id, _), result in zip(recipients, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Failed to send broadcast to {peer_id}: {result}")
+                        success = False
                 return success
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
@@ -354,48 +378,47 @@ class WebSocketTransport(Transport):
         try:
             async for message_data in websocket:
                 try:
-                    verbose_print(f"📨 WebSocket received message from {peer_id}: {message_data[:200]}...")
-                    data = json.loads(message_data)
-                    verbose_print(f"📦 Parsed data: {data}")
-                    
-                    # Check if this is a system message (should be handled by network layer)
-                    if data.get("type") == "system_request":
-                        verbose_print("🔧 Processing system_request message")
-                        # Forward system messages to system message handlers
-                        await self._notify_system_message_handlers(peer_id, data, websocket)
+                    if is_verbose():
+                        verbose_print(f"📨 WebSocket received message from {peer_id}: {message_data[:200]}...")
+                    # orjson parses bytes and str frames alike, so binary
+                    # frames need no separate UTF-8 decode first
+                    data = json_loads(message_data)
+                    if not isinstance(data, dict):
+                        logger.warning(f"Ignoring non-object frame from {peer_id}")
                         continue
+                    if is_verbose():
+                        verbose_print(f"📦 Parsed data: {data}")
+                    
+                    frame_type = data.get("type")
                     
-                    # Check if this is a system response (should be handled by network layer)
-                    if data.get("type") == "system_response":
-                        verbose_print("🔧 Processing system_response message")
-                        # Forward system responses to system message handlers
+                    # Check if this is a system request or response (should be handled by network layer)
+                    if frame_type in _SYSTEM_FRAME_TYPES:
+                        if is_verbose():
+                            verbose_print(f"🔧 Processing {frame_type} message")
+                        # Forward system messages to system message handlers
                         await self._notify_system_message_handlers(peer_id, data, websocket)
                         continue
                     
                     # Check if this is a regular message with data wrapper
-                    if data.get("type") == "message":
-                        verbose_print("📬 Processing regular message with data wrapper")
+                    if frame_type == "message":
                         # Extract the actual message data from the wrapper
                         message_payload = data.get("data", {})
-                        verbose_print(f"   Message payload: {message_payload}")
                         # Parse the inner message data as TransportMessage
                         message = Message(**message_payload)
-                        verbose_print(f"✅ Parsed as Message: {message}")
-                        verbose_print(f"🔔 Notifying message handlers... ({len(self.message_handlers)} handlers)")
-                        for i, handler in enumerate(self.message_handlers):
-                            verbose_print(f"   Handler {i}: {handler}")
+                        if is_verbose():
+                            verbose_print(f"📬 Parsed wrapped message: {message}")
+                            verbose_print(f"🔔 Notifying message handlers... ({len(self.message_handlers)} handlers)")
                         await self._notify_message_handlers(message)
-                        verbose_print(f"✅ Message handlers notified")
                     else:
-                        verbose_print(f"🔄 Trying to parse as TransportMessage directly (type: {data.get('type')})")
                         # Try to parse as TransportMessage directly (for backward compatibility)
                         message = Message(**data)
-                        verbose_print(f"✅ Parsed as Message: {message}")
+                        if is_verbose():
+                            verbose_print(f"🔄 Parsed unwrapped message (type: {frame_type}): {message}")
                         await self._notify_message_handlers(message)
                     
                     # Update last activity
                     if peer_id in self.connections:
-                        self.connections[peer_id].last_activity = asyncio.get_event_loop().time()
+                        self.connections[peer_id].last_activity = asyncio.get_running_loop().time()
                         
                 except Exception as e:
                     verbose_print(f"❌ Error processing message from {peer_id}: {e}")
@@ -56,14 +56,21 @@ async def async_launch_network(config_path: str, runtime: Optional[int] = None)
         config_path: Path to the network configuration file
         runtime: Optional runtime limit in seconds
     """
+    # Signals only wake the run loop below; the network itself is shut down
+    # exactly once, in the finally block
+    stop_event = asyncio.Event()
+    
     def signal_handler():
         logger.info("Received shutdown signal")
-        asyncio.create_task(network.shutdown())
+        stop_event.set()
     
     # Set up signal handlers
+    loop = asyncio.get_running_loop()
+    handled_signals = []
     if sys.platform != 'win32':
         for sig in [signal.SIGTERM, signal.SIGINT]:
-            signal.signal(sig, lambda signum, frame: signal_handler())
+            loop.add_signal_handler(sig, signal_handler)
+            handled_signals.append(sig)
     
     try:
         # Load configuration
@@ -108,17 +115,22 @@ async def async_launch_network(config_path: str, runtime: Optional[int] = None)
         stats = network.get_network_stats()
         logger.info(f"Network statistics: {stats}")
         
-        # Run network
+        # Run network until a signal arrives, the network shuts itself down, or the runtime ends
         if runtime:
             logger.info(f"Running network for {runtime} seconds")
-            await asyncio.sleep(runtime)
         else:
             logger.info("Running network indefinitely (Ctrl+C to stop)")
-            try:
-                while network.is_running:
-                    await asyncio.sleep(1)
-            except KeyboardInterrupt:
-                logger.info("Received keyboard interrupt")
+        waits = [
+            asyncio.ensure_future(stop_event.wait()),
+            asyncio.ensure_future(network.wait_for_shutdown())
+        ]
+        try:
+            await asyncio.wait(waits, timeout=runtime, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for wait in waits:
+                wait.cancel()
+        if not network.is_running:
+            logger.info("Network stopped")
         
     except FileNotFoundError as e:
         logger.error(f"Configuration file not found: {e}")
@@ -131,6 +143,8 @@ async def async_launch_network(config_path: str, runtime: Optional[int] = None)
         return
     finally:
         # Cleanup
+        for sig in handled_signals:
+            loop.remove_signal_handler(sig)
         try:
             if 'network' in locals():
                 logger.info("Shutting down network...")
@@ -7,16 +7,30 @@ A simple terminal console for interacting with an OpenAgents network.
 
 import asyncio
 import logging
+import shlex
+import threading
 import uuid
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Awaitable
 
 from openagents.core.client import AgentClient
-from openagents.models.messages import DirectMessage, BroadcastMessage
+from openagents.models.messages import BaseMessage, DirectMessage, BroadcastMessage
 from openagents.core.system_commands import LIST_AGENTS, LIST_MODS, GET_MOD_MANIFEST
 from openagents.utils.verbose import verbose_print
 
 logger = logging.getLogger(__name__)
 
+# Help menu text, written with a single print call
+_HELP_MENU = """Commands:
+  /quit - Exit the console
+  /status - Show connection status
+  /dm <agent_id> <message> - Send a direct message
+  /broadcast <message> - Send a broadcast message
+  /file [agent_id] <file_path> [message] - Send a file (quote paths with spaces)
+  /agents - List connected agents
+  /protocols - List available mods
+  /manifest <protocol_name> - Get protocol manifest
+  /help - Show this help message"""
+
 
 class ConsoleAgent:
     """Simple console agent for interacting with an OpenAgents network."""
@@ -180,6 +194,34 @@ class ConsoleAgent:
         await self.agent.send_broadcast_message(message)
         return True
     
+    async def send_file(self, file_path: str, target_id: Optional[str] = None, message_text: Optional[str] = None) -> bool:
+        """Send a file to another agent, or broadcast it if no target is given.
+        
+        Args:
+            file_path: Path to the file to send
+            target_id: Optional target agent ID
+            message_text: Optional text message to include
+            
+        Returns:
+            bool: True if the file was read and sent
+        """
+        if not self.connected:
+            print("Not connected to a network server")
+            return False
+        
+        adapter = self.agent.mod_adapters.get("SimpleMessagingAgentAdapter")
+        if adapter is None:
+            print("File transfer is not available: simple messaging mod is not loaded")
+            return False
+        
+        if target_id:
+            sent = await adapter.send_file(target_id, file_path, message_text)
+        else:
+            sent = await adapter.broadcast_file(file_path, message_text)
+        if not sent:
+            print(f"Failed to send file: {file_path}")
+        return sent
+    
     async def list_agents(self) -> bool:
         """Request a list of agents from the network server.
         
@@ -244,9 +286,7 @@ class ConsoleAgent:
         sender_id = message.sender_id
         content = message.content.get("text", str(message.content))
         
-        # Update user list if needed
-        if sender_id not in self.users and message.metadata.get("name"):
-            self.users[sender_id] = message.metadata.get("name")
+        self._remember_sender(message)
         
         # Display the message
         print(f"\n[DM from {sender_id}]: {content}")
@@ -261,14 +301,22 @@ class ConsoleAgent:
         sender_id = message.sender_id
         content = message.content.get("text", str(message.content))
         
-        # Update user list if needed
-        if sender_id not in self.users and message.metadata.get("name"):
-            self.users[sender_id] = message.metadata.get("name")
+        self._remember_sender(message)
         
         # Display the message
         print(f"\n[Broadcast from {sender_id}]: {content}")
         print("> ", end="", flush=True)
     
+    def _remember_sender(self, message: BaseMessage) -> None:
+        """Record the sender's display name the first time it is seen.
+        
+        Args:
+            message: The received message
+        """
+        name = message.metadata.get("name")
+        if name:
+            self.users.setdefault(message.sender_id, name)
+    
     async def _handle_agent_list(self, agents: List[Dict[str, Any]]) -> None:
         """Handle an agent list response.
         
@@ -282,6 +330,7 @@ class ConsoleAgent:
             name = agent.get("name", agent_id)
             connected = agent.get("connected", False)
             status = "Connected" if connected else "Disconnected"
+            self.users[agent_id] = name
             print(f"- {name} ({agent_id}): {status}")
         print("> ", end="", flush=True)
     
@@ -366,15 +415,145 @@ class ConsoleAgent:
 
 def show_help_menu() -> None:
     """Display the help menu with available commands."""
-    print("Commands:")
-    print("  /quit - Exit the console")
-    print("  /status - Show connection status")
-    print("  /dm <agent_id> <message> - Send a direct message")
-    print("  /broadcast <message> - Send a broadcast message")
-    print("  /agents - List connected agents")
-    print("  /protocols - List available mods")
-    print("  /manifest <protocol_name> - Get protocol manifest")
-    print("  /help - Show this help message")
+    print(_HELP_MENU)
+
+
+def _read_console_input(input_queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> None:
+    """Read console lines on a background thread and pass them to the event loop.
+    
+    Puts None on the queue when the input stream is closed.
+    
+    Args:
+        input_queue: Queue the console loop reads lines from
+        loop: Event loop that owns the queue
+    """
+    while True:
+        try:
+            line = input()
+        except (EOFError, OSError):
+            line = None
+        
+        try:
+            loop.call_soon_threadsafe(input_queue.put_nowait, line)
+        except RuntimeError:
+            # Event loop already closed
+            return
+        
+        if line is None:
+            return
+
+
+async def _cmd_quit(console_agent: ConsoleAgent, args: str) -> bool:
+    """Exit the console."""
+    return True
+
+
+async def _cmd_help(console_agent: ConsoleAgent, args: str) -> bool:
+    """Show the help menu."""
+    show_help_menu()
+    return False
+
+
+async def _cmd_status(console_agent: ConsoleAgent, args: str) -> bool:
+    """Show connection status."""
+    if console_agent.connected and console_agent.agent.connector and console_agent.agent.connector.is_connected:
+        print("✅ Connection status: Connected")
+        print(f"   Agent ID: {console_agent.agent_id}")
+        print(f"   Server: {console_agent.host}:{console_agent.port}")
+    else:
+        print("❌ Connection status: Disconnected")
+    return False
+
+
+async def _cmd_dm(console_agent: ConsoleAgent, args: str) -> bool:
+    """Send a direct message."""
+    parts = args.split(" ", 1)
+    if len(parts) < 2:
+        print("Usage: /dm <agent_id> <message>")
+        return False
+    
+    target_id, message = parts
+    await console_agent.send_direct_message(target_id, message)
+    print(f"[DM to {target_id}]: {message}")
+    return False
+
+
+async def _cmd_broadcast(console_agent: ConsoleAgent, args: str) -> bool:
+    """Send a broadcast message."""
+    if not args:
+        print("Usage: /broadcast <message>")
+        return False
+    
+    await console_agent.send_broadcast_message(args)
+    print(f"[Broadcast]: {args}")
+    return False
+
+
+async def _cmd_file(console_agent: ConsoleAgent, args: str) -> bool:
+    """Send a file to an agent listed by /agents, or broadcast it."""
+    try:
+        tokens = shlex.split(args)
+    except ValueError as e:
+        print(f"Invalid arguments: {e}")
+        return False
+    
+    # A leading known agent ID makes this a direct send
+    target_id = tokens[0] if tokens and tokens[0] in console_agent.users else None
+    file_args = tokens[1:] if target_id else tokens
+    if not file_args:
+        print("Usage: /file [agent_id] <file_path> [message]")
+        return False
+    
+    file_path, *message_words = file_args
+    message_text = " ".join(message_words) or None
+    if await console_agent.send_file(file_path, target_id, message_text):
+        print(f"[File to {target_id or 'all'}]: {file_path}")
+    return False
+
+
+async def _cmd_agents(console_agent: ConsoleAgent, args: str) -> bool:
+    """List agents."""
+    await console_agent.list_agents()
+    print("Requesting agent list...")
+    return False
+
+
+async def _cmd_protocols(console_agent: ConsoleAgent, args: str) -> bool:
+    """List protocols."""
+    await console_agent.list_mods()
+    print("Requesting protocol list...")
+    return False
+
+
+async def _cmd_manifest(console_agent: ConsoleAgent, args: str) -> bool:
+    """Get a protocol manifest."""
+    if not args:
+        print("Usage: /manifest <protocol_name>")
+        return False
+    
+    await console_agent.get_mod_manifest(args)
+    print(f"Requesting manifest for protocol {args}...")
+    return False
+
+
+async def _cmd_unknown(console_agent: ConsoleAgent, args: str) -> bool:
+    """Inform the user about available commands."""
+    print(f"Unknown command. Available commands:\n{_HELP_MENU}\nTo send a broadcast message, use /broadcast <message>")
+    return False
+
+
+# Console commands keyed by their first word
+CONSOLE_COMMANDS: Dict[str, Callable[[ConsoleAgent, str], Awaitable[bool]]] = {
+    "/quit": _cmd_quit,
+    "/help": _cmd_help,
+    "/status": _cmd_status,
+    "/dm": _cmd_dm,
+    "/broadcast": _cmd_broadcast,
+    "/file": _cmd_file,
+    "/agents": _cmd_agents,
+    "/protocols": _cmd_protocols,
+    "/manifest": _cmd_manifest,
+}
 
 
 async def run_console(host: str, port: int, agent_id: Optional[str] = None, network_id: Optional[str] = None) -> None:
@@ -408,9 +587,13 @@ async def run_console(host: str, port: int, agent_id: Optional[str] = None, netw
     # Start connection monitoring task to ensure heartbeat responses
     monitor_task = asyncio.create_task(console_agent._monitor_connection())
     
-    print(f"Connected to network server as {agent_id}")
-    print("Type your messages and press Enter to send.")
-    show_help_menu()
+    print(f"Connected to network server as {agent_id}\nType your messages and press Enter to send.\n{_HELP_MENU}")
+    
+    # Read stdin on one background thread for the whole session
+    input_queue: asyncio.Queue = asyncio.Queue()
+    threading.Thread(
+        target=_read_console_input, args=(input_queue, asyncio.get_running_loop()), daemon=True
+    ).start()
     
     # Main console loop
     try:
@@ -421,74 +604,20 @@ async def run_console(host: str, port: int, agent_id: Optional[str] = None, netw
                 break
             
             # Get user input
-            user_input = await asyncio.get_event_loop().run_in_executor(None, input, "> ")
+            print("> ", end="", flush=True)
+            user_input = await input_queue.get()
+            if user_input is None:
+                # Input stream closed
+                break
             
             if user_input.strip() == "":
                 continue
             
-            if user_input.startswith("/quit"):
-                # Exit the console
+            # Dispatch on the command word; handlers return True to exit the console
+            command, _, args = user_input.strip().partition(" ")
+            handler = CONSOLE_COMMANDS.get(command, _cmd_unknown)
+            if await handler(console_agent, args.strip()):
                 break
-            
-            elif user_input.startswith("/help"):
-                # Show help
-                show_help_menu()
-            
-            elif user_input.startswith("/status"):
-                # Show connection status
-                if console_agent.connected and console_agent.agent.connector and console_agent.agent.connector.is_connected:
-                    print("✅ Connection status: Connected")
-                    print(f"   Agent ID: {console_agent.agent_id}")
-                    print(f"   Server: {console_agent.host}:{console_agent.port}")
-                else:
-                    print("❌ Connection status: Disconnected")
-            
-            elif user_input.startswith("/dm "):
-                # Send a direct message
-                parts = user_input[4:].strip().split(" ", 1)
-                if len(parts) < 2:
-                    print("Usage: /dm <agent_id> <message>")
-                    continue
-                
-                target_id, message = parts
-                await console_agent.send_direct_message(target_id, message)
-                print(f"[DM to {target_id}]: {message}")
-            
-            elif user_input.startswith("/broadcast "):
-                # Send a broadcast message
-                message = user_input[11:].strip()
-                if not message:
-                    print("Usage: /broadcast <message>")
-                    continue
-                
-                await console_agent.send_broadcast_message(message)
-                print(f"[Broadcast]: {message}")
-            
-            elif user_input.startswith("/agents"):
-                # List agents
-                await console_agent.list_agents()
-                print("Requesting agent list...")
-            
-            elif user_input.startswith("/protocols"):
-                # List protocols
-                await console_agent.list_mods()
-                print("Requesting protocol list...")
-            
-            elif user_input.startswith("/manifest "):
-                # Get protocol manifest
-                protocol_name = user_input[10:].strip()
-                if not protocol_name:
-                    print("Usage: /manifest <protocol_name>")
-                    continue
-                
-                await console_agent.get_mod_manifest(protocol_name)
-                print(f"Requesting manifest for protocol {protocol_name}...")
-            
-            else:
-                # Inform user about available commands
-                print("Unknown command. Available commands:")
-                show_help_menu()
-                print("To send a broadcast message, use /broadcast <message>")
     
     except KeyboardInterrupt:
         print("\nExiting...")
@@ -11,9 +11,28 @@ class MessageThread(BaseModel):
 
     def add_message(self, message: BaseMessage):
         """
-        Add a message to the message thread.
+        Add a message to the message thread, keeping messages ordered by timestamp.
         """
-        self.messages.append(message)
+        if not self.messages or self.messages[-1].timestamp <= message.timestamp:
+            self.messages.append(message)
+        else:
+            self.messages.insert(self.count_until(message.timestamp), message)
+
+    def count_until(self, timestamp: int) -> int:
+        """
+        Get the number of messages with a timestamp at or before the given one.
+
+        Relies on the messages being ordered by timestamp, as add_message keeps them.
+        """
+        # Binary search by hand, as bisect only takes a key function from Python 3.10
+        low, high = 0, len(self.messages)
+        while low < high:
+            mid = (low + high) // 2
+            if self.messages[mid].timestamp <= timestamp:
+                low = mid + 1
+            else:
+                high = mid
+        return low
 
     def get_messages(self) -> List[BaseMessage]:
         """
@@ -21,4 +40,3 @@ class MessageThread(BaseModel):
         """
         # sort the messages by timestamp
         return list(sorted(self.messages, key=lambda x: x.timestamp))
-
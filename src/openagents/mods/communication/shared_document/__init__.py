@@ -15,19 +15,25 @@ __all__ = [
     "InsertLinesMessage",
     "RemoveLinesMessage",
     "ReplaceLinesMessage",
+    "BulkEditMessage",
     "AddCommentMessage",
+    "BulkCommentMessage",
     "RemoveCommentMessage",
     "UpdateCursorPositionMessage",
     "GetDocumentContentMessage",
+    "GetDocumentContentPageMessage",
     "GetDocumentHistoryMessage",
     "ListDocumentsMessage",
     "GetAgentPresenceMessage",
     "DocumentOperationResponse",
     "DocumentContentResponse",
+    "DocumentContentPageResponse",
     "DocumentListResponse",
     "DocumentHistoryResponse",
     "AgentPresenceResponse",
     "CursorPosition",
+    "LineEdit",
+    "LineComment",
     "DocumentComment",
     "AgentPresence"
 ]
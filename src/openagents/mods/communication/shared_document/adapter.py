@@ -9,10 +9,11 @@ This standalone mod provides collaborative document editing with:
 - Conflict resolution
 """
 
+import asyncio
 import logging
+import time
 import uuid
-from typing import Dict, Any, List, Optional, Callable, Union
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Union, AsyncIterator, Tuple
 
 from openagents.core.base_mod_adapter import BaseModAdapter
 from openagents.models.messages import ModMessage
@@ -24,25 +25,48 @@ from .document_messages import (
     InsertLinesMessage,
     RemoveLinesMessage,
     ReplaceLinesMessage,
+    BulkEditMessage,
     AddCommentMessage,
+    BulkCommentMessage,
     RemoveCommentMessage,
     UpdateCursorPositionMessage,
     GetDocumentContentMessage,
+    GetDocumentContentPageMessage,
     GetDocumentHistoryMessage,
     ListDocumentsMessage,
     GetAgentPresenceMessage,
     DocumentOperationResponse,
     DocumentContentResponse,
+    DocumentContentPageResponse,
     DocumentListResponse,
     DocumentHistoryResponse,
     AgentPresenceResponse,
     CursorPosition,
     DocumentComment,
-    AgentPresence
+    AgentPresence,
+    LineEdit,
+    LineComment
 )
 
 logger = logging.getLogger(__name__)
 
+# Last whole second and its formatted local date/time, reused by _iso_now()
+_iso_second: Tuple[int, str] = (-1, "")
+
+
+def _iso_now() -> str:
+    """Return the current local time as an ISO 8601 string with microseconds.
+    
+    Presence and sync updates arrive many times per second, so the date and time
+    part is only formatted once per second and reused.
+    """
+    global _iso_second
+    now = time.time()
+    second = int(now)
+    if second != _iso_second[0]:
+        _iso_second = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second)))
+    return f"{_iso_second[1]}.{int((now - second) * 1_000_000):06d}"
+
 # Type definitions for handlers
 DocumentHandler = Callable[[Dict[str, Any]], None]
 OperationHandler = Callable[[str, Dict[str, Any]], None]  # operation_type, operation_data
@@ -268,6 +292,80 @@ class SharedDocumentAgentAdapter(BaseModAdapter):
                 },
                 func=self.add_comment
             ),
+            AgentAdapterTool(
+                name="replace_lines_bulk",
+                description="Replace several line ranges in a document in a single operation",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "document_id": {
+                            "type": "string",
+                            "description": "ID of the document"
+                        },
+                        "edits": {
+                            "type": "array",
+                            "description": "Line replacements, applied in order",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "start_line": {
+                                        "type": "integer",
+                                        "description": "Start line number to replace (1-based)",
+                                        "minimum": 1
+                                    },
+                                    "end_line": {
+                                        "type": "integer",
+                                        "description": "End line number to replace (1-based, inclusive)",
+                                        "minimum": 1
+                                    },
+                                    "content": {
+                                        "type": "array",
+                                        "items": {"type": "string"},
+                                        "description": "New content lines"
+                                    }
+                                },
+                                "required": ["start_line", "end_line", "content"]
+                            }
+                        }
+                    },
+                    "required": ["document_id", "edits"]
+                },
+                func=self.replace_lines_bulk
+            ),
+            AgentAdapterTool(
+                name="add_comments",
+                description="Add several comments to a document in a single operation",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "document_id": {
+                            "type": "string",
+                            "description": "ID of the document"
+                        },
+                        "comments": {
+                            "type": "array",
+                            "description": "Comments to add",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "line_number": {
+                                        "type": "integer",
+                                        "description": "Line number to comment on (1-based)",
+                                        "minimum": 1
+                                    },
+                                    "comment_text": {
+                                        "type": "string",
+                                        "description": "Comment content"
+                                    }
+                                },
+                                "required": ["line_number", "comment_text"]
+                            }
+                        }
+                    },
+                    "required": ["document_id", "comments"]
+                },
+                func=self.add_comments
+            ),
             AgentAdapterTool(
                 name="remove_comment",
                 description="Remove a comment from the document",
@@ -609,6 +707,39 @@ class SharedDocumentAgentAdapter(BaseModAdapter):
                 "message": str(e)
             }
     
+    async def replace_lines_bulk(self, document_id: str, edits: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Replace several line ranges in a document with one message.
+        
+        Args:
+            document_id: ID of the document
+            edits: Line replacements, each with start_line, end_line and content
+            
+        Returns:
+            Dict containing operation result, with the operation_id of the sent request
+        """
+        try:
+            message = BulkEditMessage(
+                document_id=document_id,
+                edits=[LineEdit(**edit) for edit in edits],
+                sender_id=self.agent_id
+            )
+            
+            # Send message to network
+            await self._send_message(message)
+            
+            return {
+                "status": "success",
+                "message": f"Bulk edit sent with {len(edits)} replacements",
+                "operation_id": message.message_id
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to send bulk edit: {e}")
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+    
     async def add_comment(self, document_id: str, line_number: int, comment_text: str) -> Dict[str, Any]:
         """Add a comment to a line in the document.
         
@@ -643,6 +774,39 @@ class SharedDocumentAgentAdapter(BaseModAdapter):
                 "message": str(e)
             }
     
+    async def add_comments(self, document_id: str, comments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add several comments to the document with one message.
+        
+        Args:
+            document_id: ID of the document
+            comments: Comments to add, each with line_number and comment_text
+            
+        Returns:
+            Dict containing operation result, with the operation_id of the sent request
+        """
+        try:
+            message = BulkCommentMessage(
+                document_id=document_id,
+                comments=[LineComment(**comment) for comment in comments],
+                sender_id=self.agent_id
+            )
+            
+            # Send message to network
+            await self._send_message(message)
+            
+            return {
+                "status": "success",
+                "message": f"{len(comments)} comments sent",
+                "operation_id": message.message_id
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to add comments: {e}")
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+    
     async def remove_comment(self, document_id: str, comment_id: str) -> Dict[str, Any]:
         """Remove a comment from the document.
         
@@ -750,6 +914,85 @@ class SharedDocumentAgentAdapter(BaseModAdapter):
                 "message": str(e)
             }
     
+    async def iter_document_content(self, document_id: str, chunk_lines: int = 256, include_comments: bool = True, timeout: float = 5.0) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over document content one page of lines at a time.
+        
+        Each page is requested only after the previous one has been received, so
+        callers can start processing before the whole document is transferred.
+        
+        Args:
+            document_id: ID of the document
+            chunk_lines: Number of lines per page
+            include_comments: Whether to include comments on each page's lines
+            timeout: Maximum time to wait for each page in seconds
+            
+        Yields:
+            Dict containing the page's offset, lines, comments, total_lines and version
+            
+        Raises:
+            RuntimeError: If the network mod reports an error for a page, or no page arrives in time
+        """
+        offset = 0
+        while True:
+            message = GetDocumentContentPageMessage(
+                document_id=document_id,
+                offset=offset,
+                limit=chunk_lines,
+                include_comments=include_comments,
+                sender_id=self.agent_id
+            )
+            
+            await self._send_message(message)
+            
+            response = await self._wait_page_response(message.message_id, timeout)
+            
+            if response is None:
+                raise RuntimeError(f"No content page received for document {document_id} at offset {offset}")
+            
+            page = response.content
+            if page.get("message_type") == "document_operation_response":
+                raise RuntimeError(f"Failed to get content page of document {document_id} at offset {offset}: {page.get('error_message')}")
+            
+            yield page
+            
+            offset += len(page["lines"])
+            if not page["lines"] or offset >= page["total_lines"]:
+                return
+    
+    async def _wait_page_response(self, request_id: str, timeout: float) -> Optional[ModMessage]:
+        """Wait for either the content page or the error response to a page request.
+        
+        Args:
+            request_id: ID of the page request message
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            Optional[ModMessage]: The page or error response, or None if neither arrived in time
+        """
+        waits = {
+            asyncio.ensure_future(self.connector.wait_mod_message(
+                self.mod_name,
+                filter_dict={"message_type": "document_content_page_response", "request_id": request_id},
+                timeout=timeout
+            )),
+            asyncio.ensure_future(self.connector.wait_mod_message(
+                self.mod_name,
+                filter_dict={"message_type": "document_operation_response", "operation_id": request_id},
+                timeout=timeout
+            ))
+        }
+        try:
+            while waits:
+                done, waits = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+                for wait in done:
+                    response = wait.result()
+                    if response is not None:
+                        return response
+            return None
+        finally:
+            for wait in waits:
+                wait.cancel()
+    
     async def get_document_history(self, document_id: str, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
         """Get the operation history of a document.
         
@@ -889,13 +1132,15 @@ class SharedDocumentAgentAdapter(BaseModAdapter):
                 await self._handle_operation_response(message_data)
             elif message_type == "document_content_response":
                 await self._handle_document_content_response(message_data)
+            elif message_type == "document_content_page_response":
+                await self._handle_document_content_page_response(message_data)
             elif message_type == "document_list_response":
                 await self._handle_document_list_response(message_data)
             elif message_type == "document_history_response":
                 await self._handle_document_history_response(message_data)
             elif message_type == "agent_presence_response":
                 await self._handle_agent_presence_response(message_data)
-            elif message_type in ["insert_lines", "remove_lines", "replace_lines", "add_comment", "remove_comment"]:
+            elif message_type in ["insert_lines", "remove_lines", "replace_lines", "bulk_edit", "add_comment", "bulk_comment", "remove_comment"]:
                 await self._handle_operation_broadcast(message_data, source_agent_id)
             elif message_type == "update_cursor_position":
                 await self._handle_presence_broadcast(message_data, source_agent_id)
@@ -948,7 +1193,7 @@ class SharedDocumentAgentAdapter(BaseModAdapter):
                 "comments": comments,
                 "agent_presence": agent_presence,
                 "version": version,
-                "last_updated": datetime.now().isoformat()
+                "last_updated": _iso_now()
             }
             
             # Call registered handlers
@@ -968,6 +1213,27 @@ class SharedDocumentAgentAdapter(BaseModAdapter):
         except Exception as e:
             logger.error(f"Error handling document content response: {e}")
     
+    async def _handle_document_content_page_response(self, message_data: Dict[str, Any]) -> None:
+        """Handle document content page response messages."""
+        try:
+            # Call registered handlers
+            for handler in self.document_handlers.values():
+                try:
+                    handler({
+                        "event": "content_page",
+                        "document_id": message_data.get("document_id"),
+                        "offset": message_data.get("offset", 0),
+                        "lines": message_data.get("lines", []),
+                        "comments": message_data.get("comments", []),
+                        "total_lines": message_data.get("total_lines", 0),
+                        "version": message_data.get("version", 1)
+                    })
+                except Exception as e:
+                    logger.error(f"Error in document handler: {e}")
+            
+        except Exception as e:
+            logger.error(f"Error handling document content page response: {e}")
+    
     async def _handle_document_list_response(self, message_data: Dict[str, Any]) -> None:
         """Handle document list response messages."""
         try:
@@ -1056,7 +1322,7 @@ class SharedDocumentAgentAdapter(BaseModAdapter):
                     handler(document_id, [{
                         "agent_id": source_agent_id,
                         "cursor_position": cursor_position,
-                        "last_activity": datetime.now().isoformat(),
+                        "last_activity": _iso_now(),
                         "is_active": True
                     }])
                 except Exception as e:
@@ -194,6 +194,50 @@ class ReplaceLinesMessage(BaseMessage):
         if self.start_line > self.end_line:
             raise ValueError('start_line must be <= end_line')
 
+class LineEdit(BaseModel):
+    """Represents a single line replacement within a bulk edit."""
+    
+    start_line: int = Field(..., description="Start line number to replace (1-based)")
+    end_line: int = Field(..., description="End line number to replace (1-based, inclusive)")
+    content: List[str] = Field(..., description="New content lines")
+    
+    @field_validator('start_line', 'end_line')
+    @classmethod
+    def validate_line_numbers(cls, v):
+        """Validate line numbers are positive."""
+        if v < 1:
+            raise ValueError('Line numbers must be 1 or greater')
+        return v
+    
+    @field_validator('content')
+    @classmethod
+    def validate_content(cls, v):
+        """Validate content lines."""
+        for line in v:
+            if len(line) > 10000:
+                raise ValueError('Line length cannot exceed 10000 characters')
+        return v
+    
+    def model_post_init(self, __context):
+        """Validate that start_line <= end_line."""
+        if self.start_line > self.end_line:
+            raise ValueError('start_line must be <= end_line')
+
+class BulkEditMessage(BaseMessage):
+    """Message for applying several line replacements in a single operation."""
+    
+    message_type: str = Field("bulk_edit", description="Bulk edit message type")
+    document_id: str = Field(..., description="Document ID")
+    edits: List[LineEdit] = Field(..., description="Line replacements, applied in order")
+    
+    @field_validator('edits')
+    @classmethod
+    def validate_edits(cls, v):
+        """Validate there is at least one edit."""
+        if len(v) == 0:
+            raise ValueError('Edits cannot be empty')
+        return v
+
 class AddCommentMessage(BaseMessage):
     """Message for adding a comment to a document line."""
     
@@ -220,6 +264,45 @@ class AddCommentMessage(BaseMessage):
             raise ValueError('Comment text cannot exceed 2000 characters')
         return v.strip()
 
+class LineComment(BaseModel):
+    """Represents a single comment within a bulk comment request."""
+    
+    line_number: int = Field(..., description="Line number to comment on (1-based)")
+    comment_text: str = Field(..., description="Comment content")
+    
+    @field_validator('line_number')
+    @classmethod
+    def validate_line_number(cls, v):
+        """Validate line number is positive."""
+        if v < 1:
+            raise ValueError('Line number must be 1 or greater')
+        return v
+    
+    @field_validator('comment_text')
+    @classmethod
+    def validate_comment_text(cls, v):
+        """Validate comment text."""
+        if len(v.strip()) == 0:
+            raise ValueError('Comment text cannot be empty')
+        if len(v) > 2000:
+            raise ValueError('Comment text cannot exceed 2000 characters')
+        return v.strip()
+
+class BulkCommentMessage(BaseMessage):
+    """Message for adding several comments in a single operation."""
+    
+    message_type: str = Field("bulk_comment", description="Bulk comment message type")
+    document_id: str = Field(..., description="Document ID")
+    comments: List[LineComment] = Field(..., description="Comments to add, in order")
+    
+    @field_validator('comments')
+    @classmethod
+    def validate_comments(cls, v):
+        """Validate there is at least one comment."""
+        if len(v) == 0:
+            raise ValueError('Comments cannot be empty')
+        return v
+
 class RemoveCommentMessage(BaseMessage):
     """Message for removing a comment from a document."""
     
@@ -242,6 +325,31 @@ class GetDocumentContentMessage(BaseMessage):
     include_comments: bool = Field(True, description="Whether to include comments")
     include_presence: bool = Field(True, description="Whether to include agent presence")
 
+class GetDocumentContentPageMessage(BaseMessage):
+    """Message for requesting a range of document lines."""
+    
+    message_type: str = Field("get_document_content_page", description="Get document content page message type")
+    document_id: str = Field(..., description="Document ID")
+    offset: int = Field(0, description="Number of lines to skip")
+    limit: int = Field(256, description="Maximum number of lines to retrieve")
+    include_comments: bool = Field(True, description="Whether to include comments on the returned lines")
+    
+    @field_validator('offset')
+    @classmethod
+    def validate_offset(cls, v):
+        """Validate offset parameter."""
+        if v < 0:
+            raise ValueError('offset must be 0 or greater')
+        return v
+    
+    @field_validator('limit')
+    @classmethod
+    def validate_limit(cls, v):
+        """Validate limit parameter."""
+        if not 1 <= v <= 10000:
+            raise ValueError('limit must be between 1 and 10000')
+        return v
+
 class GetDocumentHistoryMessage(BaseMessage):
     """Message for requesting document operation history."""
     
@@ -292,6 +400,18 @@ class DocumentContentResponse(BaseMessage):
     agent_presence: List[AgentPresence] = Field(default_factory=list, description="Agent presence information")
     version: int = Field(..., description="Document version number")
 
+class DocumentContentPageResponse(BaseMessage):
+    """Response message containing a range of document lines."""
+    
+    message_type: str = Field("document_content_page_response", description="Document content page response type")
+    request_id: str = Field(..., description="ID of the page request message")
+    document_id: str = Field(..., description="Document ID")
+    offset: int = Field(..., description="Index of the first returned line (0-based)")
+    lines: List[str] = Field(..., description="Document lines in this page")
+    comments: List[DocumentComment] = Field(default_factory=list, description="Comments on the returned lines")
+    total_lines: int = Field(..., description="Total number of lines in the document")
+    version: int = Field(..., description="Document version number")
+
 class DocumentListResponse(BaseMessage):
     """Response message containing list of documents."""
     
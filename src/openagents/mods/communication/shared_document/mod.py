@@ -9,10 +9,12 @@ This standalone mod enables collaborative document editing with:
 - Conflict resolution
 """
 
+import asyncio
 import logging
+from array import array
 import uuid
 import copy
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 
 from openagents.core.base_mod import BaseMod
@@ -24,15 +26,19 @@ from .document_messages import (
     InsertLinesMessage,
     RemoveLinesMessage,
     ReplaceLinesMessage,
+    BulkEditMessage,
     AddCommentMessage,
+    BulkCommentMessage,
     RemoveCommentMessage,
     UpdateCursorPositionMessage,
     GetDocumentContentMessage,
+    GetDocumentContentPageMessage,
     GetDocumentHistoryMessage,
     ListDocumentsMessage,
     GetAgentPresenceMessage,
     DocumentOperationResponse,
     DocumentContentResponse,
+    DocumentContentPageResponse,
     DocumentListResponse,
     DocumentHistoryResponse,
     AgentPresenceResponse,
@@ -40,11 +46,16 @@ from .document_messages import (
     DocumentComment,
     AgentPresence,
     CursorPosition,
-    LineRange
+    LineRange,
+    LineEdit,
+    LineComment
 )
 
 logger = logging.getLogger(__name__)
 
+# Completed operations remembered for operation_completed(); the oldest are dropped first
+MAX_TRACKED_OPERATIONS = 1000
+
 class SharedDocument:
     """Represents a shared document with version control and collaboration features."""
     
@@ -60,8 +71,16 @@ class SharedDocument:
         # Document content (list of lines)
         self.content: List[str] = initial_content.split('\n') if initial_content else [""]
         
+        # Comments are stored as parallel arrays (one entry per comment, same index
+        # across arrays) rather than as a dict of DocumentComment lists
+        self.comment_ids: List[str] = []
+        self.comment_line: array = array('i')
+        self.comment_agent: List[str] = []
+        self.comment_text: List[str] = []
+        self.comment_timestamp: List[datetime] = []
+        self._comment_line_index: Optional[Dict[int, List[int]]] = None  # line_number -> [comment indices], built lazily
+        
         # Document metadata
-        self.comments: Dict[int, List[DocumentComment]] = {}  # line_number -> [comments]
         self.agent_presence: Dict[str, AgentPresence] = {}  # agent_id -> presence
         self.access_permissions: Dict[str, str] = {}  # agent_id -> permission level
         self.operation_history: List[DocumentOperation] = []
@@ -113,13 +132,13 @@ class SharedDocument:
         
         return False
     
-    def update_agent_presence(self, agent_id: str, cursor_position: Optional[CursorPosition] = None) -> bool:
+    def update_agent_presence(self, agent_id: str, cursor_position: Optional[CursorPosition] = None, timestamp: Optional[datetime] = None) -> bool:
         """Update an agent's presence information."""
         if agent_id not in self.agent_presence:
             self.agent_presence[agent_id] = AgentPresence(agent_id=agent_id)
         
         presence = self.agent_presence[agent_id]
-        presence.last_activity = datetime.now()
+        presence.last_activity = timestamp or datetime.now()
         presence.is_active = True
         
         if cursor_position:
@@ -181,9 +200,7 @@ class SharedDocument:
             end_index = end_line - 1
             
             # Remove comments in the range being deleted
-            for line_num in range(start_line, end_line + 1):
-                if line_num in self.comments:
-                    del self.comments[line_num]
+            self._remove_comments_in_range(start_line, end_line)
             
             # Remove the lines
             del self.content[start_index:end_index + 1]
@@ -208,12 +225,18 @@ class SharedDocument:
             logger.error(f"Failed to remove lines: {e}")
             raise
     
-    def replace_lines(self, agent_id: str, start_line: int, end_line: int, content: List[str]) -> DocumentOperation:
-        """Replace lines in the specified range with new content."""
+    def replace_lines(self, agent_id: str, start_line: int, end_line: int, content: List[str], timestamp: Optional[datetime] = None) -> DocumentOperation:
+        """Replace lines in the specified range with new content.
+        
+        Bulk callers pass a shared ``timestamp`` so every edit in a batch is stamped
+        with the same time; otherwise the current time is used.
+        """
+        now = timestamp or datetime.now()
         operation = DocumentOperation(
             document_id=self.document_id,
             agent_id=agent_id,
-            operation_type="replace_lines"
+            operation_type="replace_lines",
+            timestamp=now
         )
         
         try:
@@ -225,9 +248,7 @@ class SharedDocument:
                 raise ValueError(f"Line range exceeds document length: {len(self.content)}")
             
             # Remove comments in the range being replaced
-            for line_num in range(start_line, end_line + 1):
-                if line_num in self.comments:
-                    del self.comments[line_num]
+            self._remove_comments_in_range(start_line, end_line)
             
             # Replace lines (convert to 0-based indices)
             start_index = start_line - 1
@@ -238,9 +259,9 @@ class SharedDocument:
             
             # Update version and metadata
             self.version += 1
-            self.last_modified = datetime.now()
+            self.last_modified = now
             self.operation_history.append(operation)
-            self.update_agent_presence(agent_id)
+            self.update_agent_presence(agent_id, timestamp=now)
             
             # Adjust comments after the replaced range
             lines_removed = end_line - start_line + 1
@@ -256,7 +277,25 @@ class SharedDocument:
             logger.error(f"Failed to replace lines: {e}")
             raise
     
-    def add_comment(self, agent_id: str, line_number: int, comment_text: str) -> DocumentComment:
+    def replace_lines_bulk(self, agent_id: str, edits: List[LineEdit]) -> List[DocumentOperation]:
+        """Apply several line replacements atomically.
+        
+        Edits are applied in order, each against the result of the previous one.
+        If any edit fails, the document is restored to its state before the first edit.
+        """
+        snapshot = self._snapshot()
+        now = datetime.now()
+        
+        try:
+            return [
+                self.replace_lines(agent_id, edit.start_line, edit.end_line, edit.content, timestamp=now)
+                for edit in edits
+            ]
+        except Exception:
+            self._restore(snapshot)
+            raise
+    
+    def add_comment(self, agent_id: str, line_number: int, comment_text: str, timestamp: Optional[datetime] = None) -> DocumentComment:
         """Add a comment to the specified line."""
         try:
             # Validate line number
@@ -264,21 +303,27 @@ class SharedDocument:
                 raise ValueError(f"Invalid line number: {line_number}")
             
             # Create comment
+            now = timestamp or datetime.now()
             comment = DocumentComment(
                 line_number=line_number,
                 agent_id=agent_id,
-                comment_text=comment_text
+                comment_text=comment_text,
+                timestamp=now
             )
             
             # Add to comments
-            if line_number not in self.comments:
-                self.comments[line_number] = []
-            
-            self.comments[line_number].append(comment)
+            index = len(self.comment_ids)
+            self.comment_ids.append(comment.comment_id)
+            self.comment_line.append(line_number)
+            self.comment_agent.append(agent_id)
+            self.comment_text.append(comment.comment_text)
+            self.comment_timestamp.append(comment.timestamp)
+            if self._comment_line_index is not None:
+                self._comment_line_index.setdefault(line_number, []).append(index)
             
             # Update metadata
-            self.last_modified = datetime.now()
-            self.update_agent_presence(agent_id)
+            self.last_modified = now
+            self.update_agent_presence(agent_id, timestamp=now)
             
             return comment
             
@@ -286,55 +331,145 @@ class SharedDocument:
             logger.error(f"Failed to add comment: {e}")
             raise
     
+    def add_comments(self, agent_id: str, comments: List[LineComment]) -> List[DocumentComment]:
+        """Add several comments atomically.
+        
+        If any comment fails, none of the comments are added.
+        """
+        snapshot = self._snapshot()
+        now = datetime.now()
+        
+        try:
+            return [
+                self.add_comment(agent_id, comment.line_number, comment.comment_text, timestamp=now)
+                for comment in comments
+            ]
+        except Exception:
+            self._restore(snapshot)
+            raise
+    
     def remove_comment(self, agent_id: str, comment_id: str) -> bool:
         """Remove a comment by ID."""
         try:
-            # Find and remove the comment
-            for line_number, comments in self.comments.items():
-                for i, comment in enumerate(comments):
-                    if comment.comment_id == comment_id:
-                        # Check if agent can remove this comment
-                        if comment.agent_id != agent_id and not self.has_permission(agent_id, "admin"):
-                            raise ValueError("Agent can only remove their own comments")
-                        
-                        comments.pop(i)
-                        
-                        # Remove empty comment lists
-                        if not comments:
-                            del self.comments[line_number]
-                        
-                        self.last_modified = datetime.now()
-                        self.update_agent_presence(agent_id)
-                        return True
-            
-            raise ValueError(f"Comment not found: {comment_id}")
+            # Find the comment
+            if comment_id not in self.comment_ids:
+                raise ValueError(f"Comment not found: {comment_id}")
+            index = self.comment_ids.index(comment_id)
+            
+            # Check if agent can remove this comment
+            if self.comment_agent[index] != agent_id and not self.has_permission(agent_id, "admin"):
+                raise ValueError("Agent can only remove their own comments")
+            
+            for column in self._comment_columns():
+                del column[index]
+            self._comment_line_index = None
+            
+            self.last_modified = datetime.now()
+            self.update_agent_presence(agent_id)
+            return True
             
         except Exception as e:
             logger.error(f"Failed to remove comment: {e}")
             raise
     
+    def _snapshot(self) -> Dict[str, Any]:
+        """Capture the mutable document state so a bulk operation can be rolled back."""
+        return {
+            "content": self.content.copy(),
+            "comments": [copy.copy(column) for column in self._comment_columns()],
+            "version": self.version,
+            "last_modified": self.last_modified,
+            "history_length": len(self.operation_history)
+        }
+    
+    def _restore(self, snapshot: Dict[str, Any]) -> None:
+        """Restore document state captured by _snapshot."""
+        self.content = snapshot["content"]
+        (self.comment_ids, self.comment_line, self.comment_agent,
+         self.comment_text, self.comment_timestamp) = snapshot["comments"]
+        self._comment_line_index = None
+        self.version = snapshot["version"]
+        self.last_modified = snapshot["last_modified"]
+        del self.operation_history[snapshot["history_length"]:]
+    
+    @property
+    def comments(self) -> Dict[int, List[DocumentComment]]:
+        """Comments grouped by line number, built from the comment arrays."""
+        return {
+            line_number: [self._comment_at(i) for i in indices]
+            for line_number, indices in self._get_comment_line_index().items()
+        }
+    
+    @property
+    def comment_count(self) -> int:
+        """Total number of comments on the document."""
+        return len(self.comment_line)
+    
+    def comments_on_line(self, line_number: int) -> List[DocumentComment]:
+        """Get the comments attached to a line."""
+        return [self._comment_at(i) for i in self._get_comment_line_index().get(line_number, [])]
+    
+    def list_comments(self) -> List[DocumentComment]:
+        """Get all comments in insertion order."""
+        return [self._comment_at(i) for i in range(len(self.comment_ids))]
+    
+    def _comment_at(self, index: int) -> DocumentComment:
+        """Build a DocumentComment for the comment stored at index."""
+        return DocumentComment.model_construct(
+            comment_id=self.comment_ids[index],
+            line_number=self.comment_line[index],
+            agent_id=self.comment_agent[index],
+            comment_text=self.comment_text[index],
+            timestamp=self.comment_timestamp[index]
+        )
+    
+    def _comment_columns(self) -> tuple:
+        """Get the parallel comment arrays, in a fixed order."""
+        return (self.comment_ids, self.comment_line, self.comment_agent,
+                self.comment_text, self.comment_timestamp)
+    
+    def _get_comment_line_index(self) -> Dict[int, List[int]]:
+        """Get the line number -> comment indices index, building it if needed."""
+        if self._comment_line_index is None:
+            index: Dict[int, List[int]] = {}
+            for i, line_number in enumerate(self.comment_line):
+                index.setdefault(line_number, []).append(i)
+            self._comment_line_index = index
+        return self._comment_line_index
+    
+    def _keep_comments(self, keep: List[bool]) -> None:
+        """Drop comments whose keep flag is False from all comment arrays."""
+        self.comment_ids = [v for v, k in zip(self.comment_ids, keep) if k]
+        self.comment_line = array('i', (v for v, k in zip(self.comment_line, keep) if k))
+        self.comment_agent = [v for v, k in zip(self.comment_agent, keep) if k]
+        self.comment_text = [v for v, k in zip(self.comment_text, keep) if k]
+        self.comment_timestamp = [v for v, k in zip(self.comment_timestamp, keep) if k]
+        self._comment_line_index = None
+    
+    def _remove_comments_in_range(self, start_line: int, end_line: int) -> None:
+        """Remove comments attached to lines start_line..end_line (inclusive)."""
+        keep = [not start_line <= line_num <= end_line for line_num in self.comment_line]
+        if not all(keep):
+            self._keep_comments(keep)
+    
     def _shift_comments_after_line(self, line_number: int, shift: int) -> None:
         """Shift comment line numbers after a specific line."""
         if shift == 0:
             return
         
-        # Create a new comments dict with shifted line numbers
-        new_comments = {}
-        
-        for line_num, comments in self.comments.items():
-            if line_num <= line_number:
-                # Comments before/at the shift point stay the same
-                new_comments[line_num] = comments
-            else:
+        keep = []
+        for i, line_num in enumerate(self.comment_line):
+            if line_num > line_number:
                 # Comments after the shift point get moved
-                new_line_num = line_num + shift
-                if new_line_num > 0:  # Only keep comments with positive line numbers
-                    new_comments[new_line_num] = comments
-                    # Update the line number in each comment
-                    for comment in comments:
-                        comment.line_number = new_line_num
+                line_num += shift
+                self.comment_line[i] = line_num
+            # Only keep comments with positive line numbers
+            keep.append(line_num > 0)
         
-        self.comments = new_comments
+        if all(keep):
+            self._comment_line_index = None
+        else:
+            self._keep_comments(keep)
     
     def get_document_state(self) -> Dict[str, Any]:
         """Get the current state of the document."""
@@ -382,6 +517,58 @@ class SharedDocumentNetworkMod(BaseMod):
         # Cleanup tracking
         self.last_cleanup = datetime.now()
         self.cleanup_interval = timedelta(minutes=30)
+        
+        # Readiness events so callers can await lifecycle changes instead of sleeping.
+        # They are created on first use, inside the running event loop.
+        self._document_created: Dict[str, asyncio.Event] = {}  # document_name -> event
+        self._document_opened: Dict[Tuple[str, str], asyncio.Event] = {}  # (document_id, agent_id) -> event
+        self._operation_completed: Dict[str, asyncio.Event] = {}  # operation_id -> event, oldest first
+    
+    def document_created(self, document_name: str) -> asyncio.Event:
+        """Get the event that is set once a document with this name has been created.
+        
+        Args:
+            document_name: Name of the document
+            
+        Returns:
+            asyncio.Event: Event set when the document has been stored
+        """
+        if document_name not in self._document_created:
+            self._document_created[document_name] = asyncio.Event()
+        return self._document_created[document_name]
+    
+    def document_opened(self, document_id: str, agent_id: str) -> asyncio.Event:
+        """Get the event that is set once an agent has opened a document.
+        
+        Args:
+            document_id: ID of the document
+            agent_id: ID of the agent opening the document
+            
+        Returns:
+            asyncio.Event: Event set when the open has been acknowledged
+        """
+        key = (document_id, agent_id)
+        if key not in self._document_opened:
+            self._document_opened[key] = asyncio.Event()
+        return self._document_opened[key]
+    
+    def operation_completed(self, operation_id: str) -> asyncio.Event:
+        """Get the event that is set once the response to an operation has been sent.
+        
+        The event is set for failed operations too, as long as the error
+        response carries the operation ID.
+        
+        Args:
+            operation_id: ID of the operation, i.e. the request's message ID
+            
+        Returns:
+            asyncio.Event: Event set when the operation's response has been sent
+        """
+        if operation_id not in self._operation_completed:
+            self._operation_completed[operation_id] = asyncio.Event()
+            while len(self._operation_completed) > MAX_TRACKED_OPERATIONS:
+                del self._operation_completed[next(iter(self._operation_completed))]
+        return self._operation_completed[operation_id]
     
     def initialize(self) -> bool:
         """Initialize the mod."""
@@ -408,14 +595,20 @@ class SharedDocumentNetworkMod(BaseMod):
                 await self._handle_remove_lines(message, source_agent_id)
             elif isinstance(message, ReplaceLinesMessage):
                 await self._handle_replace_lines(message, source_agent_id)
+            elif isinstance(message, BulkEditMessage):
+                await self._handle_bulk_edit(message, source_agent_id)
             elif isinstance(message, AddCommentMessage):
                 await self._handle_add_comment(message, source_agent_id)
+            elif isinstance(message, BulkCommentMessage):
+                await self._handle_bulk_comments(message, source_agent_id)
             elif isinstance(message, RemoveCommentMessage):
                 await self._handle_remove_comment(message, source_agent_id)
             elif isinstance(message, UpdateCursorPositionMessage):
                 await self._handle_update_cursor_position(message, source_agent_id)
             elif isinstance(message, GetDocumentContentMessage):
                 await self._handle_get_document_content(message, source_agent_id)
+            elif isinstance(message, GetDocumentContentPageMessage):
+                await self._handle_get_document_content_page(message, source_agent_id)
             elif isinstance(message, GetDocumentHistoryMessage):
                 await self._handle_get_document_history(message, source_agent_id)
             elif isinstance(message, ListDocumentsMessage):
@@ -429,8 +622,12 @@ class SharedDocumentNetworkMod(BaseMod):
             logger.error(f"Error processing message from {source_agent_id}: {e}")
             await self._send_error_response(source_agent_id, str(e))
     
-    async def _handle_create_document(self, message: CreateDocumentMessage, source_agent_id: str) -> None:
-        """Handle document creation."""
+    async def _handle_create_document(self, message: CreateDocumentMessage, source_agent_id: str) -> Optional[str]:
+        """Handle document creation.
+        
+        Returns:
+            Optional[str]: ID of the new document, or None if creation failed
+        """
         try:
             document_id = str(uuid.uuid4())
             
@@ -468,9 +665,14 @@ class SharedDocumentNetworkMod(BaseMod):
             
             logger.info(f"Created document {document_id} by agent {source_agent_id}")
             
+            self.document_created(message.document_name).set()
+            
+            return document_id
+            
         except Exception as e:
             logger.error(f"Failed to create document: {e}")
             await self._send_error_response(source_agent_id, str(e))
+            return None
     
     async def _handle_open_document(self, message: OpenDocumentMessage, source_agent_id: str) -> None:
         """Handle document opening."""
@@ -499,10 +701,7 @@ class SharedDocumentNetworkMod(BaseMod):
             response = DocumentContentResponse(
                 document_id=document_id,
                 content=document.content.copy(),
-                comments=[
-                    comment for comments in document.comments.values()
-                    for comment in comments
-                ],
+                comments=document.list_comments(),
                 agent_presence=list(document.agent_presence.values()),
                 version=document.version,
                 sender_id=self.network.node_id
@@ -515,6 +714,8 @@ class SharedDocumentNetworkMod(BaseMod):
             
             logger.info(f"Agent {source_agent_id} opened document {document_id}")
             
+            self.document_opened(document_id, source_agent_id).set()
+            
         except Exception as e:
             logger.error(f"Failed to open document: {e}")
             await self._send_error_response(source_agent_id, str(e))
@@ -531,6 +732,7 @@ class SharedDocumentNetworkMod(BaseMod):
             # Remove from agent session
             if source_agent_id in self.agent_sessions:
                 self.agent_sessions[source_agent_id].discard(document_id)
+            self._document_opened.pop((document_id, source_agent_id), None)
             
             # Send success response
             response = DocumentOperationResponse(
@@ -656,6 +858,41 @@ class SharedDocumentNetworkMod(BaseMod):
             logger.error(f"Failed to replace lines: {e}")
             await self._send_error_response(source_agent_id, str(e))
     
+    async def _handle_bulk_edit(self, message: BulkEditMessage, source_agent_id: str) -> None:
+        """Handle a batch of line replacements applied as one operation."""
+        try:
+            document_id = message.document_id
+            
+            if document_id not in self.documents:
+                raise ValueError(f"Document not found: {document_id}")
+            
+            document = self.documents[document_id]
+            
+            # Check permissions
+            if not document.has_permission(source_agent_id, "write"):
+                raise ValueError("Agent does not have write permission")
+            
+            # Perform all edits; the document is rolled back if any edit fails
+            document.replace_lines_bulk(source_agent_id, message.edits)
+            
+            # Send a single success response for the whole batch
+            response = DocumentOperationResponse(
+                operation_id=message.message_id,
+                success=True,
+                sender_id=self.network.node_id
+            )
+            
+            await self._send_response(source_agent_id, response)
+            
+            # Broadcast the batch to other agents as one update
+            await self._broadcast_operation(document_id, message, source_agent_id)
+            
+            logger.info(f"Agent {source_agent_id} applied {len(message.edits)} edits in document {document_id}")
+            
+        except Exception as e:
+            logger.error(f"Failed to apply bulk edit: {e}")
+            await self._send_error_response(source_agent_id, str(e), operation_id=message.message_id)
+    
     async def _handle_add_comment(self, message: AddCommentMessage, source_agent_id: str) -> None:
         """Handle comment addition."""
         try:
@@ -691,6 +928,41 @@ class SharedDocumentNetworkMod(BaseMod):
             logger.error(f"Failed to add comment: {e}")
             await self._send_error_response(source_agent_id, str(e))
     
+    async def _handle_bulk_comments(self, message: BulkCommentMessage, source_agent_id: str) -> None:
+        """Handle a batch of comments added as one operation."""
+        try:
+            document_id = message.document_id
+            
+            if document_id not in self.documents:
+                raise ValueError(f"Document not found: {document_id}")
+            
+            document = self.documents[document_id]
+            
+            # Check permissions (commenting allowed for read_only as well)
+            if not document.has_permission(source_agent_id, "comment"):
+                raise ValueError("Agent does not have comment permission")
+            
+            # Add all comments; none are kept if any comment fails
+            document.add_comments(source_agent_id, message.comments)
+            
+            # Send a single success response for the whole batch
+            response = DocumentOperationResponse(
+                operation_id=message.message_id,
+                success=True,
+                sender_id=self.network.node_id
+            )
+            
+            await self._send_response(source_agent_id, response)
+            
+            # Broadcast the batch to other agents as one update
+            await self._broadcast_operation(document_id, message, source_agent_id)
+            
+            logger.info(f"Agent {source_agent_id} added {len(message.comments)} comments in document {document_id}")
+            
+        except Exception as e:
+            logger.error(f"Failed to add comments: {e}")
+            await self._send_error_response(source_agent_id, str(e), operation_id=message.message_id)
+    
     async def _handle_remove_comment(self, message: RemoveCommentMessage, source_agent_id: str) -> None:
         """Handle comment removal."""
         try:
@@ -758,10 +1030,7 @@ class SharedDocumentNetworkMod(BaseMod):
             # Prepare response
             comments = []
             if message.include_comments:
-                comments = [
-                    comment for comments in document.comments.values()
-                    for comment in comments
-                ]
+                comments = document.list_comments()
             
             agent_presence = []
             if message.include_presence:
@@ -782,6 +1051,45 @@ class SharedDocumentNetworkMod(BaseMod):
             logger.error(f"Failed to get document content: {e}")
             await self._send_error_response(source_agent_id, str(e))
     
+    async def _handle_get_document_content_page(self, message: GetDocumentContentPageMessage, source_agent_id: str) -> None:
+        """Handle a request for a range of document lines."""
+        try:
+            document_id = message.document_id
+            
+            if document_id not in self.documents:
+                raise ValueError(f"Document not found: {document_id}")
+            
+            document = self.documents[document_id]
+            
+            # Check permissions
+            if not document.has_permission(source_agent_id, "read"):
+                raise ValueError("Agent does not have read permission")
+            
+            # Only the requested slice is copied and serialized
+            lines = document.content[message.offset:message.offset + message.limit]
+            
+            comments = []
+            if message.include_comments:
+                for line_number in range(message.offset + 1, message.offset + len(lines) + 1):
+                    comments.extend(document.comments_on_line(line_number))
+            
+            response = DocumentContentPageResponse(
+                request_id=message.message_id,
+                document_id=document_id,
+                offset=message.offset,
+                lines=lines,
+                comments=comments,
+                total_lines=len(document.content),
+                version=document.version,
+                sender_id=self.network.node_id
+            )
+            
+            await self._send_response(source_agent_id, response)
+            
+        except Exception as e:
+            logger.error(f"Failed to get document content page: {e}")
+            await self._send_error_response(source_agent_id, str(e), operation_id=message.message_id)
+    
     async def _handle_get_document_history(self, message: GetDocumentHistoryMessage, source_agent_id: str) -> None:
         """Handle document history request."""
         try:
@@ -886,13 +1194,16 @@ class SharedDocumentNetworkMod(BaseMod):
         
         document = self.documents[document_id]
         
+        # Serialize the operation once; only the recipient changes per message
+        content = operation_message.model_dump()
+        
         # Send to all active agents except the source
         for agent_id in document.active_agents:
             if agent_id != source_agent_id:
                 try:
                     mod_message = ModMessage(
                         mod="shared_document",
-                        content=operation_message.model_dump(),
+                        content=content,
                         sender_id=self.network.node_id,
                         relevant_agent_id=agent_id
                     )
@@ -912,8 +1223,9 @@ class SharedDocumentNetworkMod(BaseMod):
         
         presence_message = GetAgentPresenceMessage(
             document_id=document_id,
-            source_agent_id=self.network.node_id
+            sender_id=self.network.node_id
         )
+        content = presence_message.model_dump()
         
         # Send to all active agents except the one whose presence changed
         for other_agent_id in document.active_agents:
@@ -921,7 +1233,7 @@ class SharedDocumentNetworkMod(BaseMod):
                 try:
                     mod_message = ModMessage(
                         mod="shared_document",
-                        content=presence_message.model_dump(),
+                        content=content,
                         sender_id=self.network.node_id,
                         relevant_agent_id=other_agent_id
                     )
@@ -941,12 +1253,21 @@ class SharedDocumentNetworkMod(BaseMod):
             await self.network.send_message(target_agent_id, mod_message)
         except Exception as e:
             logger.error(f"Failed to send response to agent {target_agent_id}: {e}")
+        
+        if isinstance(response, DocumentOperationResponse):
+            self.operation_completed(response.operation_id).set()
     
-    async def _send_error_response(self, target_agent_id: str, error_message: str) -> None:
-        """Send an error response to an agent."""
+    async def _send_error_response(self, target_agent_id: str, error_message: str, operation_id: Optional[str] = None) -> None:
+        """Send an error response to an agent.
+        
+        Args:
+            target_agent_id: ID of the agent to notify
+            error_message: Description of the failure
+            operation_id: ID of the failed request, so the agent can match the error to it
+        """
         try:
             response = DocumentOperationResponse(
-                operation_id=str(uuid.uuid4()),
+                operation_id=operation_id or str(uuid.uuid4()),
                 success=False,
                 error_message=error_message,
                 sender_id=self.network.node_id
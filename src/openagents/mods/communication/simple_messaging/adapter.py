@@ -4,8 +4,10 @@ Agent-level simple messaging mod for OpenAgents.
 This mod enables direct and broadcast messaging between agents with support for text and file attachments.
 """
 
+import asyncio
 import logging
 import base64
+import mmap
 import os
 import uuid
 import tempfile
@@ -31,6 +33,9 @@ logger = logging.getLogger(__name__)
 MessageHandler = Callable[[Dict[str, Any], str], None]
 FileHandler = Callable[[str, bytes, Dict[str, Any], str], None]
 
+# Metadata flag marking a message whose content["batch"] holds several message contents
+BATCH_METADATA_KEY = "simple_messaging_batch"
+
 class SimpleMessagingAgentAdapter(BaseModAdapter):
     """Agent-level simple messaging mod implementation.
     
@@ -99,6 +104,12 @@ class SimpleMessagingAgentAdapter(BaseModAdapter):
             
         logger.debug(f"Received direct message from {message.sender_id}")
         
+        # Unpack batched messages so each item is handled like a separate message
+        if self._is_batch(message):
+            for message_item in self._unpack_batch(message):
+                await self.process_incoming_direct_message(message_item)
+            return
+        
         # Add message to the appropriate conversation thread
         thread_id = get_direct_message_thread_id(message.sender_id)
         self.add_message_to_thread(thread_id, message, text_representation=message.content.get("text", ""))
@@ -123,6 +134,12 @@ class SimpleMessagingAgentAdapter(BaseModAdapter):
         """
         logger.debug(f"Received broadcast message from {message.sender_id}")
         
+        # Unpack batched broadcasts so each item is handled like a separate message
+        if self._is_batch(message):
+            for message_item in self._unpack_batch(message):
+                await self.process_incoming_broadcast_message(message_item)
+            return
+        
         # Add message to the broadcast conversation thread
         thread_id = get_broadcast_message_thread_id()
         self.add_message_to_thread(thread_id, message, text_representation=message.content.get("text", ""))
@@ -200,6 +217,36 @@ class SimpleMessagingAgentAdapter(BaseModAdapter):
         await self.connector.send_direct_message(message)
         logger.debug(f"Sent direct message to {target_agent_id}")
     
+    async def send_direct_messages(self, target_agent_id: str, contents: List[Dict[str, Any]]) -> None:
+        """Send several direct messages to an agent as a single network message.
+        
+        The recipient receives the items in order, each as its own direct message.
+        File attachments are not processed inside a batch; use send_file instead.
+        
+        Args:
+            target_agent_id: ID of the target agent
+            contents: List of message contents
+        """
+        if self.connector is None:
+            logger.error(f"Cannot send messages: connector is None for agent {self.agent_id}")
+            return f"Error: Agent {self.agent_id} is not connected to a network"
+        
+        if not contents:
+            return
+        
+        # Create and send the message
+        message = DirectMessage(
+            sender_id=self.agent_id,
+            target_agent_id=target_agent_id,
+            content={"batch": contents},
+            metadata={BATCH_METADATA_KEY: True},
+            direction="outbound",
+            mod="openagents.mods.communication.simple_messaging"
+        )
+        
+        await self.connector.send_direct_message(message)
+        logger.debug(f"Sent {len(contents)} direct messages to {target_agent_id} in one batch")
+    
     async def send_broadcast_message(self, content: Dict[str, Any]) -> None:
         """Send a broadcast message to all agents.
         
@@ -224,6 +271,38 @@ class SimpleMessagingAgentAdapter(BaseModAdapter):
         await self.connector.send_broadcast_message(message)
         logger.debug("Sent broadcast message")
     
+    async def send_broadcast_messages(self, contents: List[Dict[str, Any]]) -> None:
+        """Send several broadcast messages as a single network message.
+        
+        Recipients receive the items in order, each as its own broadcast message.
+        File attachments are not processed inside a batch; use broadcast_file instead.
+        
+        Args:
+            contents: List of message contents
+        """
+        if self.connector is None:
+            logger.error(f"Cannot send broadcast messages: connector is None for agent {self.agent_id}")
+            return f"Error: Agent {self.agent_id} is not connected to a network"
+        
+        if not contents:
+            return
+        
+        # Create and send the message
+        message = BroadcastMessage(
+            sender_id=self.agent_id,
+            content={"batch": contents},
+            metadata={BATCH_METADATA_KEY: True},
+            direction="outbound"
+        )
+        
+        # Add each item to the broadcast conversation thread
+        thread_id = get_broadcast_message_thread_id()
+        for message_item in self._unpack_batch(message):
+            self.add_message_to_thread(thread_id, message_item, requires_response=False, text_representation=message_item.content.get("text", ""))
+        
+        await self.connector.send_broadcast_message(message)
+        logger.debug(f"Sent {len(contents)} broadcast messages in one batch")
+    
     async def send_text_message(self, target_agent_id: str, text: str) -> None:
         """Send a text message to a specific agent.
         
@@ -238,6 +317,15 @@ class SimpleMessagingAgentAdapter(BaseModAdapter):
         content = {"text": text}
         await self.send_direct_message(target_agent_id, content)
     
+    async def send_text_messages(self, target_agent_id: str, texts: List[str]) -> None:
+        """Send several text messages to a specific agent as one batch.
+        
+        Args:
+            target_agent_id: ID of the target agent
+            texts: Text content of each message
+        """
+        await self.send_direct_messages(target_agent_id, [{"text": text} for text in texts])
+    
     async def broadcast_text_message(self, text: str) -> None:
         """Broadcast a text message to all agents.
         
@@ -251,92 +339,68 @@ class SimpleMessagingAgentAdapter(BaseModAdapter):
         content = {"text": text}
         await self.send_broadcast_message(content)
     
-    async def send_file(self, target_agent_id: str, file_path: Union[str, Path], message_text: Optional[str] = None) -> None:
+    async def broadcast_text_messages(self, texts: List[str]) -> None:
+        """Broadcast several text messages to all agents as one batch.
+        
+        Args:
+            texts: Text content of each message
+        """
+        await self.send_broadcast_messages([{"text": text} for text in texts])
+    
+    async def send_file(self, target_agent_id: str, file_path: Union[str, Path], message_text: Optional[str] = None) -> bool:
         """Send a file to a specific agent.
         
         Args:
             target_agent_id: ID of the target agent
             file_path: Path to the file to send
             message_text: Optional text message to include
+            
+        Returns:
+            bool: True if the file was read and sent
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            logger.error(f"File not found: {file_path}")
-            return
-        
         try:
-            # Read the file
-            with open(file_path, "rb") as f:
-                file_content = f.read()
-            
-            # Encode as base64
-            encoded_content = base64.b64encode(file_content).decode("utf-8")
-            
-            # Create message content
-            content = {
-                "files": [
-                    {
-                        "filename": file_path.name,
-                        "content": encoded_content,
-                        "mime_type": self._get_mime_type(file_path),
-                        "size": len(file_content)
-                    }
-                ]
-            }
-            
-            # Add text if provided
-            if message_text:
-                content["text"] = message_text
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(None, self._build_file_content, file_path, message_text)
             
-            # Send the message
-            await self.send_direct_message(target_agent_id, content)
+            # Send the message; an error string means there was no connection
+            if await self.send_direct_message(target_agent_id, content) is not None:
+                return False
             logger.debug(f"Sent file {file_path.name} to {target_agent_id}")
+            return True
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
         except Exception as e:
             logger.error(f"Error sending file: {e}")
+        return False
     
-    async def broadcast_file(self, file_path: Union[str, Path], message_text: Optional[str] = None) -> None:
+    async def broadcast_file(self, file_path: Union[str, Path], message_text: Optional[str] = None) -> bool:
         """Broadcast a file to all agents.
         
         Args:
             file_path: Path to the file to send
             message_text: Optional text message to include
+            
+        Returns:
+            bool: True if the file was read and sent
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            logger.error(f"File not found: {file_path}")
-            return
-        
         try:
-            # Read the file
-            with open(file_path, "rb") as f:
-                file_content = f.read()
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(None, self._build_file_content, file_path, message_text)
             
-            # Encode as base64
-            encoded_content = base64.b64encode(file_content).decode("utf-8")
-            
-            # Create message content
-            content = {
-                "files": [
-                    {
-                        "filename": file_path.name,
-                        "content": encoded_content,
-                        "mime_type": self._get_mime_type(file_path),
-                        "size": len(file_content)
-                    }
-                ]
-            }
-            
-            # Add text if provided
-            if message_text:
-                content["text"] = message_text
-            
-            # Send the message
-            await self.send_broadcast_message(content)
+            # Send the message; an error string means there was no connection
+            if await self.send_broadcast_message(content) is not None:
+                return False
             logger.debug(f"Broadcast file {file_path.name}")
+            return True
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
         except Exception as e:
             logger.error(f"Error broadcasting file: {e}")
+        return False
     
     async def download_file(self, file_id: str) -> None:
         """Download a file from the network.
@@ -429,6 +493,89 @@ class SimpleMessagingAgentAdapter(BaseModAdapter):
             del self.file_handlers[handler_id]
             logger.debug(f"Unregistered file handler {handler_id}")
     
+    def _build_file_content(self, file_path: Path, message_text: Optional[str] = None) -> Dict[str, Any]:
+        """Build message content carrying a single file attachment.
+        
+        The file is opened directly rather than checked with exists() first, so a
+        missing file surfaces as FileNotFoundError without an extra stat call.
+        The content is base64-encoded straight from a read-only memory map, so the
+        raw file is never copied into a bytes object. This does blocking I/O; call
+        it from an executor.
+        
+        Args:
+            file_path: Path to the file to attach
+            message_text: Optional text message to include
+            
+        Returns:
+            Dict[str, Any]: Message content with the base64-encoded file
+        """
+        # Encode the file (empty files cannot be memory-mapped)
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    encoded_content = base64.b64encode(mapped).decode("utf-8")
+            else:
+                encoded_content = ""
+        
+        # Create message content
+        content = {
+            "files": [
+                {
+                    "filename": file_path.name,
+                    "content": encoded_content,
+                    "mime_type": self._get_mime_type(file_path),
+                    "size": size
+                }
+            ]
+        }
+        
+        # Add text if provided
+        if message_text:
+            content["text"] = message_text
+        
+        return content
+    
+    def _is_batch(self, message: Union[DirectMessage, BroadcastMessage]) -> bool:
+        """Check whether a message is a batch sent by send_direct_messages or send_broadcast_messages.
+        
+        Only messages carrying the batch metadata flag are treated as batches, so
+        application content that happens to have a "batch" key is delivered as is.
+        A flagged message whose batch isn't a list of dicts is also delivered as is.
+        
+        Args:
+            message: The incoming message
+            
+        Returns:
+            bool: True if the message should be unpacked
+        """
+        if not message.metadata.get(BATCH_METADATA_KEY):
+            return False
+        batch = message.content.get("batch")
+        if isinstance(batch, list) and all(isinstance(content, dict) for content in batch):
+            return True
+        logger.warning(f"Ignoring malformed batch in message {message.message_id} from {message.sender_id}")
+        return False
+    
+    def _unpack_batch(self, message: Union[DirectMessage, BroadcastMessage]) -> List[Union[DirectMessage, BroadcastMessage]]:
+        """Split a batched direct or broadcast message into one message per item.
+        
+        Each item gets its own message ID derived from the batch, so the items
+        are tracked independently in the conversation thread. The batch flag is
+        dropped from the items' metadata.
+        
+        Args:
+            message: The batched message
+            
+        Returns:
+            List[Union[DirectMessage, BroadcastMessage]]: The individual messages
+        """
+        metadata = {key: value for key, value in message.metadata.items() if key != BATCH_METADATA_KEY}
+        return [
+            message.model_copy(update={"message_id": f"{message.message_id}-{i}", "content": content, "metadata": dict(metadata)})
+            for i, content in enumerate(message.content["batch"])
+        ]
+    
     async def _process_file_references(self, message: Union[DirectMessage, BroadcastMessage]) -> None:
         """Process file references in a message.
         
@@ -470,10 +617,10 @@ class SimpleMessagingAgentAdapter(BaseModAdapter):
             # Decode the file content
             file_content = base64.b64decode(encoded_content)
             
-            # Save the file
+            # Save the file in a worker thread so the event loop keeps running
             file_path = self.file_storage_path / file_id
-            with open(file_path, "wb") as f:
-                f.write(file_content)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, file_path.write_bytes, file_content)
             
             logger.debug(f"Downloaded file {file_id}")
             
@@ -4,11 +4,13 @@ Network-level simple messaging mod for OpenAgents.
 This mod enables direct and broadcast messaging between agents with support for text and file attachments.
 """
 
+import asyncio
 import logging
 import os
 import base64
 import uuid
 import tempfile
+from itertools import islice
 from typing import Dict, Any, List, Optional, Set, BinaryIO
 from pathlib import Path
 
@@ -116,7 +118,7 @@ class SimpleMessagingNetworkMod(BaseMod):
             await self._process_file_attachments(message)
         
         # Log the message
-        logger.debug(f"Processing direct message from {message.sender_id} to {message.target_agent_id}")
+        logger.debug("Processing direct message from %s to %s", message.sender_id, message.target_agent_id)
         
         # Continue processing the message
         return message
@@ -139,7 +141,7 @@ class SimpleMessagingNetworkMod(BaseMod):
             await self._process_file_attachments(message)
         
         # Log the message
-        logger.debug(f"Processing broadcast message from {message.sender_id}")
+        logger.debug("Processing broadcast message from %s", message.sender_id)
         
         # Continue processing the message
         return message
@@ -154,7 +156,7 @@ class SimpleMessagingNetworkMod(BaseMod):
         self._add_to_history(message)
         
         # Log the message
-        logger.debug(f"Processing protocol message from {message.sender_id}")
+        logger.debug("Processing protocol message from %s", message.sender_id)
         
         # Handle protocol-specific messages
         action = message.content.get("action", "")
@@ -191,9 +193,10 @@ class SimpleMessagingNetworkMod(BaseMod):
                     # Decode base64 content
                     file_content = base64.b64decode(file_data["content"])
                     
-                    # Write to file
-                    with open(file_path, "wb") as f:
-                        f.write(file_content)
+                    # Write to file in a worker thread so large attachments
+                    # don't stall message handling for other agents
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(None, file_path.write_bytes, file_content)
                     
                     # Replace file content with file ID in the message
                     processed_file = {
@@ -371,10 +374,8 @@ class SimpleMessagingNetworkMod(BaseMod):
         
         # Trim history if it exceeds the maximum size
         if len(self.message_history) > self.max_history_size:
-            # Remove oldest messages
-            oldest_ids = sorted(
-                self.message_history.keys(), 
-                key=lambda k: self.message_history[k].timestamp
-            )[:100]
+            # Remove oldest messages; the dict keeps arrival order, so they are
+            # the first keys and no sort over the whole history is needed
+            oldest_ids = list(islice(self.message_history, 100))
             for old_id in oldest_ids:
                 del self.message_history[old_id] 
\ No newline at end of file
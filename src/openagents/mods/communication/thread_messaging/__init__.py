@@ -20,6 +20,8 @@ Key features:
 from openagents.mods.communication.thread_messaging.adapter import ThreadMessagingAgentAdapter
 from openagents.mods.communication.thread_messaging.mod import ThreadMessagingNetworkMod
 from openagents.mods.communication.thread_messaging.thread_messages import (
+    REACTION_TYPES,
+    MAX_BATCH_MESSAGES,
     DirectMessage,
     ChannelMessage,
     ReplyMessage,
@@ -33,6 +35,8 @@ from openagents.mods.communication.thread_messaging.thread_messages import (
 __all__ = [
     "ThreadMessagingAgentAdapter", 
     "ThreadMessagingNetworkMod",
+    "REACTION_TYPES",
+    "MAX_BATCH_MESSAGES",
     "DirectMessage",
     "ChannelMessage",
     "ReplyMessage",
@@ -9,12 +9,14 @@ This standalone mod provides Reddit-like threading and direct messaging with:
 - Message quoting
 """
 
+import asyncio
 import logging
 import base64
+import mmap
 import os
 import uuid
 import tempfile
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, Tuple, Union
 from pathlib import Path
 
 from openagents.core.base_mod_adapter import BaseModAdapter
@@ -25,6 +27,7 @@ from openagents.utils.message_util import (
     get_broadcast_message_thread_id
 )
 from .thread_messages import (
+    MAX_BATCH_MESSAGES,
     DirectMessage,
     ChannelMessage, 
     ReplyMessage,
@@ -66,6 +69,17 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
         self.pending_retrieval_requests: Dict[str, Dict[str, Any]] = {}  # request_id -> retrieval metadata
         self.temp_dir = None
         self.file_storage_path = None
+        
+        # Network responses keyed by their action
+        self._response_handlers = {
+            "file_upload_response": self._handle_file_upload_response,
+            "file_download_response": self._handle_file_download_response,
+            "list_channels_response": self._handle_channels_list_response,
+            "retrieve_channel_messages_response": self._handle_channel_messages_response,
+            "retrieve_direct_messages_response": self._handle_direct_messages_response,
+            "reaction_response": self._handle_reaction_response,
+            "reaction_notification": self._handle_reaction_notification
+        }
         self.available_channels: List[Dict[str, Any]] = []  # Channel list cache
     
     def initialize(self) -> bool:
@@ -149,22 +163,9 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
         logger.debug(f"Received protocol message from {message.sender_id}")
         
         # Handle different response types
-        action = message.content.get("action", "")
-        
-        if action == "file_upload_response":
-            await self._handle_file_upload_response(message)
-        elif action == "file_download_response":
-            await self._handle_file_download_response(message)
-        elif action == "list_channels_response":
-            await self._handle_channels_list_response(message)
-        elif action == "retrieve_channel_messages_response":
-            await self._handle_channel_messages_response(message)
-        elif action == "retrieve_direct_messages_response":
-            await self._handle_direct_messages_response(message)
-        elif action == "reaction_response":
-            await self._handle_reaction_response(message)
-        elif action == "reaction_notification":
-            await self._handle_reaction_notification(message)
+        handler = self._response_handlers.get(message.content.get("action"))
+        if handler:
+            await handler(message)
     
     async def send_direct_message(self, target_agent_id: str, text: str, quote: Optional[str] = None) -> None:
         """Send a direct message to another agent.
@@ -256,6 +257,45 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
         await self.connector.send_mod_message(message)
         logger.debug(f"Sent channel message to {channel}")
     
+    async def send_channel_messages(self, channel: str, texts: List[str]) -> None:
+        """Send several messages to a channel as a single network message.
+        
+        The network processes the items in order, each as its own channel message.
+        Lists longer than MAX_BATCH_MESSAGES are sent as several batches.
+        
+        Args:
+            channel: Channel name
+            texts: Text content of each message
+        """
+        if self.connector is None:
+            logger.error(f"Cannot send channel messages: connector is None for agent {self.agent_id}")
+            return
+        
+        if not texts:
+            return
+        
+        for start in range(0, len(texts), MAX_BATCH_MESSAGES):
+            channel_msgs = [
+                ChannelMessage(
+                    sender_id=self.agent_id,
+                    channel=channel,
+                    content={"text": text}
+                ).model_dump()
+                for text in texts[start:start + MAX_BATCH_MESSAGES]
+            ]
+            
+            # Wrap the batch in a single ModMessage for transport
+            message = ModMessage(
+                sender_id=self.agent_id,
+                mod="openagents.mods.communication.thread_messaging",
+                direction="outbound",
+                relevant_agent_id=self.agent_id,
+                content={"message_type": "message_batch", "messages": channel_msgs}
+            )
+            
+            await self.connector.send_mod_message(message)
+            logger.debug(f"Sent {len(channel_msgs)} channel messages to {channel} in one batch")
+    
     async def upload_file(self, file_path: Union[str, Path]) -> Optional[str]:
         """Upload a local file and get a UUID for it.
         
@@ -267,44 +307,37 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
+        try:
+            # Read and encode file off the event loop
+            loop = asyncio.get_running_loop()
+            encoded_content, file_size = await loop.run_in_executor(None, self._encode_file, file_path)
+            await self._send_file_upload(file_path.name, encoded_content, file_size)
+            
+            # For now, return None - the actual UUID will come in the response
+            return None
+        
+        except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
             return None
+        except Exception as e:
+            logger.error(f"Error uploading file: {e}")
+            return None
+    
+    async def upload_bytes(self, filename: str, payload: bytes) -> Optional[str]:
+        """Upload in-memory content as a file and get a UUID for it.
         
-        try:
-            # Read and encode file
-            with open(file_path, "rb") as f:
-                file_content = f.read()
-            
-            encoded_content = base64.b64encode(file_content).decode("utf-8")
-            
-            # Create upload message
-            upload_msg = FileUploadMessage(
-                sender_id=self.agent_id,
-                file_content=encoded_content,
-                filename=file_path.name,
-                mime_type=self._get_mime_type(file_path),
-                file_size=len(file_content)
-            )
-            
-            # Wrap in ModMessage for proper transport
-            message = ModMessage(
-                sender_id=self.agent_id,
-                mod="openagents.mods.communication.thread_messaging",
-                direction="outbound",
-                relevant_agent_id=self.agent_id,
-                content=upload_msg.model_dump()
-            )
-            
-            # Store pending operation
-            self.pending_file_operations[message.message_id] = {
-                "action": "upload",
-                "filename": file_path.name,
-                "timestamp": message.timestamp
-            }
+        Unlike upload_file, the content never touches the local filesystem.
+        
+        Args:
+            filename: Name to give the uploaded file
+            payload: Raw file content
             
-            await self.connector.send_mod_message(message)
-            logger.debug(f"Initiated file upload for {file_path.name}")
+        Returns:
+            Optional[str]: File UUID if successful, None if failed
+        """
+        try:
+            encoded_content = base64.b64encode(payload).decode("utf-8")
+            await self._send_file_upload(filename, encoded_content, len(payload))
             
             # For now, return None - the actual UUID will come in the response
             return None
@@ -313,6 +346,42 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             logger.error(f"Error uploading file: {e}")
             return None
     
+    async def _send_file_upload(self, filename: str, encoded_content: str, file_size: int) -> None:
+        """Send an upload request for base64-encoded file content.
+        
+        Args:
+            filename: Name of the uploaded file
+            encoded_content: Base64-encoded file content
+            file_size: Size of the raw content in bytes
+        """
+        # Create upload message
+        upload_msg = FileUploadMessage(
+            sender_id=self.agent_id,
+            file_content=encoded_content,
+            filename=filename,
+            mime_type=self._get_mime_type(Path(filename)),
+            file_size=file_size
+        )
+        
+        # Wrap in ModMessage for proper transport
+        message = ModMessage(
+            sender_id=self.agent_id,
+            mod="openagents.mods.communication.thread_messaging",
+            direction="outbound",
+            relevant_agent_id=self.agent_id,
+            content=upload_msg.model_dump()
+        )
+        
+        # Store pending operation, keyed by the request ID the network echoes back
+        self.pending_file_operations[upload_msg.message_id] = {
+            "action": "upload",
+            "filename": filename,
+            "timestamp": message.timestamp
+        }
+        
+        await self.connector.send_mod_message(message)
+        logger.debug(f"Initiated file upload for {filename}")
+    
     async def reply_channel_message(self, channel: str, reply_to_id: str, text: str, quote: Optional[str] = None) -> None:
         """Reply to a message in a channel (creates/continues thread).
         
@@ -401,7 +470,8 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
         await self.connector.send_mod_message(message)
         logger.debug(f"Sent reply to message {reply_to_id} for agent {target_agent_id}")
     
-    async def retrieve_channel_messages(self, channel: str, limit: int = 50, offset: int = 0, include_threads: bool = True) -> None:
+    async def retrieve_channel_messages(self, channel: str, limit: int = 50, offset: int = 0, include_threads: bool = True,
+                                        cursor: Optional[str] = None) -> None:
         """Retrieve messages from a specific channel.
         
         Args:
@@ -409,6 +479,7 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             limit: Maximum number of messages to retrieve (1-500, default 50)
             offset: Number of messages to skip for pagination (default 0)
             include_threads: Whether to include threaded messages (default True)
+            cursor: ``next_cursor`` from a previous page; takes precedence over offset
         """
         if self.connector is None:
             logger.error(f"Cannot retrieve messages: connector is None for agent {self.agent_id}")
@@ -426,7 +497,8 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             channel=channel,
             limit=limit,
             offset=offset,
-            include_threads=include_threads
+            include_threads=include_threads,
+            cursor=cursor
         )
         
         # Wrap in ModMessage for proper transport
@@ -438,12 +510,13 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             content=retrieval_msg.model_dump()
         )
         
-        # Store pending request
-        self.pending_retrieval_requests[message.message_id] = {
+        # Store pending request, keyed by the request ID the network echoes back
+        self.pending_retrieval_requests[retrieval_msg.message_id] = {
             "action": "retrieve_channel_messages",
             "channel": channel,
             "limit": limit,
             "offset": offset,
+            "cursor": cursor,
             "include_threads": include_threads,
             "timestamp": message.timestamp
         }
@@ -451,7 +524,8 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
         await self.connector.send_mod_message(message)
         logger.debug(f"Requested channel messages for {channel} (limit={limit}, offset={offset})")
     
-    async def retrieve_direct_messages(self, target_agent_id: str, limit: int = 50, offset: int = 0, include_threads: bool = True) -> None:
+    async def retrieve_direct_messages(self, target_agent_id: str, limit: int = 50, offset: int = 0, include_threads: bool = True,
+                                       cursor: Optional[str] = None) -> None:
         """Retrieve direct messages with a specific agent.
         
         Args:
@@ -459,6 +533,7 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             limit: Maximum number of messages to retrieve (1-500, default 50)
             offset: Number of messages to skip for pagination (default 0)
             include_threads: Whether to include threaded messages (default True)
+            cursor: ``next_cursor`` from a previous page; takes precedence over offset
         """
         if self.connector is None:
             logger.error(f"Cannot retrieve messages: connector is None for agent {self.agent_id}")
@@ -476,7 +551,8 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             target_agent_id=target_agent_id,
             limit=limit,
             offset=offset,
-            include_threads=include_threads
+            include_threads=include_threads,
+            cursor=cursor
         )
         
         # Wrap in ModMessage for proper transport
@@ -488,12 +564,13 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             content=retrieval_msg.model_dump()
         )
         
-        # Store pending request
-        self.pending_retrieval_requests[message.message_id] = {
+        # Store pending request, keyed by the request ID the network echoes back
+        self.pending_retrieval_requests[retrieval_msg.message_id] = {
             "action": "retrieve_direct_messages",
             "target_agent_id": target_agent_id,
             "limit": limit,
             "offset": offset,
+            "cursor": cursor,
             "include_threads": include_threads,
             "timestamp": message.timestamp
         }
@@ -528,8 +605,8 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             content=channel_info_msg.model_dump()
         )
         
-        # Store pending request
-        self.pending_channel_requests[message.message_id] = {
+        # Store pending request, keyed by the request ID the network echoes back
+        self.pending_channel_requests[channel_info_msg.message_id] = {
             "action": "list_channels",
             "timestamp": message.timestamp
         }
@@ -718,13 +795,22 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             channels = message.content.get("channels", [])
             self.available_channels = channels
             logger.info(f"Received channels list: {[ch['name'] for ch in channels]}")
+            notification = {"action": "channels_listed", "channels": channels}
         else:
             error = message.content.get("error", "Unknown error")
             logger.error(f"Failed to get channels list: {error}")
+            notification = {"action": "channels_list_error", "error": error}
         
         # Clean up pending request
         if request_id in self.pending_channel_requests:
             del self.pending_channel_requests[request_id]
+        
+        # Notify handlers
+        for handler_id, handler in self.message_handlers.items():
+            try:
+                handler(notification, message.sender_id)
+            except Exception as e:
+                logger.error(f"Error in message handler {handler_id}: {e}")
     
     async def _handle_channel_messages_response(self, message: ModMessage) -> None:
         """Handle channel messages retrieval response.
@@ -746,6 +832,7 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
                 offset = content.get("offset", 0)
                 limit = content.get("limit", 50)
                 has_more = content.get("has_more", False)
+                next_cursor = content.get("next_cursor")
                 
                 logger.debug(f"Retrieved {len(messages)} channel messages from {channel}")
                 
@@ -760,6 +847,7 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
                             "offset": offset,
                             "limit": limit,
                             "has_more": has_more,
+                            "next_cursor": next_cursor,
                             "request_info": request_info
                         }, message.sender_id)
                     except Exception as e:
@@ -800,6 +888,7 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
                 offset = content.get("offset", 0)
                 limit = content.get("limit", 50)
                 has_more = content.get("has_more", False)
+                next_cursor = content.get("next_cursor")
                 
                 logger.debug(f"Retrieved {len(messages)} direct messages with {target_agent_id}")
                 
@@ -814,6 +903,7 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
                             "offset": offset,
                             "limit": limit,
                             "has_more": has_more,
+                            "next_cursor": next_cursor,
                             "request_info": request_info
                         }, message.sender_id)
                     except Exception as e:
@@ -897,6 +987,27 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             except Exception as e:
                 logger.error(f"Error in message handler {handler_id}: {e}")
     
+    def _encode_file(self, file_path: Path) -> Tuple[str, int]:
+        """Base64-encode a file for upload.
+        
+        The content is encoded straight from a read-only memory map, so the raw
+        file is never copied into a bytes object. This does blocking I/O; call
+        it from an executor.
+        
+        Args:
+            file_path: Path to the file to encode
+            
+        Returns:
+            Tuple[str, int]: The base64-encoded content and the file size in bytes
+        """
+        # Empty files cannot be memory-mapped
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return "", 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return base64.b64encode(mapped).decode("utf-8"), size
+    
     def _get_mime_type(self, file_path: Path) -> str:
         """Get the MIME type for a file.
         
@@ -1114,6 +1225,10 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
                         "minimum": 0,
                         "default": 0
                     },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from a previous page; takes precedence over offset"
+                    },
                     "include_threads": {
                         "type": "boolean",
                         "description": "Whether to include threaded messages (default true)",
@@ -1150,6 +1265,10 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
                         "minimum": 0,
                         "default": 0
                     },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from a previous page; takes precedence over offset"
+                    },
                     "include_threads": {
                         "type": "boolean",
                         "description": "Whether to include threaded messages (default true)",
@@ -9,18 +9,22 @@ This standalone mod enables Reddit-like threading and direct messaging with:
 - Message quoting
 """
 
+import asyncio
+import bisect
 import logging
 import os
 import base64
 import uuid
 import tempfile
 import time
-from typing import Dict, Any, List, Optional, Set
+from itertools import islice
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
 from openagents.core.base_mod import BaseMod
 from openagents.models.messages import BaseMessage, ModMessage
 from .thread_messages import (
+    MAX_BATCH_MESSAGES,
     DirectMessage,
     ChannelMessage, 
     ReplyMessage,
@@ -248,7 +252,7 @@ class ThreadMessagingNetworkMod(BaseMod):
             Optional[DirectMessage]: The processed message, or None if the message was handled
         """
         self._add_to_history(message)
-        logger.debug(f"Processing direct message from {message.sender_id} to {message.target_agent_id}")
+        logger.debug("Processing direct message from %s to %s", message.sender_id, message.target_agent_id)
         return message
     
     async def process_broadcast_message(self, message) -> Optional[BaseMessage]:
@@ -273,9 +277,51 @@ class ThreadMessagingNetworkMod(BaseMod):
         """
         self._add_to_history(message)
         
+        # Batches carry several inner messages from one sender; handle each in order
+        if message.content.get("message_type") == "message_batch":
+            for content in self._batch_contents(message):
+                await self._process_mod_content(content)
+        else:
+            await self._process_mod_content(message.content)
+    
+    def _batch_contents(self, message: ModMessage) -> List[Dict[str, Any]]:
+        """Validate a message batch and return the inner messages to process.
+        
+        A batch that isn't a list, or has more than MAX_BATCH_MESSAGES items, is
+        rejected as a whole. Items that aren't dicts, or claim a sender other than
+        the agent that sent the batch, are skipped.
+        
+        Args:
+            message: The mod message carrying the batch
+            
+        Returns:
+            List[Dict[str, Any]]: The inner message contents, in order
+        """
+        contents = message.content.get("messages")
+        if not isinstance(contents, list):
+            logger.warning(f"Ignoring malformed message batch {message.message_id} from {message.sender_id}")
+            return []
+        if len(contents) > MAX_BATCH_MESSAGES:
+            logger.warning(f"Ignoring message batch {message.message_id} from {message.sender_id}: "
+                           f"{len(contents)} messages exceeds the limit of {MAX_BATCH_MESSAGES}")
+            return []
+        
+        valid_contents = []
+        for content in contents:
+            if not isinstance(content, dict) or content.get("sender_id") != message.sender_id:
+                logger.warning(f"Skipping batch item in {message.message_id} not sent by {message.sender_id}")
+                continue
+            valid_contents.append(content)
+        return valid_contents
+    
+    async def _process_mod_content(self, content: Dict[str, Any]) -> None:
+        """Process the inner message carried by a mod message.
+        
+        Args:
+            content: The inner message content
+        """
         # Extract the inner message from the ModMessage content
         try:
-            content = message.content
             message_type = content.get("message_type")
             
             if message_type == "reply_message":
@@ -333,7 +379,7 @@ class ThreadMessagingNetworkMod(BaseMod):
         else:
             logger.warning(f"Message sent to unknown channel: {channel}")
         
-        logger.debug(f"Processing channel message from {message.sender_id} in {channel}")
+        logger.debug("Processing channel message from %s in %s", message.sender_id, channel)
         
         # Broadcast the message to all other agents in the channel
         await self._broadcast_channel_message(message)
@@ -352,37 +398,42 @@ class ThreadMessagingNetworkMod(BaseMod):
         # Remove the sender from the notification list (they already know about their message)
         notify_agents = channel_agents - {message.sender_id}
         
-        logger.info(f"Channel {channel} has agents: {channel_agents}")
-        logger.info(f"Message sender: {message.sender_id}")
-        logger.info(f"Agents to notify: {notify_agents}")
-        
         if not notify_agents:
             logger.warning(f"No other agents to notify in channel {channel} - only sender {message.sender_id} present")
             return
         
-        logger.info(f"Broadcasting channel message to {len(notify_agents)} agents in {channel}: {notify_agents}")
+        logger.info("Broadcasting channel message from %s to %d agents in %s: %s",
+                    message.sender_id, len(notify_agents), channel, notify_agents)
         
-        # Create a mod message to notify other agents about the new channel message
-        for agent_id in notify_agents:
-            logger.info(f"Creating notification for agent: {agent_id}")
-            notification = ModMessage(
+        # Create a mod message to notify other agents about the new channel message;
+        # the message is serialized once and shared by every notification
+        message_data = message.model_dump()
+        recipients = list(notify_agents)
+        notifications = [
+            ModMessage(
                 sender_id=self.network.network_id,
                 mod="openagents.mods.communication.thread_messaging",
                 content={
                     "action": "channel_message_notification",
-                    "message": message.model_dump(),
+                    "message": message_data,
                     "channel": channel
                 },
                 direction="inbound",
                 relevant_agent_id=agent_id
             )
-            logger.info(f"Notification target_id will be: {notification.relevant_agent_id}")
-            
-            try:
-                await self.network.send_message(notification)
-                logger.debug(f"Sent channel message notification to agent {agent_id}")
-            except Exception as e:
-                logger.error(f"Failed to send channel message notification to {agent_id}: {e}")
+            for agent_id in recipients
+        ]
+        
+        # Send concurrently so one slow recipient doesn't hold up the others
+        results = await asyncio.gather(
+            *(self.network.send_message(notification) for notification in notifications),
+            return_exceptions=True
+        )
+        for agent_id, result in zip(recipients, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send channel message notification to {agent_id}: {result}")
+            else:
+                logger.debug("Sent channel message notification to agent %s", agent_id)
     
     async def _process_direct_message(self, message: DirectMessage) -> None:
         """Process a direct message.
@@ -391,7 +442,7 @@ class ThreadMessagingNetworkMod(BaseMod):
             message: The direct message to process
         """
         self._add_to_history(message)
-        logger.debug(f"Processing direct message from {message.sender_id} to {message.target_agent_id}")
+        logger.debug("Processing direct message from %s to %s", message.sender_id, message.target_agent_id)
     
     async def _process_reply_message(self, message: ReplyMessage) -> None:
         """Process a reply message and manage thread creation/updates.
@@ -745,12 +796,27 @@ class ThreadMessagingNetworkMod(BaseMod):
                 
                 channel_messages.append(msg_data)
         
-        # Sort by timestamp (newest first)
-        channel_messages.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-        
-        # Apply pagination
+        # Apply pagination (newest first)
         total_count = len(channel_messages)
-        paginated_messages = channel_messages[offset:offset + limit]
+        try:
+            paginated_messages, has_more, next_cursor = self._paginate_messages(
+                channel_messages, limit, offset, message.cursor
+            )
+        except ValueError as e:
+            response = ModMessage(
+                sender_id=self.network.network_id,
+                mod="openagents.mods.communication.thread_messaging",
+                content={
+                    "action": "retrieve_channel_messages_response",
+                    "success": False,
+                    "error": f"Invalid cursor: {e}",
+                    "request_id": message.message_id
+                },
+                direction="outbound",
+                relevant_agent_id=agent_id
+            )
+            await self.network.send_message(response)
+            return
         
         # Send response
         response = ModMessage(
@@ -764,7 +830,8 @@ class ThreadMessagingNetworkMod(BaseMod):
                 "total_count": total_count,
                 "offset": offset,
                 "limit": limit,
-                "has_more": (offset + limit) < total_count,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
                 "request_id": message.message_id
             },
             direction="outbound",
@@ -867,12 +934,27 @@ class ThreadMessagingNetworkMod(BaseMod):
                     
                     direct_messages.append(msg_data)
         
-        # Sort by timestamp (newest first)
-        direct_messages.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-        
-        # Apply pagination
+        # Apply pagination (newest first)
         total_count = len(direct_messages)
-        paginated_messages = direct_messages[offset:offset + limit]
+        try:
+            paginated_messages, has_more, next_cursor = self._paginate_messages(
+                direct_messages, limit, offset, message.cursor
+            )
+        except ValueError as e:
+            response = ModMessage(
+                sender_id=self.network.network_id,
+                mod="openagents.mods.communication.thread_messaging",
+                content={
+                    "action": "retrieve_direct_messages_response",
+                    "success": False,
+                    "error": f"Invalid cursor: {e}",
+                    "request_id": message.message_id
+                },
+                direction="outbound",
+                relevant_agent_id=agent_id
+            )
+            await self.network.send_message(response)
+            return
         
         # Send response
         response = ModMessage(
@@ -886,7 +968,8 @@ class ThreadMessagingNetworkMod(BaseMod):
                 "total_count": total_count,
                 "offset": offset,
                 "limit": limit,
-                "has_more": (offset + limit) < total_count,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
                 "request_id": message.message_id
             },
             direction="outbound",
@@ -895,6 +978,61 @@ class ThreadMessagingNetworkMod(BaseMod):
         await self.network.send_message(response)
         logger.debug(f"Sent {len(paginated_messages)} direct messages with {target_agent_id} to {agent_id}")
     
+    def _paginate_messages(self, messages: List[Dict[str, Any]], limit: int, offset: int = 0,
+                           cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], bool, Optional[str]]:
+        """Select one page of messages, newest first.
+        
+        Messages are ordered by (timestamp, message_id). With a cursor from a
+        previous page, the page starts right after the cursor message, found by
+        binary search; messages arriving in between don't shift the page like
+        they do with an offset. Without a cursor, the newest ``offset`` messages
+        are skipped.
+        
+        Args:
+            messages: Serialized messages to paginate (sorted in place)
+            limit: Maximum number of messages in the page
+            offset: Number of newest messages to skip when no cursor is given
+            cursor: Opaque cursor returned as ``next_cursor`` by a previous page
+            
+        Returns:
+            Tuple of (page, has_more, next_cursor)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        messages.sort(key=self._message_sort_key)
+        if cursor:
+            keys = [self._message_sort_key(msg_data) for msg_data in messages]
+            end = bisect.bisect_left(keys, self._decode_cursor(cursor))
+        else:
+            end = max(len(messages) - offset, 0)
+        start = max(end - limit, 0)
+        
+        page = messages[start:end][::-1]
+        has_more = start > 0
+        next_cursor = None
+        if has_more and page:
+            timestamp, message_id = self._message_sort_key(page[-1])
+            next_cursor = f"{timestamp}:{message_id}"
+        return page, has_more, next_cursor
+    
+    @staticmethod
+    def _message_sort_key(msg_data: Dict[str, Any]) -> Tuple[int, str]:
+        """Get the pagination sort key of a serialized message."""
+        return msg_data.get('timestamp', 0), msg_data.get('message_id', '')
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[int, str]:
+        """Decode a pagination cursor into a message sort key.
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        timestamp, separator, message_id = cursor.partition(":")
+        if not separator or not message_id:
+            raise ValueError(f"malformed cursor '{cursor}'")
+        return int(timestamp), message_id
+    
     async def _process_reaction_message(self, message: ReactionMessage) -> None:
         """Process a reaction message.
         
@@ -1006,23 +1144,32 @@ class ThreadMessagingNetworkMod(BaseMod):
         # Remove the reacting agent from notifications (they already know)
         notify_agents.discard(agent_id)
         
-        # Send notification to relevant agents
-        for notify_agent in notify_agents:
-            notification = ModMessage(
-                sender_id=self.network.network_id,
-                mod="openagents.mods.communication.thread_messaging",
-                content={
-                    "action": "reaction_notification",
-                    "target_message_id": target_message_id,
-                    "reaction_type": reaction_type,
-                    "reacting_agent": agent_id,
-                    "action_taken": action,
-                    "total_reactions": len(self.reactions.get(target_message_id, {}).get(reaction_type, set()))
-                },
-                direction="outbound",
-                relevant_agent_id=notify_agent
-            )
-            await self.network.send_message(notification)
+        # Send notification to relevant agents concurrently
+        content = {
+            "action": "reaction_notification",
+            "target_message_id": target_message_id,
+            "reaction_type": reaction_type,
+            "reacting_agent": agent_id,
+            "action_taken": action,
+            "total_reactions": len(self.reactions.get(target_message_id, {}).get(reaction_type, set()))
+        }
+        recipients = list(notify_agents)
+        results = await asyncio.gather(
+            *(
+                self.network.send_message(ModMessage(
+                    sender_id=self.network.network_id,
+                    mod="openagents.mods.communication.thread_messaging",
+                    content=content,
+                    direction="outbound",
+                    relevant_agent_id=notify_agent
+                ))
+                for notify_agent in recipients
+            ),
+            return_exceptions=True
+        )
+        for notify_agent, result in zip(recipients, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send reaction notification to {notify_agent}: {result}")
     
     def get_state(self) -> Dict[str, Any]:
         """Get the current state of the Thread Messaging protocol.
@@ -1053,11 +1200,9 @@ class ThreadMessagingNetworkMod(BaseMod):
         
         # Trim history if it exceeds the maximum size
         if len(self.message_history) > self.max_history_size:
-            # Remove oldest messages
-            oldest_ids = sorted(
-                self.message_history.keys(), 
-                key=lambda k: self.message_history[k].timestamp
-            )[:200]
+            # Remove oldest messages; the dict keeps arrival order, so they are
+            # the first keys and no sort over the whole history is needed
+            oldest_ids = list(islice(self.message_history, 200))
             for old_id in oldest_ids:
                 del self.message_history[old_id]
     
@@ -4,6 +4,17 @@ from typing import Dict, List, Optional, Any, Union
 from pydantic import BaseModel, Field, field_validator
 from openagents.models.messages import BaseMessage
 
+# Common emoji reactions accepted by ReactionMessage
+REACTION_TYPES = (
+    "+1", "-1", "like", "heart", "laugh", "wow", "sad", "angry",
+    "thumbs_up", "thumbs_down", "smile", "ok", "done", "fire",
+    "party", "clap", "check", "cross", "eyes", "thinking"
+)
+_VALID_REACTIONS = frozenset(REACTION_TYPES)
+
+# Most inner messages the network accepts in one message_batch
+MAX_BATCH_MESSAGES = 100
+
 class DirectMessage(BaseMessage):
     """A direct message between two agents."""
     
@@ -89,6 +100,7 @@ class MessageRetrievalMessage(BaseMessage):
     target_agent_id: Optional[str] = Field(None, description="Target agent ID for direct message retrieval")
     limit: int = Field(50, description="Maximum number of messages to retrieve")
     offset: int = Field(0, description="Number of messages to skip (for pagination)")
+    cursor: Optional[str] = Field(None, description="Cursor from a previous page's next_cursor; takes precedence over offset")
     include_threads: bool = Field(True, description="Whether to include threaded messages")
     
     @field_validator('action')
@@ -120,14 +132,8 @@ class ReactionMessage(BaseMessage):
     @classmethod
     def validate_reaction_type(cls, v):
         """Validate reaction type."""
-        # Common emoji reactions
-        valid_reactions = [
-            "+1", "-1", "like", "heart", "laugh", "wow", "sad", "angry",
-            "thumbs_up", "thumbs_down", "smile", "ok", "done", "fire",
-            "party", "clap", "check", "cross", "eyes", "thinking"
-        ]
-        if v not in valid_reactions:
-            raise ValueError(f'reaction_type must be one of: {", ".join(valid_reactions)}')
+        if v not in _VALID_REACTIONS:
+            raise ValueError(f'reaction_type must be one of: {", ".join(REACTION_TYPES)}')
         return v
     
     @field_validator('action')
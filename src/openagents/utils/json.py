@@ -0,0 +1,59 @@
+"""
+JSON encoding utilities for OpenAgents.
+
+Provides the JSON codec used for websocket frames. orjson is used when it is
+installed (see the speedups extra), with the standard library as a fallback.
+"""
+
+import json
+from typing import Any, Union
+
+# orjson parses bytes directly, so frames can be read without decoding them to
+# str first. Encoded frames are UTF-8 bytes that can be sent as text frames
+# without a round trip through str.
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            bytes: The encoded JSON document
+        """
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def json_loads(data: Union[str, bytes]) -> Any:
+        """Decode a JSON document from str or UTF-8 bytes.
+
+        Args:
+            data: JSON document to decode
+
+        Returns:
+            Any: The decoded object
+        """
+        return orjson.loads(data)
+except ImportError:
+    def json_dumps(obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            bytes: The encoded JSON document
+        """
+        return json.dumps(obj).encode()
+
+    def json_loads(data: Union[str, bytes]) -> Any:
+        """Decode a JSON document from str or UTF-8 bytes.
+
+        Args:
+            data: JSON document to decode
+
+        Returns:
+            Any: The decoded object
+        """
+        return json.loads(data)
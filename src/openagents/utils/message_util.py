@@ -19,10 +19,15 @@ def parse_message_dict(message_dict: Dict[str, Any]) -> BaseMessage:
         merged_dict = message_dict.copy()
         payload = merged_dict.pop("payload", {})
         
-        # Add required ModMessage fields from payload if missing
-        if "mod" not in merged_dict and "mod" in payload:
+        # Add required ModMessage fields from payload if missing; a serialized
+        # transport message carries empty defaults for these at the top level
+        if not merged_dict.get("content") and "content" in payload:
+            merged_dict["content"] = payload["content"]
+        if not merged_dict.get("metadata") and "metadata" in payload:
+            merged_dict["metadata"] = payload["metadata"]
+        if not merged_dict.get("mod") and "mod" in payload:
             merged_dict["mod"] = payload["mod"]
-        if "direction" not in merged_dict and "direction" in payload:
+        if not merged_dict.get("direction") and "direction" in payload:
             merged_dict["direction"] = payload["direction"]
         if "relevant_agent_id" not in merged_dict and "target_id" in message_dict:
             merged_dict["relevant_agent_id"] = message_dict["target_id"]
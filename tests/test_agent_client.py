@@ -0,0 +1,116 @@
+"""
+Unit tests for the AgentClient and NetworkConnector classes.
+
+This module contains tests for client-side connection handling:
+- Reusing a live connection across connect calls
+- Disconnect behaviour without an active connection
+- Registering message handlers by message type
+- Notifying thread listeners when adapters add messages
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from openagents.core.client import AgentClient
+from openagents.models.messages import DirectMessage
+from openagents.mods.communication.simple_messaging.adapter import SimpleMessagingAgentAdapter
+
+
+class TestAgentClientConnection:
+    """Test connection reuse in AgentClient."""
+
+    async def test_connect_reuses_live_connection(self):
+        """Test that connecting again to the same server keeps the existing connector."""
+        client = AgentClient(agent_id="test-agent")
+        connector = MagicMock()
+        connector.host = "localhost"
+        connector.port = 8570
+        connector.metadata = None
+        connector.max_message_size = 104857600
+        connector.is_connected = True
+        connector.disconnect = AsyncMock(return_value=True)
+        client.connector = connector
+
+        result = await client.connect_to_server(host="localhost", port=8570)
+
+        assert result is True
+        assert client.connector is connector
+        connector.disconnect.assert_not_called()
+
+    async def test_connect_with_other_metadata_reconnects(self):
+        """Test that connecting to the same server with other metadata opens a new connection."""
+        client = AgentClient(agent_id="test-agent")
+        connector = MagicMock()
+        connector.host = "localhost"
+        connector.port = 8570
+        connector.metadata = {"role": "reader"}
+        connector.max_message_size = 104857600
+        connector.is_connected = True
+        connector.disconnect = AsyncMock(return_value=True)
+        client.connector = connector
+
+        with patch("openagents.core.client.NetworkConnector") as connector_class:
+            connector_class.return_value.connect_to_server = AsyncMock(return_value=True)
+            result = await client.connect_to_server(host="localhost", port=8570, metadata={"role": "writer"})
+
+        assert result is True
+        connector.disconnect.assert_awaited_once()
+        connector_class.assert_called_once_with("localhost", 8570, "test-agent", {"role": "writer"}, 104857600)
+        assert client.connector is connector_class.return_value
+
+    async def test_disconnect_without_connector(self):
+        """Test that disconnecting a client that never connected is a no-op."""
+        client = AgentClient(agent_id="test-agent")
+
+        assert await client.disconnect() is False
+
+
+class TestAgentClientMessageHandlers:
+    """Test direct message handler registration in AgentClient."""
+
+    def test_on_message_before_connect(self):
+        """Test that handlers registered before connecting are stored by message type."""
+        client = AgentClient(agent_id="test-agent")
+
+        async def handler(message):
+            pass
+
+        client.on_message("direct_message", handler)
+        client.on_message("direct_message", handler)
+
+        assert client._message_handlers == {"direct_message": [handler]}
+
+    def test_on_message_with_connector(self):
+        """Test that handlers are attached to an existing connector immediately."""
+        client = AgentClient(agent_id="test-agent")
+        client.connector = MagicMock()
+
+        async def handler(message):
+            pass
+
+        client.on_message("broadcast_message", handler)
+
+        client.connector.register_message_handler.assert_called_once_with("broadcast_message", handler)
+
+
+class TestAgentClientThreadListeners:
+    """Test thread listener registration in AgentClient."""
+
+    def test_thread_listener_attached_to_adapters(self):
+        """Test that listeners reach adapters registered before and after them."""
+        client = AgentClient(agent_id="test-agent")
+        seen = []
+
+        client.register_thread_listener(lambda thread_id, message: seen.append((thread_id, message)))
+        adapter = SimpleMessagingAgentAdapter()
+        client.register_mod_adapter(adapter)
+
+        message = DirectMessage(sender_id="other-agent", target_agent_id="test-agent", content={"text": "hi"})
+        adapter.add_message_to_thread("direct_message:other-agent", message)
+
+        assert seen == [("direct_message:other-agent", message)]
@@ -0,0 +1,81 @@
+"""
+Unit tests for the AgentRunner base class.
+
+This module contains tests for runner behaviour that doesn't need a network:
+- Leaving the global event loop policy alone unless asked to change it
+- Not reprocessing messages whose processed IDs have been forgotten
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from openagents.agents import runner as runner_module
+from openagents.agents.runner import AgentRunner
+from openagents.models.messages import BroadcastMessage
+
+
+class _Runner(AgentRunner):
+    """Minimal concrete runner for testing."""
+
+    async def react(self, message_threads, incoming_thread_id, incoming_message):
+        pass
+
+
+class TestAgentRunnerEventLoopPolicy:
+    """Test event loop policy handling in the sync wrappers."""
+
+    @pytest.fixture(autouse=True)
+    def restore_policy(self):
+        """Restore the global event loop policy after each test."""
+        policy = asyncio.get_event_loop_policy()
+        yield
+        asyncio.set_event_loop_policy(policy)
+
+    def test_policy_untouched_by_default(self):
+        """Test that the runner doesn't replace the policy unless asked to."""
+        policy = asyncio.get_event_loop_policy()
+
+        _Runner(agent_id="test-agent")._install_event_loop_policy()
+
+        assert asyncio.get_event_loop_policy() is policy
+
+    def test_explicit_policy_installed(self):
+        """Test that a policy given to the constructor is installed."""
+        policy = asyncio.DefaultEventLoopPolicy()
+
+        _Runner(agent_id="test-agent", event_loop_policy=policy)._install_event_loop_policy()
+
+        assert asyncio.get_event_loop_policy() is policy
+
+
+class TestAgentRunnerProcessedMessages:
+    """Test tracking of processed messages."""
+
+    def test_processed_ids_are_forgotten_oldest_first(self, monkeypatch):
+        """Test that the capped ID set forgets the earliest processed message first."""
+        monkeypatch.setattr(runner_module, "MAX_PROCESSED_MESSAGE_IDS", 2)
+        runner = _Runner(agent_id="test-agent")
+        # Sender clocks are not trusted; the earliest processed message is forgotten first
+        messages = [
+            BroadcastMessage(sender_id="other-agent", content={"text": str(i)}, timestamp=3000 - i)
+            for i in range(3)
+        ]
+        for message in messages:
+            runner._mark_processed(message.message_id)
+
+        assert runner._processed_message_ids == {messages[1].message_id, messages[2].message_id}
+        for message in messages[1:]:
+            runner._enqueue_pending("broadcast", message)
+        assert runner._pop_pending() is None
+
+        # A message with an old timestamp is still new if its ID was never processed
+        late = BroadcastMessage(sender_id="other-agent", content={"text": "late"}, timestamp=1)
+        runner._enqueue_pending("broadcast", late)
+        runner._enqueue_pending("broadcast", late)
+        assert runner._pop_pending() == ("broadcast", late)
+        assert runner._pop_pending() is None
@@ -4,12 +4,20 @@ Unit tests for the network launcher.
 
 import pytest
 import asyncio
+import os
+import signal
+import sys
 from unittest.mock import patch, MagicMock, AsyncMock
 from pathlib import Path
 
 from openagents.launchers.network_launcher import launch_network, async_launch_network
 
 
+async def _wait_forever():
+    """Stand-in for a network that never shuts itself down."""
+    await asyncio.Event().wait()
+
+
 class TestNetworkLauncher:
     """Test cases for network launcher functionality."""
     
@@ -55,6 +63,7 @@ network:
             mock_network = MagicMock()
             mock_network.initialize = AsyncMock(return_value=True)
             mock_network.shutdown = AsyncMock(return_value=True)
+            mock_network.wait_for_shutdown = AsyncMock(side_effect=_wait_forever)
             mock_network.is_running = True
             mock_network.network_name = "TestNetwork"
             mock_network.get_network_stats = MagicMock(return_value={"status": "running"})
@@ -75,6 +84,52 @@ network:
             mock_network.initialize.assert_called_once()
             mock_network.shutdown.assert_called_once()
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == 'win32', reason="loop signal handlers are not available on Windows")
+    async def test_async_launch_network_stops_on_signal(self, valid_config_file):
+        """Test that a shutdown signal ends the run early and shuts the network down once."""
+        with patch('openagents.launchers.network_launcher.create_network') as mock_create, \
+             patch('openagents.launchers.network_launcher.load_network_config') as mock_load:
+            mock_config = MagicMock()
+            mock_config.network.mode = "centralized"
+            mock_load.return_value = mock_config
+
+            mock_network = MagicMock()
+            mock_network.initialize = AsyncMock(return_value=True)
+            mock_network.shutdown = AsyncMock(return_value=True)
+            mock_network.wait_for_shutdown = AsyncMock(side_effect=_wait_forever)
+            mock_network.network_name = "TestNetwork"
+            mock_network.get_network_stats = MagicMock(return_value={"status": "running"})
+            mock_create.return_value = mock_network
+
+            asyncio.get_running_loop().call_later(0.1, os.kill, os.getpid(), signal.SIGTERM)
+            await asyncio.wait_for(async_launch_network(valid_config_file, runtime=30), timeout=5)
+
+            mock_network.shutdown.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_launch_network_returns_when_network_stops(self, valid_config_file):
+        """Test that the launcher returns once the network shuts itself down."""
+        with patch('openagents.launchers.network_launcher.create_network') as mock_create, \
+             patch('openagents.launchers.network_launcher.load_network_config') as mock_load:
+            mock_config = MagicMock()
+            mock_config.network.mode = "centralized"
+            mock_load.return_value = mock_config
+
+            mock_network = MagicMock()
+            mock_network.initialize = AsyncMock(return_value=True)
+            mock_network.shutdown = AsyncMock(return_value=True)
+            mock_network.wait_for_shutdown = AsyncMock(return_value=None)
+            mock_network.is_running = False
+            mock_network.network_name = "TestNetwork"
+            mock_network.get_network_stats = MagicMock(return_value={"status": "stopped"})
+            mock_create.return_value = mock_network
+
+            await asyncio.wait_for(async_launch_network(valid_config_file), timeout=5)
+
+            mock_network.wait_for_shutdown.assert_called_once()
+            mock_network.shutdown.assert_called_once()
+
     def test_launch_network_sync(self, valid_config_file):
         """Test synchronous network launch wrapper."""
         with patch('openagents.launchers.network_launcher.asyncio.run') as mock_asyncio_run, \
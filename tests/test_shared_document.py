@@ -3,7 +3,7 @@ Tests for the Shared Document mod.
 
 This module contains comprehensive unit and integration tests for the shared document
 functionality including:
-- All 13 tools (create_document, open_document, insert_lines, etc.)
+- All 15 tools (create_document, open_document, insert_lines, etc.)
 - Document operations (insert, remove, replace lines)
 - Commenting system with line-specific comments
 - Agent presence tracking and cursor positions
@@ -16,7 +16,7 @@ import pytest
 import asyncio
 import uuid
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any, List
 
@@ -32,10 +32,13 @@ from openagents.mods.communication.shared_document.document_messages import (
     InsertLinesMessage,
     RemoveLinesMessage,
     ReplaceLinesMessage,
+    BulkEditMessage,
     AddCommentMessage,
+    BulkCommentMessage,
     RemoveCommentMessage,
     UpdateCursorPositionMessage,
     GetDocumentContentMessage,
+    GetDocumentContentPageMessage,
     GetDocumentHistoryMessage,
     ListDocumentsMessage,
     GetAgentPresenceMessage,
@@ -45,7 +48,9 @@ from openagents.mods.communication.shared_document.document_messages import (
     DocumentHistoryResponse,
     AgentPresenceResponse,
     CursorPosition,
-    DocumentComment
+    DocumentComment,
+    LineEdit,
+    LineComment
 )
 from openagents.models.messages import ModMessage
 
@@ -222,6 +227,20 @@ class TestSharedDocumentNetworkMod:
         assert sample_document.comments[3][0].line_number == 3
         assert sample_document.comments[4][0].line_number == 4
 
+    def test_comment_arrays_after_line_removal(self, sample_document):
+        """Test that removing lines drops their comments and shifts later ones in the comment arrays."""
+        sample_document.add_agent("test_agent", "read_write")
+        sample_document.add_comment("test_agent", 1, "Comment on line 1")
+        sample_document.add_comment("test_agent", 2, "Comment on line 2")
+        sample_document.add_comment("test_agent", 3, "Comment on line 3")
+
+        sample_document.remove_lines("test_agent", 2, 2)
+
+        assert sample_document.comment_count == 2
+        assert list(sample_document.comment_line) == [1, 2]
+        assert sample_document.comment_text == ["Comment on line 1", "Comment on line 3"]
+        assert [c.comment_text for c in sample_document.comments_on_line(2)] == ["Comment on line 3"]
+
     @pytest.mark.asyncio
     async def test_create_document_message_handling(self, network_mod):
         """Test handling of create document messages."""
@@ -232,11 +251,11 @@ class TestSharedDocumentNetworkMod:
             sender_id="agent1"
         )
 
-        await network_mod._handle_create_document(message, "agent1")
+        doc_id = await network_mod._handle_create_document(message, "agent1")
 
         # Check that document was created
         assert len(network_mod.documents) == 1
-        doc_id = list(network_mod.documents.keys())[0]
+        assert doc_id in network_mod.documents
         document = network_mod.documents[doc_id]
         
         assert document.name == "Test Doc"
@@ -245,6 +264,26 @@ class TestSharedDocumentNetworkMod:
         assert "agent1" in document.access_permissions
         assert document.access_permissions["agent1"] == "admin"
 
+    @pytest.mark.asyncio
+    async def test_document_readiness_events(self, network_mod):
+        """Test that creation and open events are set once the operations complete."""
+        assert not network_mod.document_created("Test Doc").is_set()
+
+        doc_id = await network_mod._handle_create_document(
+            CreateDocumentMessage(document_name="Test Doc", sender_id="agent1"), "agent1"
+        )
+        assert network_mod.document_created("Test Doc").is_set()
+        assert not network_mod.document_created("Other Doc").is_set()
+
+        opened = network_mod.document_opened(doc_id, "agent1")
+        assert not opened.is_set()
+
+        await network_mod._handle_open_document(OpenDocumentMessage(document_id=doc_id, sender_id="agent1"), "agent1")
+        await asyncio.wait_for(opened.wait(), timeout=1)
+
+        await network_mod._handle_close_document(CloseDocumentMessage(document_id=doc_id, sender_id="agent1"), "agent1")
+        assert not network_mod.document_opened(doc_id, "agent1").is_set()
+
     @pytest.mark.asyncio
     async def test_insert_lines_message_handling(self, network_mod):
         """Test handling of insert lines messages."""
@@ -289,6 +328,136 @@ class TestSharedDocumentNetworkMod:
         assert document.comments[1][0].comment_text == "Test comment"
 
 
+    @pytest.mark.asyncio
+    async def test_bulk_edit_message_handling(self, network_mod):
+        """Test that a bulk edit applies all replacements with a single response."""
+        document = SharedDocument("doc-123", "Test", "agent1", "Line 1\nLine 2\nLine 3")
+        document.add_agent("agent1", "admin")
+        network_mod.documents["doc-123"] = document
+
+        message = BulkEditMessage(
+            document_id="doc-123",
+            edits=[
+                LineEdit(start_line=1, end_line=1, content=["First"]),
+                LineEdit(start_line=3, end_line=3, content=["Third", "Fourth"])
+            ],
+            sender_id="agent1"
+        )
+
+        await network_mod._handle_bulk_edit(message, "agent1")
+
+        assert document.content == ["First", "Line 2", "Third", "Fourth"]
+        assert document.version == 3
+        assert network_mod.network.send_message.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_operation_completed_event(self, network_mod):
+        """Test that a request's completion event is set by its success or error response."""
+        document = SharedDocument("doc-123", "Test", "agent1", "Line 1\nLine 2")
+        document.add_agent("agent1", "admin")
+        network_mod.documents["doc-123"] = document
+
+        applied = BulkEditMessage(
+            document_id="doc-123",
+            edits=[LineEdit(start_line=1, end_line=1, content=["First"])],
+            sender_id="agent1"
+        )
+        rejected = BulkEditMessage(
+            document_id="doc-123",
+            edits=[LineEdit(start_line=10, end_line=10, content=["Out of range"])],
+            sender_id="agent1"
+        )
+        assert not network_mod.operation_completed(applied.message_id).is_set()
+
+        await network_mod._handle_bulk_edit(applied, "agent1")
+        await network_mod._handle_bulk_edit(rejected, "agent1")
+
+        assert network_mod.operation_completed(applied.message_id).is_set()
+        assert network_mod.operation_completed(rejected.message_id).is_set()
+
+    def test_document_bulk_edit_rollback(self, sample_document):
+        """Test that a failing edit rolls back the whole batch."""
+        sample_document.add_agent("test_agent", "read_write")
+        sample_document.add_comment("test_agent", 2, "Keep me")
+
+        with pytest.raises(ValueError):
+            sample_document.replace_lines_bulk("test_agent", [
+                LineEdit(start_line=2, end_line=2, content=["Changed"]),
+                LineEdit(start_line=10, end_line=10, content=["Out of range"])
+            ])
+
+        assert sample_document.content == ["Line 1", "Line 2", "Line 3"]
+        assert sample_document.version == 1
+        assert len(sample_document.operation_history) == 0
+        assert sample_document.comments[2][0].comment_text == "Keep me"
+
+    @pytest.mark.asyncio
+    async def test_bulk_comment_message_handling(self, network_mod):
+        """Test that a bulk comment request adds all comments."""
+        document = SharedDocument("doc-123", "Test", "agent1", "Line 1\nLine 2")
+        document.add_agent("agent1", "admin")
+        network_mod.documents["doc-123"] = document
+
+        message = BulkCommentMessage(
+            document_id="doc-123",
+            comments=[
+                LineComment(line_number=1, comment_text="First"),
+                LineComment(line_number=2, comment_text="Second"),
+                LineComment(line_number=2, comment_text="Third")
+            ],
+            sender_id="agent1"
+        )
+
+        await network_mod._handle_bulk_comments(message, "agent1")
+
+        assert len(document.comments[1]) == 1
+        assert [c.comment_text for c in document.comments[2]] == ["Second", "Third"]
+        assert network_mod.network.send_message.call_count == 1
+
+    def test_bulk_operations_share_timestamp(self, sample_document):
+        """Test that every item in a batch is stamped with the same time."""
+        sample_document.add_agent("test_agent", "read_write")
+
+        operations = sample_document.replace_lines_bulk("test_agent", [
+            LineEdit(start_line=1, end_line=1, content=["One"]),
+            LineEdit(start_line=3, end_line=3, content=["Three"])
+        ])
+        comments = sample_document.add_comments("test_agent", [
+            LineComment(line_number=1, comment_text="First"),
+            LineComment(line_number=3, comment_text="Third")
+        ])
+
+        assert operations[0].timestamp == operations[1].timestamp
+        assert comments[0].timestamp == comments[1].timestamp
+        assert sample_document.last_modified == comments[1].timestamp
+
+    @pytest.mark.asyncio
+    async def test_get_document_content_page_handling(self, network_mod):
+        """Test that a content page returns only the requested lines and their comments."""
+        document = SharedDocument("doc-123", "Test", "agent1", "\n".join(f"Line {i}" for i in range(1, 11)))
+        document.add_agent("agent1", "admin")
+        document.add_comment("agent1", 2, "Outside page")
+        document.add_comment("agent1", 5, "Inside page")
+        network_mod.documents["doc-123"] = document
+
+        message = GetDocumentContentPageMessage(
+            document_id="doc-123",
+            offset=3,
+            limit=4,
+            sender_id="agent1"
+        )
+
+        await network_mod._handle_get_document_content_page(message, "agent1")
+
+        mod_message = network_mod.network.send_message.call_args[0][1]
+        page = mod_message.content
+        assert page["message_type"] == "document_content_page_response"
+        assert page["request_id"] == message.message_id
+        assert page["lines"] == ["Line 4", "Line 5", "Line 6", "Line 7"]
+        assert [c["comment_text"] for c in page["comments"]] == ["Inside page"]
+        assert page["total_lines"] == 10
+
+
 class TestSharedDocumentAgentAdapter:
     """Test cases for the SharedDocumentAgentAdapter."""
 
@@ -317,12 +486,13 @@ class TestSharedDocumentAgentAdapter:
         expected_tools = [
             "create_document", "open_document", "close_document",
             "insert_lines", "remove_lines", "replace_lines",
-            "add_comment", "remove_comment", "update_cursor_position",
+            "replace_lines_bulk", "add_comment", "add_comments",
+            "remove_comment", "update_cursor_position",
             "get_document_content", "get_document_history",
             "list_documents", "get_agent_presence"
         ]
         
-        assert len(tools) == 13
+        assert len(tools) == 15
         for expected_tool in expected_tools:
             assert expected_tool in tool_names
 
@@ -378,6 +548,84 @@ class TestSharedDocumentAgentAdapter:
         assert result["status"] == "success"
         assert "Comment added to line 3" in result["message"]
 
+    def test_iso_now_matches_datetime(self):
+        """Test that the cached ISO timestamp helper matches datetime.now()."""
+        from openagents.mods.communication.shared_document.adapter import _iso_now
+
+        before = datetime.now()
+        first = datetime.fromisoformat(_iso_now())
+        second = datetime.fromisoformat(_iso_now())
+        after = datetime.now()
+
+        # Allow for microsecond rounding differences between the two clocks
+        tolerance = timedelta(milliseconds=1)
+        assert before - tolerance <= first <= second <= after + tolerance
+
+    @pytest.mark.asyncio
+    async def test_bulk_tools_send_single_message(self, agent_adapter):
+        """Test that bulk tools pack all items into one message."""
+        result = await agent_adapter.add_comments(
+            document_id="doc-123",
+            comments=[
+                {"line_number": 1, "comment_text": "First"},
+                {"line_number": 4, "comment_text": "Second"}
+            ]
+        )
+
+        assert result["status"] == "success"
+        agent_adapter.network_interface.send_mod_message.assert_called_once()
+        content = agent_adapter.network_interface.send_mod_message.call_args[0][0].content
+        assert content["message_type"] == "bulk_comment"
+        assert len(content["comments"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_document_content(self, agent_adapter):
+        """Test that document content is requested page by page until all lines are read."""
+        pages = [
+            {"offset": 0, "lines": ["a", "b"], "comments": [], "total_lines": 3, "version": 1},
+            {"offset": 2, "lines": ["c"], "comments": [], "total_lines": 3, "version": 1}
+        ]
+        remaining = iter(pages)
+
+        async def wait_mod_message(mod_name, filter_dict=None, timeout=5.0):
+            if filter_dict["message_type"] == "document_content_page_response":
+                return Mock(content=next(remaining))
+            await asyncio.sleep(timeout)
+            return None
+
+        connector = Mock()
+        connector.wait_mod_message = wait_mod_message
+        agent_adapter.bind_connector(connector)
+
+        received = [page async for page in agent_adapter.iter_document_content("doc-123", chunk_lines=2)]
+
+        assert [page["lines"] for page in received] == [["a", "b"], ["c"]]
+        sent = [call[0][0].content for call in agent_adapter.network_interface.send_mod_message.call_args_list]
+        assert [(m["offset"], m["limit"]) for m in sent] == [(0, 2), (2, 2)]
+
+    @pytest.mark.asyncio
+    async def test_iter_document_content_raises_on_error(self, agent_adapter):
+        """Test that an error response from the mod is raised instead of ending the iteration."""
+        error = {
+            "message_type": "document_operation_response",
+            "success": False,
+            "error_message": "Document not found: doc-404"
+        }
+
+        async def wait_mod_message(mod_name, filter_dict=None, timeout=5.0):
+            if filter_dict["message_type"] == "document_operation_response":
+                return Mock(content=error)
+            await asyncio.sleep(timeout)
+            return None
+
+        connector = Mock()
+        connector.wait_mod_message = wait_mod_message
+        agent_adapter.bind_connector(connector)
+
+        with pytest.raises(RuntimeError, match="Document not found"):
+            async for _ in agent_adapter.iter_document_content("doc-404"):
+                pass
+
     @pytest.mark.asyncio
     async def test_update_cursor_position_tool(self, agent_adapter):
         """Test the update_cursor_position tool."""
@@ -561,10 +809,7 @@ class TestIntegrationScenarios:
             sender_id="agent1"
         )
 
-        await network_mod._handle_create_document(create_msg, "agent1")
-        
-        # Get the created document
-        doc_id = list(network_mod.documents.keys())[0]
+        doc_id = await network_mod._handle_create_document(create_msg, "agent1")
         document = network_mod.documents[doc_id]
 
         # Agent2 opens the document
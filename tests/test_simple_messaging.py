@@ -6,6 +6,7 @@ using the new AgentNetwork architecture.
 """
 
 import asyncio
+import base64
 import pytest
 import logging
 import tempfile
@@ -13,10 +14,12 @@ import os
 import time
 import random
 from typing import List, Dict, Any
+from unittest.mock import AsyncMock, MagicMock
 
 from src.openagents.core.network import AgentNetwork, create_network
 from src.openagents.models.network_config import NetworkConfig, NetworkMode
-from src.openagents.models.messages import DirectMessage, BroadcastMessage
+from src.openagents.models.messages import DirectMessage, BroadcastMessage, ModMessage
+from src.openagents.mods.communication.simple_messaging.adapter import SimpleMessagingAgentAdapter, BATCH_METADATA_KEY
 
 # Configure logging for tests
 logger = logging.getLogger(__name__)
@@ -316,4 +319,155 @@ class TestSimpleMessaging:
         assert stats["agent_count"] == 1
         assert stats["is_running"] is True
 
-        logger.info("Connector binding test completed successfully") 
\ No newline at end of file
+        logger.info("Connector binding test completed successfully") 
+
+
+class TestSimpleMessagingAdapter:
+    """Test cases for the simple messaging agent adapter."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create an adapter bound to a mock connector."""
+        adapter = SimpleMessagingAgentAdapter()
+        adapter.bind_agent("TestAgent1")
+        connector = MagicMock()
+        connector.send_broadcast_message = AsyncMock()
+        connector.send_direct_message = AsyncMock()
+        adapter.bind_connector(connector)
+        adapter.initialize()
+        yield adapter
+        adapter.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_send_broadcast_messages_uses_single_message(self, adapter):
+        """Test that a batch is sent as one broadcast message."""
+        await adapter.send_broadcast_messages([{"text": "first"}, {"text": "second"}])
+
+        adapter.connector.send_broadcast_message.assert_called_once()
+        sent = adapter.connector.send_broadcast_message.call_args[0][0]
+        assert sent.content == {"batch": [{"text": "first"}, {"text": "second"}]}
+
+    @pytest.mark.asyncio
+    async def test_incoming_batch_is_unpacked(self, adapter):
+        """Test that each batch item reaches handlers and the thread as its own message."""
+        received = []
+        adapter.register_message_handler("test", lambda content, sender_id: received.append(content))
+
+        batch = BroadcastMessage(
+            sender_id="TestAgent2",
+            content={"batch": [{"text": "first"}, {"text": "second"}]},
+            metadata={BATCH_METADATA_KEY: True}
+        )
+        await adapter.process_incoming_broadcast_message(batch)
+
+        assert received == [{"text": "first"}, {"text": "second"}]
+        messages = list(adapter.message_threads.values())[0].messages
+        assert [m.text_representation for m in messages] == ["first", "second"]
+        assert len({m.message_id for m in messages}) == 2
+
+    @pytest.mark.asyncio
+    async def test_send_text_messages_uses_single_message(self, adapter):
+        """Test that direct text messages to one agent are sent as one batch."""
+        await adapter.send_text_messages("TestAgent2", ["first", "second"])
+
+        adapter.connector.send_direct_message.assert_called_once()
+        sent = adapter.connector.send_direct_message.call_args[0][0]
+        assert sent.target_agent_id == "TestAgent2"
+        assert sent.content == {"batch": [{"text": "first"}, {"text": "second"}]}
+
+    @pytest.mark.asyncio
+    async def test_incoming_direct_batch_is_unpacked(self, adapter):
+        """Test that each item of a direct batch reaches handlers as its own message."""
+        received = []
+        adapter.register_message_handler("test", lambda content, sender_id: received.append(content))
+
+        batch = DirectMessage(
+            sender_id="TestAgent2",
+            target_agent_id="TestAgent1",
+            content={"batch": [{"text": "first"}, {"text": "second"}]},
+            metadata={BATCH_METADATA_KEY: True}
+        )
+        await adapter.process_incoming_direct_message(batch)
+
+        assert received == [{"text": "first"}, {"text": "second"}]
+        messages = list(adapter.message_threads.values())[0].messages
+        assert [m.text_representation for m in messages] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_batch_content_key_without_flag_is_delivered(self, adapter):
+        """Test that application content with a "batch" key isn't treated as a batch."""
+        received = []
+        adapter.register_message_handler("test", lambda content, sender_id: received.append(content))
+
+        message = BroadcastMessage(sender_id="TestAgent2", content={"text": "report", "batch": 7})
+        await adapter.process_incoming_broadcast_message(message)
+
+        assert received == [{"text": "report", "batch": 7}]
+
+    @pytest.mark.asyncio
+    async def test_malformed_flagged_batch_is_delivered(self, adapter):
+        """Test that a flagged batch that isn't a list of dicts falls back to normal delivery."""
+        received = []
+        adapter.register_message_handler("test", lambda content, sender_id: received.append(content))
+
+        message = DirectMessage(
+            sender_id="TestAgent2",
+            target_agent_id="TestAgent1",
+            content={"batch": "not a list"},
+            metadata={BATCH_METADATA_KEY: True}
+        )
+        await adapter.process_incoming_direct_message(message)
+
+        assert received == [{"batch": "not a list"}]
+
+    @pytest.mark.asyncio
+    async def test_file_download_response_saves_file(self, adapter):
+        """Test that a downloaded file is written to storage and passed to file handlers."""
+        received = []
+        adapter.register_file_handler(
+            "test", lambda file_id, content, metadata, sender_id: received.append((file_id, content))
+        )
+        adapter.pending_file_downloads["req-1"] = {"file_id": "file-1"}
+
+        response = ModMessage(
+            sender_id="network",
+            mod="openagents.mods.communication.simple_messaging",
+            content={
+                "action": "file_download_response",
+                "request_id": "req-1",
+                "success": True,
+                "file_id": "file-1",
+                "content": base64.b64encode(b"file bytes").decode()
+            },
+            relevant_agent_id="TestAgent1"
+        )
+        await adapter.process_incoming_mod_message(response)
+
+        assert (adapter.file_storage_path / "file-1").read_bytes() == b"file bytes"
+        assert received == [("file-1", b"file bytes")]
+        assert "req-1" not in adapter.pending_file_downloads
+
+    @pytest.mark.asyncio
+    async def test_send_file_attaches_content(self, adapter, tmp_path):
+        """Test that send_file attaches the file and reports missing files."""
+        file_path = tmp_path / "notes.txt"
+        file_path.write_bytes(b"file bytes")
+
+        empty_path = tmp_path / "empty.txt"
+        empty_path.write_bytes(b"")
+
+        assert await adapter.send_file("TestAgent2", file_path, "see attached") is True
+        assert await adapter.send_file("TestAgent2", tmp_path / "missing.txt") is False
+        assert await adapter.send_file("TestAgent2", empty_path) is True
+
+        assert adapter.connector.send_direct_message.call_count == 2
+        content = adapter.connector.send_direct_message.call_args_list[0][0][0].content
+        assert content["text"] == "see attached"
+        assert content["files"][0]["filename"] == "notes.txt"
+        assert base64.b64decode(content["files"][0]["content"]) == b"file bytes"
+        assert content["files"][0]["mime_type"] == "text/plain"
+        assert content["files"][0]["size"] == len(b"file bytes")
+
+        empty_file = adapter.connector.send_direct_message.call_args_list[1][0][0].content["files"][0]
+        assert empty_file["content"] == ""
+        assert empty_file["size"] == 0
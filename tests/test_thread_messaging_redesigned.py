@@ -33,7 +33,9 @@ from openagents.mods.communication.thread_messaging import (
     FileUploadMessage,
     FileOperationMessage,
     ChannelInfoMessage,
-    MessageRetrievalMessage
+    MessageRetrievalMessage,
+    ReactionMessage,
+    MAX_BATCH_MESSAGES
 )
 from openagents.models.messages import ModMessage
 
@@ -427,6 +429,151 @@ class TestThreadMessagingNetworkModRedesigned:
         # Channel messages are stored by network mod but distributed via direct agent connections
         # Network mod doesn't automatically forward channel messages
         self.mock_network.send_message.assert_not_called()
+
+    def test_history_trims_oldest_messages(self):
+        """Test that the history drops the oldest messages once it is full."""
+        self.mod.max_history_size = 250
+        messages = [
+            ChannelMessage(
+                sender_id="alice",
+                channel="general",
+                content={"text": f"Message {i}"},
+                mod="thread_messaging",
+                direction="inbound",
+                relevant_agent_id="alice"
+            )
+            for i in range(251)
+        ]
+        for message in messages:
+            self.mod._add_to_history(message)
+
+        assert list(self.mod.message_history) == [m.message_id for m in messages[200:]]
+
+    @pytest.mark.asyncio
+    async def test_channel_message_notifies_other_agents(self):
+        """Test that a channel message is fanned out to the other channel members."""
+        for agent_id in ("alice", "bob", "carol"):
+            self.mod.handle_register_agent(agent_id, {})
+
+        inner_message = ChannelMessage(
+            sender_id="alice",
+            channel="development",
+            content={"text": "Standup in 5"},
+            mod="thread_messaging",
+            direction="inbound",
+            relevant_agent_id="alice"
+        )
+        await self.mod.process_mod_message(wrap_message_for_mod(inner_message))
+
+        notifications = [call.args[0] for call in self.mock_network.send_message.call_args_list]
+        assert sorted(n.relevant_agent_id for n in notifications) == ["bob", "carol"]
+        for notification in notifications:
+            assert notification.content["action"] == "channel_message_notification"
+            assert notification.content["message"]["message_id"] == inner_message.message_id
+
+    @pytest.mark.asyncio
+    async def test_reaction_notification_survives_failed_recipient(self, caplog):
+        """Test that one failed reaction notification doesn't stop the others."""
+        for agent_id in ("alice", "bob", "carol", "dave"):
+            self.mod.handle_register_agent(agent_id, {})
+
+        inner_message = ChannelMessage(
+            sender_id="alice",
+            channel="development",
+            content={"text": "Standup in 5"},
+            mod="thread_messaging",
+            direction="inbound",
+            relevant_agent_id="alice"
+        )
+        await self.mod.process_mod_message(wrap_message_for_mod(inner_message))
+
+        async def send_message(message):
+            if message.relevant_agent_id == "bob":
+                raise ConnectionError("bob is unreachable")
+
+        self.mock_network.send_message = AsyncMock(side_effect=send_message)
+        reaction = ReactionMessage(
+            sender_id="carol",
+            target_message_id=inner_message.message_id,
+            reaction_type="like",
+            mod="thread_messaging",
+            direction="inbound",
+            relevant_agent_id="carol"
+        )
+        await self.mod.process_mod_message(wrap_message_for_mod(reaction))
+
+        notified = sorted(
+            call.args[0].relevant_agent_id
+            for call in self.mock_network.send_message.call_args_list
+            if call.args[0].content["action"] == "reaction_notification"
+        )
+        assert notified == ["alice", "bob", "dave"]
+        assert "Failed to send reaction notification to bob" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_channel_message_batch_handling(self):
+        """Test that each message in a batch is handled as its own channel message."""
+        self.mod.handle_register_agent("alice", {})
+        inner_messages = [
+            ChannelMessage(
+                sender_id="alice",
+                channel="development",
+                content={"text": text}
+            )
+            for text in ["first", "second"]
+        ]
+        
+        message = ModMessage(
+            sender_id="alice",
+            mod="thread_messaging",
+            content={"message_type": "message_batch", "messages": [m.model_dump() for m in inner_messages]},
+            direction="inbound",
+            relevant_agent_id="alice"
+        )
+        await self.mod.process_mod_message(message)
+        
+        for inner_message in inner_messages:
+            assert inner_message.message_id in self.mod.message_history
+        assert self.mod.channels["development"]["message_count"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_channel_message_batch_rejects_other_senders(self):
+        """Test that batch items claiming another sender are skipped."""
+        self.mod.handle_register_agent("alice", {})
+        own = ChannelMessage(sender_id="alice", channel="development", content={"text": "mine"})
+        forged = ChannelMessage(sender_id="bob", channel="development", content={"text": "not mine"})
+        
+        message = ModMessage(
+            sender_id="alice",
+            mod="thread_messaging",
+            content={"message_type": "message_batch", "messages": [own.model_dump(), forged.model_dump()]},
+            direction="inbound",
+            relevant_agent_id="alice"
+        )
+        await self.mod.process_mod_message(message)
+        
+        assert own.message_id in self.mod.message_history
+        assert forged.message_id not in self.mod.message_history
+        assert self.mod.channels["development"]["message_count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_channel_message_batch_rejects_oversized_batch(self):
+        """Test that a batch over the size limit is rejected as a whole."""
+        inner_messages = [
+            ChannelMessage(sender_id="alice", channel="development", content={"text": str(i)}).model_dump()
+            for i in range(MAX_BATCH_MESSAGES + 1)
+        ]
+        
+        message = ModMessage(
+            sender_id="alice",
+            mod="thread_messaging",
+            content={"message_type": "message_batch", "messages": inner_messages},
+            direction="inbound",
+            relevant_agent_id="alice"
+        )
+        await self.mod.process_mod_message(message)
+        
+        assert self.mod.channels["development"]["message_count"] == 0
     
     @pytest.mark.asyncio
     async def test_reply_message_threading(self):
@@ -592,7 +739,60 @@ class TestThreadMessagingNetworkModRedesigned:
         assert response.content["limit"] == 3
         assert len(response.content["messages"]) == 3
         assert response.content["has_more"] is True
-    
+
+    @pytest.mark.asyncio
+    async def test_channel_messages_cursor_pagination(self):
+        """Test paging through channel messages with next_cursor."""
+        for i in range(5):
+            inner_msg = ChannelMessage(
+                sender_id=f"user_{i}",
+                channel="development",
+                content={"text": f"Message {i}"},
+                timestamp=1000 + i,
+                mod="thread_messaging",
+                direction="inbound",
+                relevant_agent_id=f"user_{i}"
+            )
+            await self.mod.process_mod_message(wrap_message_for_mod(inner_msg))
+
+        pages = []
+        cursor = None
+        while True:
+            inner_retrieval_msg = MessageRetrievalMessage(
+                sender_id="alice",
+                action="retrieve_channel_messages",
+                channel="development",
+                limit=2,
+                cursor=cursor,
+                mod="thread_messaging",
+                direction="inbound",
+                relevant_agent_id="alice"
+            )
+            await self.mod.process_mod_message(wrap_message_for_mod(inner_retrieval_msg))
+            response = self.mock_network.send_message.call_args[0][0]
+            assert response.content["success"] is True
+            pages.append([msg["content"]["text"] for msg in response.content["messages"]])
+            cursor = response.content["next_cursor"]
+            assert response.content["has_more"] is (cursor is not None)
+            if cursor is None:
+                break
+
+        assert pages == [["Message 4", "Message 3"], ["Message 2", "Message 1"], ["Message 0"]]
+
+        # A malformed cursor is rejected
+        inner_retrieval_msg = MessageRetrievalMessage(
+            sender_id="alice",
+            action="retrieve_channel_messages",
+            channel="development",
+            cursor="not-a-cursor",
+            mod="thread_messaging",
+            direction="inbound",
+            relevant_agent_id="alice"
+        )
+        await self.mod.process_mod_message(wrap_message_for_mod(inner_retrieval_msg))
+        response = self.mock_network.send_message.call_args[0][0]
+        assert response.content["success"] is False
+
     @pytest.mark.asyncio
     async def test_direct_messages_retrieval(self):
         """Test retrieving direct messages between agents."""
@@ -762,6 +962,29 @@ class TestThreadMessagingAgentAdapterRedesigned:
         assert sent_message.content['mentioned_agent_id'] == "bob"
         assert sent_message.content['quoted_message_id'] == "feature_request_id"
     
+    @pytest.mark.asyncio
+    async def test_send_channel_messages(self):
+        """Test that channel messages are sent as one batch."""
+        await self.adapter.send_channel_messages("development", ["first", "second"])
+        
+        self.mock_connector.send_mod_message.assert_called_once()
+        sent_message = self.mock_connector.send_mod_message.call_args[0][0]
+        
+        assert sent_message.content['message_type'] == 'message_batch'
+        inner = sent_message.content['messages']
+        assert [m['content']['text'] for m in inner] == ["first", "second"]
+        assert all(m['channel'] == "development" for m in inner)
+    
+    @pytest.mark.asyncio
+    async def test_send_channel_messages_splits_long_lists(self):
+        """Test that lists over the batch limit are sent as several batches."""
+        texts = [str(i) for i in range(MAX_BATCH_MESSAGES + 1)]
+        await self.adapter.send_channel_messages("development", texts)
+        
+        sent = [call.args[0].content['messages'] for call in self.mock_connector.send_mod_message.call_args_list]
+        assert [len(batch) for batch in sent] == [MAX_BATCH_MESSAGES, 1]
+        assert [m['content']['text'] for batch in sent for m in batch] == texts
+    
     @pytest.mark.asyncio
     async def test_upload_file(self):
         """Test file upload."""
@@ -780,11 +1003,36 @@ class TestThreadMessagingAgentAdapterRedesigned:
             assert sent_message.content['message_type'] == 'file_upload'
             assert sent_message.content['filename'] == Path(temp_path).name
             assert sent_message.content['mime_type'] == "text/plain"
-            assert len(sent_message.content['file_content']) > 0  # Base64 encoded content
+            assert sent_message.content['file_content'] == base64.b64encode(b"Test file content for upload").decode()
+            assert sent_message.content['file_size'] == len("Test file content for upload")
             
         finally:
             Path(temp_path).unlink()
     
+    @pytest.mark.asyncio
+    async def test_upload_bytes(self):
+        """Test uploading in-memory content."""
+        payload = b'{"coverage": "85%"}'
+        await self.adapter.upload_bytes("test_plan.json", payload)
+        
+        self.mock_connector.send_mod_message.assert_called_once()
+        sent_message = self.mock_connector.send_mod_message.call_args[0][0]
+        
+        assert sent_message.content['message_type'] == 'file_upload'
+        assert sent_message.content['filename'] == "test_plan.json"
+        assert sent_message.content['mime_type'] == "application/json"
+        assert sent_message.content['file_content'] == base64.b64encode(payload).decode()
+        assert sent_message.content['file_size'] == len(payload)
+        assert self.adapter.pending_file_operations[sent_message.content['message_id']]["filename"] == "test_plan.json"
+    
+    @pytest.mark.asyncio
+    async def test_upload_missing_file(self):
+        """Test that uploading a missing file sends nothing."""
+        result = await self.adapter.upload_file("/nonexistent/file.txt")
+        
+        assert result is None
+        self.mock_connector.send_mod_message.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_reply_channel_message(self):
         """Test replying to channel messages."""
@@ -838,7 +1086,29 @@ class TestThreadMessagingAgentAdapterRedesigned:
         assert isinstance(sent_message, ModMessage)
         assert sent_message.content['message_type'] == 'channel_info'
         assert sent_message.content['action'] == "list_channels"
-    
+
+    @pytest.mark.asyncio
+    async def test_channels_list_response_notifies_handlers(self):
+        """Test that a channels list response reaches the message handlers."""
+        received = []
+        self.adapter.register_message_handler("test", lambda content, sender: received.append(content))
+
+        response = ModMessage(
+            sender_id="test_network",
+            mod="openagents.mods.communication.thread_messaging",
+            content={
+                "action": "list_channels_response",
+                "success": True,
+                "channels": [{"name": "general"}, {"name": "development"}]
+            },
+            direction="inbound",
+            relevant_agent_id="test_agent"
+        )
+        await self.adapter.process_incoming_mod_message(response)
+
+        assert self.adapter.available_channels == response.content["channels"]
+        assert received == [{"action": "channels_listed", "channels": response.content["channels"]}]
+
     @pytest.mark.asyncio
     async def test_retrieve_channel_messages(self):
         """Test retrieving channel messages."""
@@ -860,6 +1130,34 @@ class TestThreadMessagingAgentAdapterRedesigned:
         assert sent_message.content['offset'] == 5
         assert sent_message.content['include_threads'] is True
     
+    @pytest.mark.asyncio
+    async def test_retrieval_response_matches_request(self):
+        """Test that a retrieval response echoing the request's message ID reaches the handlers."""
+        received = []
+        self.adapter.register_message_handler("test", lambda content, sender: received.append(content))
+        
+        await self.adapter.retrieve_channel_messages(channel="development")
+        sent_message = self.mock_connector.send_mod_message.call_args[0][0]
+        
+        # The network answers with the ID of the inner retrieval message
+        response = ModMessage(
+            sender_id="test_network",
+            mod="openagents.mods.communication.thread_messaging",
+            content={
+                "action": "retrieve_channel_messages_response",
+                "success": True,
+                "channel": "development",
+                "messages": [],
+                "request_id": sent_message.content['message_id']
+            },
+            direction="inbound",
+            relevant_agent_id="test_agent"
+        )
+        await self.adapter.process_incoming_mod_message(response)
+        
+        assert [content["action"] for content in received] == ["channel_messages_retrieved"]
+        assert not self.adapter.pending_retrieval_requests
+    
     @pytest.mark.asyncio
     async def test_retrieve_direct_messages(self):
         """Test retrieving direct messages."""
@@ -16,6 +16,7 @@ from openagents.models.transport import (
     TransportType, ConnectionState, PeerMetadata, 
     ConnectionInfo, TransportMessage
 )
+from openagents.utils.message_util import parse_message_dict
 
 
 class TestTransportMessage:
@@ -37,6 +38,28 @@ class TestTransportMessage:
         assert message.message_id is not None
         assert message.timestamp > 0
 
+    def test_parse_mod_message_from_payload(self):
+        """Test that a received mod message takes its content and mod from the payload."""
+        message = TransportMessage(
+            sender_id="network",
+            target_id="agent1",
+            message_type="mod_message",
+            payload={
+                "content": {"action": "list_channels_response", "success": True},
+                "metadata": {"source": "test"},
+                "mod": "openagents.mods.communication.thread_messaging",
+                "direction": "outbound"
+            }
+        )
+        
+        parsed = parse_message_dict(message.model_dump())
+        
+        assert parsed.content == {"action": "list_channels_response", "success": True}
+        assert parsed.metadata == {"source": "test"}
+        assert parsed.mod == "openagents.mods.communication.thread_messaging"
+        assert parsed.direction == "outbound"
+        assert parsed.relevant_agent_id == "agent1"
+
 
 class TestPeerMetadata:
     """Test PeerMetadata model."""
@@ -107,6 +130,34 @@ class TestWebSocketTransport:
         assert result is True
         assert not transport.is_running
     
+    @pytest.mark.asyncio
+    async def test_listen_with_reuse_port(self):
+        """Test that the reuse_port option is passed through to the server."""
+        transport = WebSocketTransport({"reuse_port": True})
+        transport.websockets = MagicMock()
+        transport.websockets.serve = AsyncMock()
+
+        result = await transport.listen("127.0.0.1:8765")
+        assert result is True
+        assert transport.websockets.serve.call_args.kwargs["reuse_port"] is True
+
+    @pytest.mark.asyncio
+    async def test_listen_disables_compression_by_default(self):
+        """Test that per-message deflate is only enabled when configured."""
+        transport = WebSocketTransport()
+        transport.websockets = MagicMock()
+        transport.websockets.serve = AsyncMock()
+
+        await transport.listen("127.0.0.1:8765")
+        assert transport.websockets.serve.call_args.kwargs["compression"] is None
+
+        transport = WebSocketTransport({"compression": "deflate"})
+        transport.websockets = MagicMock()
+        transport.websockets.serve = AsyncMock()
+
+        await transport.listen("127.0.0.1:8765")
+        assert transport.websockets.serve.call_args.kwargs["compression"] == "deflate"
+
     @pytest.mark.asyncio
     async def test_send_message(self, transport):
         """Test sending a message."""
@@ -142,7 +193,53 @@ class TestWebSocketTransport:
         
         result = await transport.send(message)
         assert result is False
-    
+
+    @pytest.mark.asyncio
+    async def test_broadcast_continues_past_failed_peer(self, transport):
+        """Test that a failing peer doesn't block broadcast delivery to the others."""
+        transport.is_running = True
+
+        sender = AsyncMock()
+        failing = AsyncMock()
+        failing.send.side_effect = ConnectionError("closed")
+        healthy = AsyncMock()
+        transport.client_connections.update({
+            "agent1": sender, "agent2": failing, "agent3": healthy
+        })
+
+        message = Message(
+            sender_id="agent1",
+            message_type="broadcast",
+            payload={"content": "Hello all!"}
+        )
+
+        result = await transport.send(message)
+        assert result is False
+        sender.send.assert_not_called()
+        failing.send.assert_called_once()
+        healthy.send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_frame_once(self, transport):
+        """Test that every peer receives the same pre-encoded text frame."""
+        transport.is_running = True
+
+        peers = {f"agent{i}": AsyncMock() for i in range(2, 5)}
+        transport.client_connections.update(peers)
+
+        message = Message(
+            sender_id="agent1",
+            message_type="broadcast",
+            payload={"content": "Hello all!"}
+        )
+
+        result = await transport.send(message)
+        assert result is True
+        frames = [peer.send.call_args for peer in peers.values()]
+        assert all(frame.kwargs == {"text": True} for frame in frames)
+        assert isinstance(frames[0].args[0], bytes)
+        assert all(frame.args[0] is frames[0].args[0] for frame in frames)
+
     def test_register_message_handler(self, transport):
         """Test registering a message handler."""
         handler = AsyncMock()